@@ -3,6 +3,11 @@ from sqlalchemy.orm import Session
 from database import get_db
 import models, schemas
 from typing import List
+from dtos import adapters
+from utils.fast_json import FAST_RESPONSES, fast_list_response
+from repositories.implementations.learning_path_repository import LearningPathRepository
+from repositories.unit_of_work import UnitOfWork
+from services.implementations.learning_path_service import LearningPathService
 
 router = APIRouter()
 
@@ -20,8 +25,12 @@ def mark_attendance(attendance: schemas.AttendanceCreate, user_id: int, db: Sess
         return existing
     
     db_attendance = models.Attendance(**attendance.dict(), user_id=user_id)
-    db.add(db_attendance)
-    db.commit()
+    uow = UnitOfWork(db)
+    # The attendance and the progress of matching learning paths (one day forward) commit together
+    with uow:
+        db.add(db_attendance)
+        if attendance.course_id is not None and attendance.status.strip().lower() != "absent":
+            LearningPathService(LearningPathRepository(db), uow).record_progress(user_id, attendance.course_id)
     db.refresh(db_attendance)
     return db_attendance
 
@@ -67,4 +76,7 @@ def get_user_streak(user_id: int, db: Session = Depends(get_db)):
 
 @router.get("/{user_id}", response_model=List[schemas.AttendanceResponse])
 def get_user_attendance(user_id: int, db: Session = Depends(get_db)):
-    return db.query(models.Attendance).filter(models.Attendance.user_id == user_id).all()
+    records = db.query(models.Attendance).filter(models.Attendance.user_id == user_id).all()
+    if FAST_RESPONSES:
+        return fast_list_response(adapters.ATTENDANCE_ROWS, records)
+    return records
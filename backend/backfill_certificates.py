@@ -0,0 +1,62 @@
+import argparse
+import os
+import sys
+
+from database import SessionLocal
+from services import certificate_backfill
+from services.cpu_executor import CPU_WORKERS, CpuExecutor
+
+# Render certificate PDFs into the certificate store (see services/certificate_backfill.py):
+#   python backfill_certificates.py                 render PDFs for certificates that have none
+#   python backfill_certificates.py --force         re-render every certificate (template change)
+#   python backfill_certificates.py --dry-run       only count what would be rendered
+#   python backfill_certificates.py --resume        continue an interrupted run from its checkpoint
+#   python backfill_certificates.py --workers 8 --batch-size 1000
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render missing (or all) certificate PDFs")
+    parser.add_argument("--force", action="store_true", help="re-render PDFs that are already stored")
+    parser.add_argument("--dry-run", action="store_true", help="report what would be rendered, render nothing")
+    parser.add_argument("--resume", action="store_true", help="continue from the checkpoint file")
+    parser.add_argument("--from-id", type=int, default=0, help="start after this certificate id")
+    parser.add_argument("--workers", type=int, default=CPU_WORKERS or os.cpu_count() or 1,
+                        help="render processes (0 renders in this process)")
+    parser.add_argument("--batch-size", type=int, default=certificate_backfill.BACKFILL_BATCH_SIZE)
+    parser.add_argument("--chunk-size", type=int, default=certificate_backfill.BACKFILL_CHUNK_SIZE,
+                        help="certificates per pool task")
+    parser.add_argument("--checkpoint", default=certificate_backfill.BACKFILL_CHECKPOINT, help="checkpoint file")
+    args = parser.parse_args(argv)
+
+    checkpoint = certificate_backfill.load_checkpoint(args.checkpoint) if args.resume else None
+    if args.resume and checkpoint is None:
+        print(f"No checkpoint at {args.checkpoint}, starting from the beginning")
+    if checkpoint is not None:
+        if checkpoint["done"]:
+            print(f"Checkpoint {args.checkpoint} is from a finished run; nothing to resume")
+            return 0
+        print(f"Resuming after certificate id {checkpoint['last_id']} "
+              f"({checkpoint['rendered']} rendered so far, force={checkpoint['force']})")
+    else:
+        db = SessionLocal()
+        try:
+            checkpoint = certificate_backfill.new_checkpoint(db, from_id=args.from_id, force=args.force)
+        finally:
+            db.close()
+
+    executor = CpuExecutor(workers=0 if args.dry_run else args.workers)
+    executor.start()
+    try:
+        checkpoint = certificate_backfill.run_backfill(
+            checkpoint, executor, batch_size=args.batch_size, chunk_size=args.chunk_size,
+            checkpoint_path=args.checkpoint, dry_run=args.dry_run
+        )
+    except KeyboardInterrupt:
+        if not args.dry_run:
+            print(f"\nInterrupted; continue with --resume (checkpoint: {args.checkpoint})")
+        return 130
+    finally:
+        executor.shutdown()
+    return 1 if checkpoint["failed"] else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
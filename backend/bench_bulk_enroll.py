@@ -0,0 +1,48 @@
+import os
+import sys
+import tempfile
+import time
+
+# Runs against a throwaway database; must be set before the app is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+from fastapi.testclient import TestClient
+
+from database import Base, engine
+import main
+
+# Cohort enrollment timing: one POST /courses/{id}/enroll:bulk for N users,
+# sent as a JSON list of ids, a CSV of emails, and a repeat (all already enrolled).
+# Usage: python bench_bulk_enroll.py [users]
+USERS = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    raw = engine.raw_connection()
+    cur = raw.cursor()
+    cur.executemany("INSERT INTO users (id, email, password) VALUES (?, ?, 'x')",
+                    ((i, f"user{i}@cohort.local") for i in range(1, USERS + 1)))
+    cur.executemany("INSERT INTO courses (id, title, description) VALUES (?, ?, 'bench')",
+                    ((i, f"Course {i}") for i in (1, 2)))
+    raw.commit()
+    raw.close()
+
+def timed(client, label, path, **kwargs):
+    start = time.perf_counter()
+    response = client.post(path, **kwargs)
+    elapsed = (time.perf_counter() - start) * 1000
+    body = response.json()
+    print(f"[{label}] {elapsed:7.1f} ms  status {response.status_code}  "
+          f"enrolled {body['enrolled']}  already {body['already_enrolled']}  not found {len(body['not_found'])}")
+    return elapsed
+
+if __name__ == "__main__":
+    seed()
+    client = TestClient(main.app)
+    ids = list(range(1, USERS + 1)) + [USERS + 1, USERS + 2]  # two unknown ids
+    csv_body = "email\n" + "\n".join(f"user{i}@cohort.local" for i in range(1, USERS + 1)) + "\n"
+
+    print(f"{USERS:,} users per call")
+    timed(client, "json ids     ", "/courses/1/enroll:bulk", json=ids)
+    timed(client, "repeat       ", "/courses/1/enroll:bulk", json=ids)
+    timed(client, "csv emails   ", "/courses/2/enroll:bulk", content=csv_body, headers={"content-type": "text/csv"})
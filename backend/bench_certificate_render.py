@@ -0,0 +1,28 @@
+import sys
+import time
+
+from utils.pdf_generator import generate_certificate_pdf, generate_certificate_pdf_canvas
+
+# Certificates per second on one core: reportlab canvas per certificate vs the precompiled template.
+# Usage: python bench_certificate_render.py [certificates]
+CERTIFICATES = int(sys.argv[1]) if len(sys.argv) > 1 else 2000
+TARGET_SPEEDUP = 5
+
+def run(label, render):
+    render("Warm Up", "Course", "2026-01-01", "LMS-WARMUP")
+    sizes = 0
+    start = time.perf_counter()
+    for i in range(CERTIFICATES):
+        sizes += len(render(f"Student {i}", "Python Mastery", "2026-01-01 10:00:00", f"LMS-{i:08X}").getvalue())
+    elapsed = time.perf_counter() - start
+    rate = CERTIFICATES / elapsed
+    print(f"[{label}] {rate:,.0f} certificates/s  {elapsed / CERTIFICATES * 1e6:,.0f} us each  {sizes / CERTIFICATES:,.0f} bytes avg")
+    return rate
+
+if __name__ == "__main__":
+    before = run("canvas", generate_certificate_pdf_canvas)
+    after = run("template", generate_certificate_pdf)
+    speedup = after / before
+    print(f"speedup: {speedup:.1f}x (target {TARGET_SPEEDUP}x)")
+    if speedup < TARGET_SPEEDUP:
+        sys.exit(1)
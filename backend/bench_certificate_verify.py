@@ -0,0 +1,108 @@
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import tracemalloc
+
+# Runs against a throwaway database; must be set before the app is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ["CERTIFICATE_STORE_DIR"] = tempfile.mkdtemp()
+
+import httpx
+from sqlalchemy import event
+
+from database import Base, engine
+from services.certificate_index import CertificateIndex, certificate_index
+import main
+
+# Load test for GET /certificates/verify/{code}: index load time and memory, in-process
+# lookup cost, then concurrent HTTP clients sending a mix of real and bogus codes while
+# counting the SQL statements the bogus ones cause.
+# Usage: python bench_certificate_verify.py [certificates] [seconds] [clients] [bogus_ratio]
+CERTIFICATES = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+DURATION = float(sys.argv[2]) if len(sys.argv) > 2 else 5
+CLIENTS = int(sys.argv[3]) if len(sys.argv) > 3 else 32
+BOGUS_RATIO = float(sys.argv[4]) if len(sys.argv) > 4 else 0.5
+USERS = 20_000
+COURSES = 50
+
+def code(i):
+    return f"LMS-{i:08X}"
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    raw = engine.raw_connection()
+    cur = raw.cursor()
+    cur.executemany("INSERT INTO users (id, fullname, email, password) VALUES (?, ?, ?, 'x')",
+                    ((i, f"User {i}", f"user{i}@verify.local") for i in range(1, USERS + 1)))
+    cur.executemany("INSERT INTO courses (id, title, description) VALUES (?, ?, 'bench')",
+                    ((i, f"Course {i}") for i in range(1, COURSES + 1)))
+    cur.executemany("INSERT INTO certificates (id, user_id, course_id, certificate_code) VALUES (?, ?, ?, ?)",
+                    ((i, (i - 1) // COURSES % USERS + 1, (i - 1) % COURSES + 1, code(i))
+                     for i in range(1, CERTIFICATES + 1)))
+    raw.commit()
+    raw.close()
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+async def load_test(statements):
+    latencies = []
+    found = missing = 0
+    stop = time.perf_counter() + DURATION
+    rng = random.Random(7)
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://bench") as client:
+        async def worker():
+            nonlocal found, missing
+            while time.perf_counter() < stop:
+                if rng.random() < BOGUS_RATIO:
+                    path = f"/certificates/verify/LMS-BOGUS{rng.randrange(10**9):09d}"
+                else:
+                    path = f"/certificates/verify/{code(rng.randrange(1, CERTIFICATES + 1))}"
+                start = time.perf_counter()
+                response = await client.get(path)
+                latencies.append((time.perf_counter() - start) * 1000)
+                if response.status_code == 200:
+                    found += 1
+                else:
+                    assert response.status_code == 404, response.text
+                    missing += 1
+
+        statements.clear()
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(CLIENTS)))
+        elapsed = time.perf_counter() - started
+
+    print(f"HTTP ({CLIENTS} clients, {BOGUS_RATIO:.0%} bogus): {len(latencies) / elapsed:,.0f} req/s  "
+          f"p50 {statistics.median(latencies):.2f} ms  p99 {percentile(latencies, 0.99):.2f} ms")
+    print(f"  found {found:,}  not found {missing:,}  SQL statements: {len(statements)} "
+          f"(at most one catch-up per {certificate_index.sync_seconds:g}s)")
+
+if __name__ == "__main__":
+    seed()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+
+    start = time.perf_counter()
+    certificate_index.sync()
+    load_s = time.perf_counter() - start
+    # Memory of a second, throwaway index (tracing would distort the timing above)
+    tracemalloc.start()
+    probe = CertificateIndex()
+    probe.sync()
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    print(f"Index: {CERTIFICATES:,} codes loaded in {load_s:.2f}s, ~{memory / 2**20:.0f} MiB")
+
+    codes = [code(random.randrange(1, CERTIFICATES + 1)) for _ in range(100_000)]
+    start = time.perf_counter()
+    for c in codes:
+        certificate_index.lookup(c)
+    print(f"Lookup (in process): {(time.perf_counter() - start) / len(codes) * 1e6:.2f} us per hit")
+
+    asyncio.run(load_test(statements))
@@ -0,0 +1,85 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Runs against a throwaway database; must be set before the app is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from database import Base, SessionLocal, engine
+import main
+import models
+
+# Latency of opening a course page: the four calls the course player makes today
+# versus the single /courses/{id}/view aggregate.
+# Usage: python bench_course_view.py [iterations] [lessons]
+ITERATIONS = int(sys.argv[1]) if len(sys.argv) > 1 else 500
+LESSONS = int(sys.argv[2]) if len(sys.argv) > 2 else 40
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    db = SessionLocal()
+    user = models.User(email="bench@view.local", password="x")
+    course = models.Course(title="Bench Course", description="bench")
+    db.add_all([user, course])
+    db.flush()
+    lessons = [models.Lesson(course_id=course.id, title=f"Lesson {i}") for i in range(LESSONS)]
+    db.add_all(lessons)
+    db.flush()
+    db.add(models.Enrollment(user_id=user.id, course_id=course.id))
+    db.add_all([
+        models.Attendance(user_id=user.id, course_id=course.id, lesson_id=lesson.id, status="present")
+        for lesson in lessons[: LESSONS // 2]
+    ])
+    db.add(models.Certificate(user_id=user.id, course_id=course.id, certificate_code="LMS-BENCH001"))
+    db.commit()
+    ids = user.id, course.id
+    db.close()
+    return ids
+
+def measure(client, paths, statements):
+    for path in paths:  # warm up (fills the catalog cache like a real server would have)
+        client.get(path)
+    samples = []
+    statements.clear()
+    for _ in range(ITERATIONS):
+        start = time.perf_counter()
+        for path in paths:
+            assert client.get(path).status_code == 200, path
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    return {
+        "requests": len(paths),
+        "sql": len(statements) / ITERATIONS,
+        "mean": statistics.fmean(samples),
+        "p50": samples[len(samples) // 2],
+        "p95": samples[int(len(samples) * 0.95)],
+    }
+
+if __name__ == "__main__":
+    user_id, course_id = seed()
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+
+    client = TestClient(main.app)
+    sequences = {
+        "four calls": [
+            f"/courses/{course_id}",
+            f"/courses/{course_id}/lessons",
+            f"/courses/{course_id}/status/{user_id}",
+            f"/certificates/{course_id}/{user_id}",
+        ],
+        "view": [f"/courses/{course_id}/view?user_id={user_id}"],
+    }
+
+    print(f"{ITERATIONS} iterations, {LESSONS} lessons per course")
+    results = {}
+    for name, paths in sequences.items():
+        results[name] = r = measure(client, paths, statements)
+        print(f"[{name}] requests: {r['requests']}  sql/page: {r['sql']:.1f}  "
+              f"mean: {r['mean']:.2f} ms  p50: {r['p50']:.2f} ms  p95: {r['p95']:.2f} ms")
+    print(f"p50 speedup: {results['four calls']['p50'] / results['view']['p50']:.2f}x")
@@ -0,0 +1,69 @@
+import asyncio
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+# Latency of GET / while learning path PDFs are generated concurrently, with CPU work in
+# the threadpool (CPU_WORKERS=0) and in the process pool. Each mode runs in its own process.
+# Usage: python bench_cpu_offload.py [seconds] [concurrent_pdfs] [days]
+DURATION = float(sys.argv[1]) if len(sys.argv) > 1 else 10
+CONCURRENT_PDFS = int(sys.argv[2]) if len(sys.argv) > 2 else 4
+DAYS = int(sys.argv[3]) if len(sys.argv) > 3 else 365
+PING_INTERVAL = 0.01
+
+def percentile(samples, q):
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+async def measure():
+    import httpx
+    import main
+    from services.cpu_executor import cpu_executor
+
+    cpu_executor.start()
+    stop = time.perf_counter() + DURATION
+    latencies = []
+    pdfs = []
+
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=main.app), base_url="http://bench") as client:
+        async def ping():
+            # Latency is measured from when each ping was due, so time spent stuck behind
+            # a blocked event loop counts instead of silently delaying the next ping
+            due = time.perf_counter()
+            while due < stop:
+                await asyncio.sleep(max(0.0, due - time.perf_counter()))
+                await client.get("/")
+                latencies.append((time.perf_counter() - due) * 1000)
+                due += PING_INTERVAL
+
+        async def generate():
+            body = {"course_name": "python", "days": DAYS, "hours_per_day": 2}
+            while time.perf_counter() < stop:
+                response = await client.post("/learning-path/download", json=body)
+                assert response.status_code == 200, response.text
+                pdfs.append(len(response.content))
+
+        await asyncio.gather(ping(), *(generate() for _ in range(CONCURRENT_PDFS)))
+    cpu_executor.shutdown()
+
+    print(f"  GET /  p50 {statistics.median(latencies):.2f} ms  p99 {percentile(latencies, 0.99):.2f} ms  "
+          f"max {max(latencies):.2f} ms  ({len(latencies)} requests)")
+    print(f"  PDFs   {len(pdfs) / DURATION:.1f}/s ({len(pdfs)} x {DAYS} days)")
+
+def run_mode(label, workers):
+    print(f"[{label}]")
+    env = dict(os.environ, CPU_WORKERS=str(workers),
+               DATABASE_URL=f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}")
+    subprocess.run([sys.executable, __file__, str(DURATION), str(CONCURRENT_PDFS), str(DAYS), "--measure"],
+                   env=env, check=True)
+
+if __name__ == "__main__":
+    if "--measure" in sys.argv:
+        asyncio.run(measure())
+    else:
+        print(f"{CONCURRENT_PDFS} concurrent {DAYS}-day PDFs for {DURATION}s, {os.cpu_count()} CPUs")
+        run_mode("threadpool (CPU_WORKERS=0)", 0)
+        run_mode("process pool", os.getenv("CPU_WORKERS", str(min(4, os.cpu_count() or 1))))
@@ -0,0 +1,102 @@
+import os
+import sys
+import tempfile
+import threading
+import time
+
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, build_engine
+from repositories.implementations.course_repository import enrollment_upsert
+import models
+
+# Mixed read/write benchmark: writer threads insert enrollments/attendance while
+# reader threads run the same lookups the repositories do. Enrollments go through the same
+# upsert as enroll_course, so repeated (user, course) pairs are writes, not unique-index
+# errors; any error fails the run.
+# Usage: python bench_db_profile.py [seconds] [readers] [writers]
+DURATION = float(sys.argv[1]) if len(sys.argv) > 1 else 5
+READERS = int(sys.argv[2]) if len(sys.argv) > 2 else 8
+WRITERS = int(sys.argv[3]) if len(sys.argv) > 3 else 4
+
+def run(profile):
+    tmp_dir = tempfile.mkdtemp()
+    url = f"sqlite:///{os.path.join(tmp_dir, 'bench.db')}"
+    engine = build_engine(url, profile)
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = Session()
+    db.add_all([models.User(email=f"u{i}@bench.local", password="x") for i in range(100)])
+    db.add_all([models.Course(title=f"Course {i}", description="bench") for i in range(20)])
+    db.commit()
+    db.close()
+
+    counts = {"reads": 0, "writes": 0, "errors": 0}
+    lock = threading.Lock()
+    stop = time.perf_counter() + DURATION
+
+    def reader(n):
+        db = Session()
+        ops = 0
+        errors = 0
+        while time.perf_counter() < stop:
+            try:
+                uid = (ops + n) % 100 + 1
+                db.query(models.Enrollment).filter(
+                    models.Enrollment.user_id == uid,
+                    models.Enrollment.course_id == ops % 20 + 1
+                ).first()
+                db.query(models.Attendance).filter(models.Attendance.user_id == uid).count()
+                db.rollback()
+                ops += 1
+            except Exception:
+                db.rollback()
+                errors += 1
+        db.close()
+        with lock:
+            counts["reads"] += ops
+            counts["errors"] += errors
+
+    def writer(n):
+        db = Session()
+        ops = 0
+        errors = 0
+        while time.perf_counter() < stop:
+            try:
+                uid = (ops * 7 + n) % 100 + 1
+                db.execute(enrollment_upsert(uid, ops % 20 + 1))
+                db.add(models.Attendance(user_id=uid, course_id=ops % 20 + 1, status="present"))
+                db.commit()
+                ops += 1
+            except Exception:
+                db.rollback()
+                errors += 1
+        db.close()
+        with lock:
+            counts["writes"] += ops
+            counts["errors"] += errors
+
+    threads = [threading.Thread(target=reader, args=(i,)) for i in range(READERS)]
+    threads += [threading.Thread(target=writer, args=(i,)) for i in range(WRITERS)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    engine.dispose()
+
+    print(f"[{profile}] reads/s: {counts['reads'] / DURATION:,.0f}  "
+          f"writes/s: {counts['writes'] / DURATION:,.0f}  "
+          f"errors: {counts['errors']}")
+    return counts
+
+if __name__ == "__main__":
+    print(f"Mixed workload: {READERS} readers, {WRITERS} writers, {DURATION}s per profile")
+    before = run("default")
+    after = run("production")
+    for key in ("reads", "writes"):
+        if before[key]:
+            print(f"{key}: {after[key] / before[key]:.2f}x")
+    if before["errors"] or after["errors"]:
+        sys.exit(f"Benchmark had errors (default: {before['errors']}, production: {after['errors']}); "
+                 "the numbers above are not comparable")
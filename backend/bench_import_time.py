@@ -0,0 +1,54 @@
+import os
+import statistics
+import subprocess
+import sys
+
+# Import-time benchmark for the API module, parsed from `python -X importtime`.
+# Usage: python bench_import_time.py [runs]
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+IMPORT_TIME_BUDGET_MS = float(os.getenv("IMPORT_TIME_BUDGET_MS", "1500"))
+
+# Heavy or side-effectful modules that must only load when first used
+LAZY_MODULES = ("reportlab", "passlib", "uvicorn", "utils.pdf_generator")
+
+def measure_import(module="main", env=None):
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    timings = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line[len("import time:"):].split("|")
+        if cumulative.strip().isdigit():
+            timings[name.strip()] = int(cumulative) / 1000
+    return timings
+
+def loaded_modules(module="main", env=None):
+    result = subprocess.run(
+        [sys.executable, "-c", f"import sys, {module}; print('\\n'.join(sys.modules))"],
+        cwd=BASE_DIR, env=env, capture_output=True, text=True
+    )
+    if result.returncode != 0:
+        raise RuntimeError(result.stderr)
+    return set(result.stdout.split())
+
+if __name__ == "__main__":
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 5
+    samples = [measure_import() for _ in range(runs)]
+    totals = [sample["main"] for sample in samples]
+    median = statistics.median(totals)
+
+    print(f"import main: median {median:.1f} ms over {runs} runs (budget {IMPORT_TIME_BUDGET_MS:.0f} ms)")
+    print("Slowest top-level imports (last run):")
+    top_level = {name: ms for name, ms in samples[-1].items() if "." not in name and name != "main"}
+    for name, ms in sorted(top_level.items(), key=lambda item: item[1], reverse=True)[:10]:
+        print(f"  {ms:8.1f} ms  {name}")
+
+    lazy = sorted(m for m in loaded_modules() if m.startswith(LAZY_MODULES))
+    if lazy:
+        print(f"Loaded at import but should be lazy: {', '.join(lazy)}")
+    sys.exit(0 if median <= IMPORT_TIME_BUDGET_MS and not lazy else 1)
@@ -0,0 +1,71 @@
+import datetime
+import json
+import sys
+import time
+import tracemalloc
+
+from dtos import adapters
+from utils import fast_json
+import models
+
+# Serialization micro-benchmark for 10k-row list responses.
+# Compares the default response_model path with the FAST_RESPONSES path.
+# Usage: python bench_serialization.py [rows] [repeats]
+ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 10_000
+REPEATS = int(sys.argv[2]) if len(sys.argv) > 2 else 5
+
+def make_rows():
+    now = datetime.datetime(2026, 1, 1, 9, 30)
+    course = models.Course(id=1, title="Python Programming")
+    return {
+        "users": (adapters.USER_LIST, adapters.USER_ROWS, [
+            models.User(id=i, fullname=f"User {i}", email=f"user{i}@example.com", created_at=now)
+            for i in range(ROWS)
+        ]),
+        "attendance": (adapters.ATTENDANCE_LIST, adapters.ATTENDANCE_ROWS, [
+            models.Attendance(id=i, user_id=1, course_id=1, lesson_id=i, status="present", date=now)
+            for i in range(ROWS)
+        ]),
+        "certificates": (adapters.CERTIFICATE_LIST, adapters.CERTIFICATE_ROWS, [
+            models.Certificate(id=i, user_id=1, course_id=1, certificate_code=f"LMS-{i:08X}", issued_date=now, course=course)
+            for i in range(ROWS)
+        ]),
+    }
+
+def response_model_path(adapter, rows):
+    # What FastAPI does for response_model: validate from attributes, dump to JSON-able python, json.dumps
+    return json.dumps(adapter.dump_python(adapter.validate_python(rows, from_attributes=True), mode="json")).encode()
+
+def adapter_dump_json(adapter, rows):
+    return adapter.dump_json(adapter.validate_python(rows, from_attributes=True))
+
+def fast_path(encoder, rows):
+    return fast_json.dumps(encoder.encode_many(rows))
+
+def measure(fn, *args):
+    fn(*args)  # warm up
+    start = time.perf_counter()
+    for _ in range(REPEATS):
+        body = fn(*args)
+    elapsed = (time.perf_counter() - start) / REPEATS * 1000
+
+    tracemalloc.start()
+    fn(*args)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return elapsed, peak, body
+
+if __name__ == "__main__":
+    print(f"{ROWS:,} rows, {REPEATS} repeats, orjson {'available' if fast_json.orjson else 'missing (stdlib fallback)'}")
+    for name, (adapter, encoder, rows) in make_rows().items():
+        print(f"\n== {name}")
+        results = {
+            "response_model (default)": measure(response_model_path, adapter, rows),
+            "TypeAdapter.dump_json": measure(adapter_dump_json, adapter, rows),
+            "FAST_RESPONSES (RowEncoder + orjson)": measure(fast_path, encoder, rows),
+        }
+        baseline = results["response_model (default)"]
+        for label, (ms, peak, body) in results.items():
+            same = json.loads(body) == json.loads(baseline[2])
+            print(f"  {label:38s} {ms:8.1f} ms  peak {peak / 1024 / 1024:6.1f} MiB  "
+                  f"{baseline[0] / ms:5.1f}x  {'same output' if same else 'OUTPUT DIFFERS'}")
@@ -0,0 +1,60 @@
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+# Runs against a throwaway database; must be set before the app is imported
+os.environ["DATABASE_URL"] = f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'bench.db')}"
+os.environ["CERTIFICATE_STORE_DIR"] = tempfile.mkdtemp()
+
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+
+from database import DB_PROFILE, Base, engine
+import main
+
+# Commits and latency per write request. Each complete_course call finishes a
+# fresh enrollment, so every request marks completion, logs attendance and issues a certificate.
+# Usage: python bench_unit_of_work.py [requests]
+REQUESTS = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+
+def seed():
+    Base.metadata.create_all(bind=engine)
+    raw = engine.raw_connection()
+    cur = raw.cursor()
+    cur.executemany("INSERT INTO users (id, fullname, email, password) VALUES (?, ?, ?, 'x')",
+                    ((i, f"User {i}", f"user{i}@uow.local") for i in range(1, REQUESTS + 2)))
+    cur.execute("INSERT INTO courses (id, title, description) VALUES (1, 'Bench', 'bench')")
+    cur.executemany("INSERT INTO enrollments (user_id, course_id, is_completed) VALUES (?, 1, 0)",
+                    ((i,) for i in range(1, REQUESTS + 2)))
+    raw.commit()
+    raw.close()
+
+def measure(label, requests):
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+    requests[0]()  # warm up (imports reportlab, fills pools)
+    commits.clear()
+    samples = []
+    for send in requests[1:]:
+        start = time.perf_counter()
+        send()
+        samples.append((time.perf_counter() - start) * 1000)
+    samples.sort()
+    count = len(samples)
+    print(f"[{label}] commits/request: {len(commits) / count:.2f}  "
+          f"p50: {statistics.median(samples):.2f} ms  p99: {samples[min(count - 1, int(count * 0.99))]:.2f} ms")
+
+def call(client, path, payload):
+    def send():
+        response = client.post(path, json=payload)
+        assert response.status_code == 200, response.text
+    return send
+
+if __name__ == "__main__":
+    seed()
+    client = TestClient(main.app)
+    print(f"{REQUESTS} requests per endpoint, DB_PROFILE={DB_PROFILE}")
+    measure("complete_course", [call(client, "/courses/1/complete", {"user_id": i}) for i in range(1, REQUESTS + 2)])
+    measure("add_lesson     ", [call(client, "/courses/1/lessons", {"title": f"L{i}"}) for i in range(REQUESTS + 1)])
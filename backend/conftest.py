@@ -0,0 +1,28 @@
+import os
+import tempfile
+
+# Shared setup for the test_*.py scripts. pytest loads this file first; scripts run on their
+# own (python test_x.py) import it before any service module. Rendered certificates go to a
+# scratch directory instead of the real store, and the shared CPU pool runs tasks inline
+# (tests of the pool itself build their own CpuExecutor).
+os.environ.setdefault("CERTIFICATE_STORE_DIR", tempfile.mkdtemp())
+os.environ.setdefault("CPU_WORKERS", "0")
+
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, build_engine
+import models
+
+def scratch_database(name: str):
+    # (engine, Session) for a new SQLite file with the full schema and one user, Ada (id 1)
+    engine = build_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), f'{name}.db')}", "default")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+    seed(Session, models.User(id=1, fullname="Ada", email=f"ada@{name}.local", password="x"))
+    return engine, Session
+
+def seed(Session, *rows):
+    db = Session()
+    db.add_all(rows)
+    db.commit()
+    db.close()
@@ -1,16 +1,22 @@
 from fastapi import APIRouter, Depends
 from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.unit_of_work import UnitOfWork, AsyncUnitOfWork
+from database import get_db, get_async_db
 from dtos import schemas
 from repositories.implementations.user_repository import UserRepository
+from repositories.implementations.async_user_repository import AsyncUserRepository
 from services.implementations.user_service import UserService
+from services.implementations.async_user_service import AsyncUserService
+from dtos import adapters
+from utils.fast_json import FAST_RESPONSES, fast_list_response
 from typing import List
 
 router = APIRouter()
 
 def get_user_service(db: Session = Depends(get_db)) -> UserService:
     repo = UserRepository(db)
-    return UserService(repo)
+    return UserService(repo, UnitOfWork(db))
 
 @router.post("/register", response_model=schemas.UserResponse)
 def register(user: schemas.UserCreate, service: UserService = Depends(get_user_service)):
@@ -22,8 +28,37 @@ def login(user: schemas.UserLogin, service: UserService = Depends(get_user_servi
 
 @router.get("/users", response_model=List[schemas.UserResponse])
 def get_users(service: UserService = Depends(get_user_service)):
-    return service.get_all_users()
+    users = service.get_all_users()
+    if FAST_RESPONSES:
+        return fast_list_response(adapters.USER_ROWS, users)
+    return users
 
 @router.put("/profile/{user_id}", response_model=schemas.UserResponse)
 def update_profile(user_id: int, profile_data: schemas.UserProfileUpdate, service: UserService = Depends(get_user_service)):
     return service.update_profile(user_id, profile_data)
+
+# --- Async handlers (enabled with ASYNC_ROUTERS=auth) ---
+async_router = APIRouter()
+
+def get_async_user_service(db: AsyncSession = Depends(get_async_db)) -> AsyncUserService:
+    repo = AsyncUserRepository(db)
+    return AsyncUserService(repo, AsyncUnitOfWork(db))
+
+@async_router.post("/register", response_model=schemas.UserResponse)
+async def register_async(user: schemas.UserCreate, service: AsyncUserService = Depends(get_async_user_service)):
+    return await service.register_user(user)
+
+@async_router.post("/login", response_model=schemas.Token)
+async def login_async(user: schemas.UserLogin, service: AsyncUserService = Depends(get_async_user_service)):
+    return await service.login_user(user)
+
+@async_router.get("/users", response_model=List[schemas.UserResponse])
+async def get_users_async(service: AsyncUserService = Depends(get_async_user_service)):
+    users = await service.get_all_users()
+    if FAST_RESPONSES:
+        return fast_list_response(adapters.USER_ROWS, users)
+    return users
+
+@async_router.put("/profile/{user_id}", response_model=schemas.UserResponse)
+async def update_profile_async(user_id: int, profile_data: schemas.UserProfileUpdate, service: AsyncUserService = Depends(get_async_user_service)):
+    return await service.update_profile(user_id, profile_data)
@@ -1,36 +1,115 @@
-from fastapi import APIRouter, Depends
-from fastapi.responses import StreamingResponse
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.unit_of_work import UnitOfWork, AsyncUnitOfWork
+from database import get_db, get_async_db
 from dtos import schemas
 from repositories.implementations.certificate_repository import CertificateRepository
+from repositories.implementations.async_certificate_repository import AsyncCertificateRepository
 from services.implementations.certificate_service import CertificateService
+from services.implementations.async_certificate_service import AsyncCertificateService
+from services.certificate_store import certificate_store, certificate_file_response
+from services.certificate_archive import certificate_archive_response
+from services.certificate_index import certificate_index
+from services.job_queue import job_queue
+from starlette.concurrency import run_in_threadpool
+from dtos import adapters
+from utils.fast_json import FAST_RESPONSES, fast_list_response
 from typing import List
 
 router = APIRouter()
 
 def get_certificate_service(db: Session = Depends(get_db)) -> CertificateService:
     repo = CertificateRepository(db)
-    return CertificateService(repo)
+    return CertificateService(repo, UnitOfWork(db))
 
 @router.get("/download/{certificate_code}")
-def download_certificate(certificate_code: str, service: CertificateService = Depends(get_certificate_service)):
-    pdf_buffer = service.get_download_stream(certificate_code)
-    return StreamingResponse(
-        pdf_buffer, 
-        media_type="application/pdf", 
-        headers={"Content-Disposition": f"attachment; filename=Certificate-{certificate_code}.pdf"}
-    )
-
-@router.post("/{course_id}/issue", response_model=schemas.CertificateResponse)
+def download_certificate(request: Request, certificate_code: str, service: CertificateService = Depends(get_certificate_service)):
+    return certificate_file_response(request, service.get_certificate_file(certificate_code), certificate_code)
+
+@router.get("/course/{course_id}/archive")
+def download_course_archive(course_id: int, service: CertificateService = Depends(get_certificate_service)):
+    course, rows = service.get_course_archive(course_id)
+    return certificate_archive_response(course, rows)
+
+@router.get("/store/stats")
+def get_certificate_store_stats():
+    return certificate_store.stats()
+
+# Public verification, answered from memory; shared by both router flavours
+@router.get("/verify/{certificate_code}")
+async def verify_certificate(certificate_code: str):
+    body = certificate_index.lookup(certificate_code)
+    if body is None and certificate_index.should_sync(certificate_code):
+        await run_in_threadpool(certificate_index.sync)
+        body = certificate_index.lookup(certificate_code)
+    if body is None:
+        raise HTTPException(status_code=404, detail="Certificate not found")
+    return Response(content=body, media_type="application/json")
+
+@router.get("/index/stats")
+def get_certificate_index_stats():
+    return certificate_index.stats()
+
+@router.get("/jobs/stats")
+def get_job_queue_stats():
+    return job_queue.stats()
+
+@router.get("/jobs/{job_id}", response_model=schemas.JobResponse)
+def get_job(job_id: int, service: CertificateService = Depends(get_certificate_service)):
+    return service.get_job(job_id)
+
+@router.post("/{course_id}/issue", response_model=schemas.CertificateIssueResponse)
 def issue_certificate(course_id: int, user_id: int, service: CertificateService = Depends(get_certificate_service)):
     return service.issue_certificate(course_id, user_id)
 
 @router.get("/user/{user_id}", response_model=List[schemas.CertificateResponse])
 def get_user_certificates(user_id: int, service: CertificateService = Depends(get_certificate_service)):
     certs = service.get_user_certificates(user_id)
+    if FAST_RESPONSES:
+        return fast_list_response(adapters.CERTIFICATE_ROWS, certs)
     return certs
 
 @router.get("/{course_id}/{user_id}", response_model=schemas.CertificateResponse)
 def get_certificate(course_id: int, user_id: int, service: CertificateService = Depends(get_certificate_service)):
     return service.get_certificate(course_id, user_id)
+
+
+# --- Async handlers (enabled with ASYNC_ROUTERS=certificates) ---
+async_router = APIRouter()
+
+def get_async_certificate_service(db: AsyncSession = Depends(get_async_db)) -> AsyncCertificateService:
+    repo = AsyncCertificateRepository(db)
+    return AsyncCertificateService(repo, AsyncUnitOfWork(db))
+
+@async_router.get("/download/{certificate_code}")
+async def download_certificate_async(request: Request, certificate_code: str, service: AsyncCertificateService = Depends(get_async_certificate_service)):
+    return certificate_file_response(request, await service.get_certificate_file(certificate_code), certificate_code)
+
+@async_router.get("/course/{course_id}/archive")
+async def download_course_archive_async(course_id: int, service: AsyncCertificateService = Depends(get_async_certificate_service)):
+    course, rows = await service.get_course_archive(course_id)
+    return certificate_archive_response(course, rows)
+
+@async_router.get("/jobs/stats")
+async def get_job_queue_stats_async():
+    return await run_in_threadpool(job_queue.stats)
+
+@async_router.get("/jobs/{job_id}", response_model=schemas.JobResponse)
+async def get_job_async(job_id: int, service: AsyncCertificateService = Depends(get_async_certificate_service)):
+    return await service.get_job(job_id)
+
+@async_router.post("/{course_id}/issue", response_model=schemas.CertificateIssueResponse)
+async def issue_certificate_async(course_id: int, user_id: int, service: AsyncCertificateService = Depends(get_async_certificate_service)):
+    return await service.issue_certificate(course_id, user_id)
+
+@async_router.get("/user/{user_id}", response_model=List[schemas.CertificateResponse])
+async def get_user_certificates_async(user_id: int, service: AsyncCertificateService = Depends(get_async_certificate_service)):
+    certs = await service.get_user_certificates(user_id)
+    if FAST_RESPONSES:
+        return fast_list_response(adapters.CERTIFICATE_ROWS, certs)
+    return certs
+
+@async_router.get("/{course_id}/{user_id}", response_model=schemas.CertificateResponse)
+async def get_certificate_async(course_id: int, user_id: int, service: AsyncCertificateService = Depends(get_async_certificate_service)):
+    return await service.get_certificate(course_id, user_id)
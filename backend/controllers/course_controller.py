@@ -1,36 +1,88 @@
-from fastapi import APIRouter, Depends, Body
+from fastapi import APIRouter, Depends, Body, Query, Request
 from sqlalchemy.orm import Session
-from database import get_db
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.unit_of_work import UnitOfWork, AsyncUnitOfWork
+from database import get_db, get_async_db
 from dtos import schemas
 from repositories.implementations.course_repository import CourseRepository
+from repositories.implementations.async_course_repository import AsyncCourseRepository
 from services.implementations.course_service import CourseService
-from typing import List
+from services.implementations.async_course_service import AsyncCourseService
+from repositories.implementations.learning_path_repository import LearningPathRepository
+from repositories.implementations.async_learning_path_repository import AsyncLearningPathRepository
+from services.implementations.learning_path_service import LearningPathService
+from services.implementations.async_learning_path_service import AsyncLearningPathService
+from services.catalog_cache import catalog_cache, cached_json_response
+from starlette.concurrency import run_in_threadpool
+from utils.bulk_input import read_records
+from typing import List, Optional
 
 router = APIRouter()
 
+# Without limit the whole catalog is returned (the frontend loads it in one call)
+MAX_PAGE_SIZE = 500
+
 def get_course_service(db: Session = Depends(get_db)) -> CourseService:
     repo = CourseRepository(db)
-    return CourseService(repo)
+    uow = UnitOfWork(db)
+    return CourseService(repo, uow, LearningPathService(LearningPathRepository(db), uow))
 
 @router.post("/", response_model=schemas.CourseResponse)
 def create_course(course: schemas.CourseCreate, service: CourseService = Depends(get_course_service)):
     return service.create_course(course)
 
-@router.get("/", response_model=List[schemas.CourseResponse])
-def get_courses(service: CourseService = Depends(get_course_service)):
-    return service.get_courses()
+# Bulk endpoints accept a JSON array or an NDJSON stream (Content-Type: application/x-ndjson)
+@router.post(":import", response_model=schemas.BulkImportResult)
+async def import_courses(request: Request, service: CourseService = Depends(get_course_service)):
+    records, errors = await read_records(request)
+    return await run_in_threadpool(service.import_courses, records, errors)
+
+# Catalog reads are served from catalog_cache as pre-serialized JSON with ETags
+@router.get("/", response_model=None, responses={200: {"model": List[schemas.CourseResponse]}})
+def get_courses(
+    request: Request,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    include_lessons: bool = True,
+    service: CourseService = Depends(get_course_service)
+):
+    return cached_json_response(request, service.get_courses_cached(after_id, limit, include_lessons))
+
+@router.get("/search", response_model=List[schemas.CourseSearchHit])
+def search_courses(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(20, ge=1, le=100), service: CourseService = Depends(get_course_service)):
+    return service.search_courses(q, limit)
+
+@router.get("/cache/stats")
+def get_catalog_cache_stats():
+    return catalog_cache.stats()
+
+@router.get("/{course_id}", response_model=None, responses={200: {"model": schemas.CourseResponse}})
+def get_course(request: Request, course_id: int, service: CourseService = Depends(get_course_service)):
+    return cached_json_response(request, service.get_course_cached(course_id))
+
+# Course page in one request: course, ordered lessons, and the user's enrollment, attendance and certificate
+@router.get("/{course_id}/view", response_model=schemas.CourseView)
+def get_course_view(course_id: int, user_id: Optional[int] = None, service: CourseService = Depends(get_course_service)):
+    return service.get_course_view(course_id, user_id)
 
-@router.get("/{course_id}", response_model=schemas.CourseResponse)
-def get_course(course_id: int, service: CourseService = Depends(get_course_service)):
-    return service.get_course(course_id)
+@router.post("/{course_id}/lessons:bulk", response_model=schemas.BulkImportResult)
+async def bulk_add_lessons(course_id: int, request: Request, service: CourseService = Depends(get_course_service)):
+    records, errors = await read_records(request)
+    return await run_in_threadpool(service.bulk_add_lessons, course_id, records, errors)
 
 @router.post("/{course_id}/lessons", response_model=schemas.LessonResponse)
 def add_lesson(course_id: int, lesson: schemas.LessonCreate, service: CourseService = Depends(get_course_service)):
     return service.add_lesson(course_id, lesson)
 
-@router.get("/{course_id}/lessons", response_model=List[schemas.LessonResponse])
-def get_lessons(course_id: int, service: CourseService = Depends(get_course_service)):
-    return service.get_lessons(course_id)
+@router.get("/{course_id}/lessons", response_model=None, responses={200: {"model": List[schemas.LessonResponse]}})
+def get_lessons(request: Request, course_id: int, service: CourseService = Depends(get_course_service)):
+    return cached_json_response(request, service.get_lessons_cached(course_id))
+
+# Cohort enrollment: JSON array, NDJSON or CSV (first column) of user ids and/or emails
+@router.post("/{course_id}/enroll:bulk", response_model=schemas.BulkEnrollResult)
+async def bulk_enroll(course_id: int, request: Request, service: CourseService = Depends(get_course_service)):
+    records, errors = await read_records(request, csv_column=True)
+    return await run_in_threadpool(service.bulk_enroll, course_id, records, errors)
 
 @router.post("/{course_id}/enroll", response_model=schemas.EnrollmentResponse)
 def enroll_course(course_id: int, user_id: int = Body(..., embed=True), service: CourseService = Depends(get_course_service)):
@@ -40,6 +92,76 @@ def enroll_course(course_id: int, user_id: int = Body(..., embed=True), service:
 def get_enrollment_status(course_id: int, user_id: int, service: CourseService = Depends(get_course_service)):
     return service.get_status(course_id, user_id)
 
-@router.post("/{course_id}/complete", response_model=schemas.CertificateResponse)
+@router.post("/{course_id}/complete", response_model=schemas.CertificateIssueResponse)
 def complete_course(course_id: int, user_id: int = Body(..., embed=True), service: CourseService = Depends(get_course_service)):
     return service.complete_course(course_id, user_id)
+
+
+# --- Async handlers (enabled with ASYNC_ROUTERS=courses) ---
+async_router = APIRouter()
+
+def get_async_course_service(db: AsyncSession = Depends(get_async_db)) -> AsyncCourseService:
+    repo = AsyncCourseRepository(db)
+    uow = AsyncUnitOfWork(db)
+    return AsyncCourseService(repo, uow, AsyncLearningPathService(AsyncLearningPathRepository(db), uow))
+
+@async_router.post("/", response_model=schemas.CourseResponse)
+async def create_course_async(course: schemas.CourseCreate, service: AsyncCourseService = Depends(get_async_course_service)):
+    return await service.create_course(course)
+
+@async_router.get("/", response_model=None, responses={200: {"model": List[schemas.CourseResponse]}})
+async def get_courses_async(
+    request: Request,
+    after_id: Optional[int] = None,
+    limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE),
+    include_lessons: bool = True,
+    service: AsyncCourseService = Depends(get_async_course_service)
+):
+    return cached_json_response(request, await service.get_courses_cached(after_id, limit, include_lessons))
+
+@async_router.get("/search", response_model=List[schemas.CourseSearchHit])
+async def search_courses_async(q: str = Query(..., min_length=1, max_length=200), limit: int = Query(20, ge=1, le=100), service: AsyncCourseService = Depends(get_async_course_service)):
+    return await service.search_courses(q, limit)
+
+@async_router.get("/{course_id}", response_model=None, responses={200: {"model": schemas.CourseResponse}})
+async def get_course_async(request: Request, course_id: int, service: AsyncCourseService = Depends(get_async_course_service)):
+    return cached_json_response(request, await service.get_course_cached(course_id))
+
+@async_router.get("/{course_id}/view", response_model=schemas.CourseView)
+async def get_course_view_async(course_id: int, user_id: Optional[int] = None, service: AsyncCourseService = Depends(get_async_course_service)):
+    return await service.get_course_view(course_id, user_id)
+
+@async_router.post(":import", response_model=schemas.BulkImportResult)
+async def import_courses_async(request: Request, service: AsyncCourseService = Depends(get_async_course_service)):
+    records, errors = await read_records(request)
+    return await service.import_courses(records, errors)
+
+@async_router.post("/{course_id}/lessons:bulk", response_model=schemas.BulkImportResult)
+async def bulk_add_lessons_async(course_id: int, request: Request, service: AsyncCourseService = Depends(get_async_course_service)):
+    records, errors = await read_records(request)
+    return await service.bulk_add_lessons(course_id, records, errors)
+
+@async_router.post("/{course_id}/lessons", response_model=schemas.LessonResponse)
+async def add_lesson_async(course_id: int, lesson: schemas.LessonCreate, service: AsyncCourseService = Depends(get_async_course_service)):
+    return await service.add_lesson(course_id, lesson)
+
+@async_router.get("/{course_id}/lessons", response_model=None, responses={200: {"model": List[schemas.LessonResponse]}})
+async def get_lessons_async(request: Request, course_id: int, service: AsyncCourseService = Depends(get_async_course_service)):
+    return cached_json_response(request, await service.get_lessons_cached(course_id))
+
+@async_router.post("/{course_id}/enroll:bulk", response_model=schemas.BulkEnrollResult)
+async def bulk_enroll_async(course_id: int, request: Request, service: AsyncCourseService = Depends(get_async_course_service)):
+    records, errors = await read_records(request, csv_column=True)
+    return await service.bulk_enroll(course_id, records, errors)
+
+@async_router.post("/{course_id}/enroll", response_model=schemas.EnrollmentResponse)
+async def enroll_course_async(course_id: int, user_id: int = Body(..., embed=True), service: AsyncCourseService = Depends(get_async_course_service)):
+    return await service.enroll_course(course_id, user_id)
+
+@async_router.get("/{course_id}/status/{user_id}", response_model=schemas.EnrollmentResponse)
+async def get_enrollment_status_async(course_id: int, user_id: int, service: AsyncCourseService = Depends(get_async_course_service)):
+    return await service.get_status(course_id, user_id)
+
+@async_router.post("/{course_id}/complete", response_model=schemas.CertificateIssueResponse)
+async def complete_course_async(course_id: int, user_id: int = Body(..., embed=True), service: AsyncCourseService = Depends(get_async_course_service)):
+    return await service.complete_course(course_id, user_id)
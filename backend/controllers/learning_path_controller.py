@@ -0,0 +1,55 @@
+from fastapi import APIRouter, Depends
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+from repositories.unit_of_work import UnitOfWork, AsyncUnitOfWork
+from database import get_db, get_async_db
+from dtos import schemas
+from repositories.implementations.learning_path_repository import LearningPathRepository
+from repositories.implementations.async_learning_path_repository import AsyncLearningPathRepository
+from services.implementations.learning_path_service import LearningPathService
+from services.implementations.async_learning_path_service import AsyncLearningPathService
+from typing import List
+
+router = APIRouter()
+
+def get_learning_path_service(db: Session = Depends(get_db)) -> LearningPathService:
+    return LearningPathService(LearningPathRepository(db), UnitOfWork(db))
+
+@router.post("/", response_model=schemas.LearningPathResponse)
+def create_learning_path(request: schemas.LearningPathCreate, service: LearningPathService = Depends(get_learning_path_service)):
+    return service.create_path(request)
+
+@router.get("/user/{user_id}", response_model=List[schemas.LearningPathResponse])
+def get_user_learning_paths(user_id: int, service: LearningPathService = Depends(get_learning_path_service)):
+    return service.get_user_paths(user_id)
+
+# "Where am I": each path with its next day, from one indexed query
+@router.get("/user/{user_id}/current", response_model=List[schemas.LearningPathPosition])
+def get_learning_path_positions(user_id: int, active_only: bool = False, service: LearningPathService = Depends(get_learning_path_service)):
+    return service.get_positions(user_id, active_only)
+
+@router.get("/{path_id}", response_model=schemas.LearningPathDetail)
+def get_learning_path(path_id: int, service: LearningPathService = Depends(get_learning_path_service)):
+    return service.get_path(path_id)
+
+# --- Async handlers (enabled with ASYNC_ROUTERS=learning_paths) ---
+async_router = APIRouter()
+
+def get_async_learning_path_service(db: AsyncSession = Depends(get_async_db)) -> AsyncLearningPathService:
+    return AsyncLearningPathService(AsyncLearningPathRepository(db), AsyncUnitOfWork(db))
+
+@async_router.post("/", response_model=schemas.LearningPathResponse)
+async def create_learning_path_async(request: schemas.LearningPathCreate, service: AsyncLearningPathService = Depends(get_async_learning_path_service)):
+    return await service.create_path(request)
+
+@async_router.get("/user/{user_id}", response_model=List[schemas.LearningPathResponse])
+async def get_user_learning_paths_async(user_id: int, service: AsyncLearningPathService = Depends(get_async_learning_path_service)):
+    return await service.get_user_paths(user_id)
+
+@async_router.get("/user/{user_id}/current", response_model=List[schemas.LearningPathPosition])
+async def get_learning_path_positions_async(user_id: int, active_only: bool = False, service: AsyncLearningPathService = Depends(get_async_learning_path_service)):
+    return await service.get_positions(user_id, active_only)
+
+@async_router.get("/{path_id}", response_model=schemas.LearningPathDetail)
+async def get_learning_path_async(path_id: int, service: AsyncLearningPathService = Depends(get_async_learning_path_service)):
+    return await service.get_path(path_id)
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import sessionmaker
 import os
@@ -8,16 +8,51 @@ load_dotenv()
 
 # Use SQLite - Absolute Path
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
-SQLALCHEMY_DATABASE_URL = f"sqlite:///{os.path.join(BASE_DIR, 'lms.db')}"
-print(f"--- DATABASE DEBUG ---")
-print(f"BASE_DIR: {BASE_DIR}")
-print(f"DB Path: {os.path.join(BASE_DIR, 'lms.db')}")
-print(f"Exists? {os.path.exists(os.path.join(BASE_DIR, 'lms.db'))}")
-print(f"----------------------")
-
-engine = create_engine(
-    SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
-)
+SQLALCHEMY_DATABASE_URL = os.getenv("DATABASE_URL", f"sqlite:///{os.path.join(BASE_DIR, 'lms.db')}")
+
+# Engine profile: "default" keeps SQLite's stock settings,
+# "production" switches to WAL with tuned pragmas and an explicit pool.
+DB_PROFILE = os.getenv("DB_PROFILE", "default")
+
+PRODUCTION_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "NORMAL",
+    "busy_timeout": int(os.getenv("DB_BUSY_TIMEOUT_MS", "5000")),
+    "mmap_size": int(os.getenv("DB_MMAP_SIZE", str(256 * 1024 * 1024))),
+    "cache_size": int(os.getenv("DB_CACHE_SIZE", "-65536")),  # negative = KiB, i.e. 64 MiB
+    "temp_store": "MEMORY",
+}
+
+POOL_SETTINGS = {
+    "pool_size": int(os.getenv("DB_POOL_SIZE", "20")),
+    "max_overflow": int(os.getenv("DB_MAX_OVERFLOW", "10")),
+    "pool_timeout": int(os.getenv("DB_POOL_TIMEOUT", "30")),
+}
+
+def _apply_pragmas(engine, pragmas):
+    @event.listens_for(engine, "connect")
+    def set_sqlite_pragmas(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        for name, value in pragmas.items():
+            cursor.execute(f"PRAGMA {name}={value}")
+        cursor.close()
+
+def build_engine(url=SQLALCHEMY_DATABASE_URL, profile=DB_PROFILE):
+    is_sqlite = url.startswith("sqlite")
+    connect_args = {"check_same_thread": False} if is_sqlite else {}
+
+    if profile != "production":
+        return create_engine(url, connect_args=connect_args)
+
+    if is_sqlite:
+        # Let busy_timeout do the waiting instead of the driver's default 5s lock timeout
+        connect_args["timeout"] = PRODUCTION_PRAGMAS["busy_timeout"] / 1000
+    engine = create_engine(url, connect_args=connect_args, **POOL_SETTINGS)
+    if is_sqlite:
+        _apply_pragmas(engine, PRODUCTION_PRAGMAS)
+    return engine
+
+engine = build_engine()
 
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
@@ -29,3 +64,47 @@ def get_db():
         yield db
     finally:
         db.close()
+
+# --- Async stack ---
+# Plain sqlite URLs are mapped to aiosqlite; any other async driver can be given explicitly.
+ASYNC_DATABASE_URL = os.getenv(
+    "ASYNC_DATABASE_URL",
+    SQLALCHEMY_DATABASE_URL.replace("sqlite://", "sqlite+aiosqlite://", 1)
+    if SQLALCHEMY_DATABASE_URL.startswith("sqlite://") else SQLALCHEMY_DATABASE_URL
+)
+
+# Comma separated router names (auth, courses, certificates, learning_paths) served by async handlers, or "all"
+ASYNC_ROUTERS = {name.strip() for name in os.getenv("ASYNC_ROUTERS", "").split(",") if name.strip()}
+
+def use_async_router(name):
+    return "all" in ASYNC_ROUTERS or name in ASYNC_ROUTERS
+
+_async_engine = None
+_AsyncSessionLocal = None
+
+def build_async_engine(url=ASYNC_DATABASE_URL, profile=DB_PROFILE):
+    # Imported lazily so the sync stack works without an async driver installed
+    from sqlalchemy.ext.asyncio import create_async_engine
+
+    is_sqlite = url.startswith("sqlite")
+    if profile != "production":
+        return create_async_engine(url)
+
+    engine = create_async_engine(url, **POOL_SETTINGS)
+    if is_sqlite:
+        _apply_pragmas(engine.sync_engine, PRODUCTION_PRAGMAS)
+    return engine
+
+def get_async_engine():
+    global _async_engine, _AsyncSessionLocal
+    if _async_engine is None:
+        from sqlalchemy.ext.asyncio import async_sessionmaker
+        _async_engine = build_async_engine()
+        # expire_on_commit=False: lazy refreshes are not possible outside the greenlet
+        _AsyncSessionLocal = async_sessionmaker(_async_engine, autoflush=False, expire_on_commit=False)
+    return _async_engine
+
+async def get_async_db():
+    get_async_engine()
+    async with _AsyncSessionLocal() as db:
+        yield db
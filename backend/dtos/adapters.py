@@ -0,0 +1,21 @@
+from typing import List
+from pydantic import TypeAdapter
+from dtos import schemas
+from utils.fast_json import RowEncoder
+
+# Precompiled validators/serializers for response DTOs, built once at import.
+USER_LIST = TypeAdapter(List[schemas.UserResponse])
+COURSE = TypeAdapter(schemas.CourseResponse)
+COURSE_LIST = TypeAdapter(List[schemas.CourseResponse])
+COURSE_SUMMARY_LIST = TypeAdapter(List[schemas.CourseSummaryResponse])
+LESSON_LIST = TypeAdapter(List[schemas.LessonResponse])
+ATTENDANCE_LIST = TypeAdapter(List[schemas.AttendanceResponse])
+CERTIFICATE_LIST = TypeAdapter(List[schemas.CertificateResponse])
+
+# Field plans for the FAST_RESPONSES path (see utils/fast_json.py)
+USER_ROWS = RowEncoder(schemas.UserResponse)
+COURSE_ROWS = RowEncoder(schemas.CourseResponse)
+COURSE_SUMMARY_ROWS = RowEncoder(schemas.CourseSummaryResponse)
+LESSON_ROWS = RowEncoder(schemas.LessonResponse)
+ATTENDANCE_ROWS = RowEncoder(schemas.AttendanceResponse)
+CERTIFICATE_ROWS = RowEncoder(schemas.CertificateResponse)
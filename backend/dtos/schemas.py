@@ -1,6 +1,8 @@
-from pydantic import BaseModel, Field, EmailStr
+import json
+from pydantic import BaseModel, Field, EmailStr, field_validator
 from typing import List, Optional, Any
 from datetime import datetime
+from utils.learning_path_limits import LEARNING_PATH_MAX_DAYS, LEARNING_PATH_MAX_TOPIC_LENGTH
 
 # --- ALL PYDANTIC MODELS HERE ---
 
@@ -61,14 +63,38 @@ class CourseCreate(BaseModel):
     total_duration: int = 0
     # Lessons can be created separately or nested if needed, simplified here
 
-class CourseResponse(CourseCreate):
+class CourseSummaryResponse(CourseCreate):
     id: int
     created_at: datetime
-    lessons: List[LessonResponse] = []
 
     class Config:
         from_attributes = True
 
+class CourseResponse(CourseSummaryResponse):
+    lessons: List[LessonResponse] = []
+
+class CourseImport(CourseCreate):
+    lessons: List[LessonCreate] = []
+
+class BulkRowError(BaseModel):
+    index: int # position of the record in the request (0-based, blank NDJSON lines skipped)
+    error: str
+
+class BulkImportResult(BaseModel):
+    received: int
+    inserted: int
+    lessons_inserted: int = 0
+    ids: List[int] = []
+    errors: List[BulkRowError] = []
+
+class CourseSearchHit(BaseModel):
+    course_id: int
+    lesson_id: Optional[int] = None
+    course_title: str
+    title: str # highlighted with <mark>
+    snippet: Optional[str] = None
+    score: float
+
 # Enrollment
 class EnrollmentBase(BaseModel):
     course_id: int
@@ -82,6 +108,14 @@ class EnrollmentResponse(EnrollmentBase):
     class Config:
         from_attributes = True
 
+class BulkEnrollResult(BaseModel):
+    received: int
+    resolved: int # distinct users found
+    enrolled: int # newly enrolled by this call
+    already_enrolled: int
+    not_found: List[str] = [] # ids or emails with no matching user
+    errors: List[BulkRowError] = []
+
 # Attendance
 class AttendanceCreate(BaseModel):
     course_id: Optional[int] = None 
@@ -142,3 +176,86 @@ class CertificateResponse(BaseModel):
 
     class Config:
         from_attributes = True
+
+class CertificateIssueResponse(CertificateResponse):
+    # Set when issuing queued the PDF render; poll GET /certificates/jobs/{render_job_id}
+    render_job_id: Optional[int] = None
+
+# Background jobs
+class JobResponse(BaseModel):
+    id: int
+    kind: str
+    status: str
+    attempts: int
+    max_attempts: int
+    created_at: datetime
+    run_after: datetime
+    started_at: Optional[datetime] = None
+    finished_at: Optional[datetime] = None
+    last_error: Optional[str] = None
+    result: Optional[Any] = None
+
+    @field_validator("result", mode="before")
+    @classmethod
+    def parse_result(cls, value):
+        return json.loads(value) if isinstance(value, str) else value
+
+    class Config:
+        from_attributes = True
+
+# Course player view: everything the course page needs in one response
+class LessonProgress(LessonResponse):
+    attended: bool = False
+    attendance_count: int = 0
+    last_attended_at: Optional[datetime] = None
+
+class CourseView(BaseModel):
+    course: CourseSummaryResponse
+    lessons: List[LessonProgress] = []
+    enrollment: Optional[EnrollmentResponse] = None
+    certificate: Optional[CertificateResponse] = None
+    attended_lessons: int = 0
+
+# Persisted learning paths (the stateless generator lives under /learning-path)
+class LearningPathCreate(BaseModel):
+    user_id: int
+    course_name: str = Field(min_length=1, max_length=LEARNING_PATH_MAX_TOPIC_LENGTH)
+    days: int = Field(ge=1, le=LEARNING_PATH_MAX_DAYS)
+    hours_per_day: int = Field(ge=1, le=24)
+    # Follow this course's attendance / completion; without it, courses on the same topic count
+    course_id: Optional[int] = None
+
+class LearningPathDayResponse(BaseModel):
+    day: int
+    phase: str
+    topic: str
+    hours: int
+    activity: str
+    completed_at: Optional[datetime] = None
+    completed_by: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class LearningPathResponse(BaseModel):
+    id: int
+    user_id: int
+    course_id: Optional[int] = None
+    topic: str
+    total_days: int
+    hours_per_day: int
+    completed_days: int
+    current_day: Optional[int] = None
+    status: str
+    created_at: Optional[datetime] = None
+    completed_at: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class LearningPathDetail(LearningPathResponse):
+    days: List[LearningPathDayResponse] = []
+
+# "Where am I": a path with the day to do next (None once finished)
+class LearningPathPosition(LearningPathResponse):
+    current: Optional[LearningPathDayResponse] = None
@@ -0,0 +1,152 @@
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import event
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, build_engine
+import models
+from repositories.implementations.user_repository import UserRepository
+from repositories.implementations.course_repository import CourseRepository
+from repositories.implementations.certificate_repository import CertificateRepository
+from repositories.implementations.learning_path_repository import LearningPathRepository
+
+# Prints EXPLAIN QUERY PLAN for every lookup the repositories and routes run,
+# against a seeded database with a large attendance table.
+# Usage: python explain_queries.py [attendance_rows]
+ATTENDANCE_ROWS = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+USERS = 5_000
+COURSES = 200
+
+# Listing endpoints return whole tables on purpose, a scan is expected there
+EXPECTED_SCANS = {"get_all_courses", "users.get_all"}
+
+def seed(engine):
+    raw = engine.raw_connection()
+    cur = raw.cursor()
+    now = datetime(2026, 1, 1)
+    cur.executemany("INSERT INTO users (id, email, password) VALUES (?, ?, 'x')",
+                    ((i, f"user{i}@explain.local") for i in range(1, USERS + 1)))
+    cur.executemany("INSERT INTO courses (id, title, description) VALUES (?, ?, 'seed')",
+                    ((i, f"Course {i}") for i in range(1, COURSES + 1)))
+    cur.executemany("INSERT INTO lessons (course_id, title) VALUES (?, ?)",
+                    ((i % COURSES + 1, f"Lesson {i}") for i in range(COURSES * 20)))
+    cur.executemany("INSERT INTO enrollments (user_id, course_id, is_completed) VALUES (?, ?, 0)",
+                    ((u, c) for u in range(1, USERS + 1) for c in range(1, 6)))
+    cur.executemany("INSERT INTO certificates (user_id, course_id, certificate_code) VALUES (?, ?, ?)",
+                    ((u, 1, f"LMS-{u:08X}") for u in range(1, USERS + 1)))
+    cur.executemany("INSERT INTO assessments (course_id, question) VALUES (?, 'q')",
+                    ((i % COURSES + 1,) for i in range(COURSES * 10)))
+    cur.executemany("INSERT INTO assessment_results (user_id, course_id, score) VALUES (?, ?, 80)",
+                    ((i % USERS + 1, i % COURSES + 1) for i in range(USERS * 4)))
+    cur.executemany(
+        "INSERT INTO attendance (user_id, course_id, lesson_id, status, date) VALUES (?, ?, ?, 'present', ?)",
+        ((i % USERS + 1, i % COURSES + 1, i % (COURSES * 20) + 1, now - timedelta(minutes=i))
+         for i in range(ATTENDANCE_ROWS))
+    )
+    # One 30 day learning path per user, the first 10 days done
+    cur.executemany(
+        "INSERT INTO learning_paths (id, user_id, course_id, topic, topic_key, total_days, hours_per_day, "
+        "completed_days, current_day, status) VALUES (?, ?, ?, 'Python', 'python', 30, 2, 10, 11, 'active')",
+        ((u, u, u % COURSES + 1) for u in range(1, USERS + 1))
+    )
+    cur.executemany(
+        "INSERT INTO learning_path_days (path_id, day, phase, topic, hours, activity) VALUES (?, ?, 'p', 't', 2, 'a')",
+        ((u, d) for u in range(1, USERS + 1) for d in range(1, 31))
+    )
+    raw.commit()
+    cur.execute("ANALYZE")
+    raw.close()
+
+def main():
+    tmp_dir = tempfile.mkdtemp()
+    engine = build_engine(f"sqlite:///{os.path.join(tmp_dir, 'explain.db')}", "production")
+    Base.metadata.create_all(bind=engine)
+
+    start = time.perf_counter()
+    seed(engine)
+    print(f"Seeded {ATTENDANCE_ROWS:,} attendance rows in {time.perf_counter() - start:.1f}s\n")
+
+    captured = []
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            captured.append((statement, parameters))
+
+    db = sessionmaker(bind=engine)()
+    users = UserRepository(db)
+    courses = CourseRepository(db)
+    certs = CertificateRepository(db)
+    paths = LearningPathRepository(db)
+
+    # (label, callable) - routes without a repository are replayed with the same ORM query
+    queries = [
+        ("users.get_by_email", lambda: users.get_by_email("user42@explain.local")),
+        ("users.get_by_id", lambda: users.get_by_id(42)),
+        ("users.get_all", lambda: users.get_all()),
+        ("get_all_courses", lambda: courses.get_all_courses()),
+        ("get_course_by_id", lambda: courses.get_course_by_id(7)),
+        ("get_lessons_by_course", lambda: courses.get_lessons_by_course(7)),
+        ("get_enrollment", lambda: courses.get_enrollment(42, 3)),
+        ("courses.get_certificate", lambda: courses.get_certificate(42, 1)),
+        ("certs.get_by_code", lambda: certs.get_by_code("LMS-0000002A")),
+        ("certs.get_by_user_and_course", lambda: certs.get_by_user_and_course(42, 1)),
+        ("certs.get_all_by_user", lambda: certs.get_all_by_user(42)),
+        ("certs.get_course_certificates", lambda: certs.get_course_certificates(7)),
+        ("paths.get_positions", lambda: paths.get_positions(42)),
+        ("paths.get_user_paths", lambda: paths.get_user_paths(42)),
+        ("paths.get_path", lambda: paths.get_path(42)),
+        ("paths.find_active_paths", lambda: paths.find_active_paths(42, 43, ["python"])),
+        ("attendance.duplicate_check", lambda: db.query(models.Attendance).filter(
+            models.Attendance.user_id == 42,
+            models.Attendance.course_id == 43,
+            models.Attendance.lesson_id == 42 + 1
+        ).first()),
+        ("attendance.streak", lambda: db.query(models.Attendance).filter(
+            models.Attendance.user_id == 42
+        ).order_by(models.Attendance.date.desc()).all()),
+        ("attendance.by_user", lambda: db.query(models.Attendance).filter(models.Attendance.user_id == 42).all()),
+        ("dashboard.attendance_present", lambda: db.query(models.Attendance).filter(
+            models.Attendance.user_id == 42,
+            models.Attendance.status == "present"
+        ).count()),
+        ("dashboard.enrollments", lambda: db.query(models.Enrollment).filter(models.Enrollment.user_id == 42).count()),
+        ("assessments.by_course", lambda: db.query(models.Assessment).filter(models.Assessment.course_id == 7).all()),
+        ("assessment_results.by_user_course", lambda: db.query(models.AssessmentResult).filter(
+            models.AssessmentResult.user_id == 42,
+            models.AssessmentResult.course_id == 7
+        ).all()),
+    ]
+
+    unexpected = []
+    raw = engine.raw_connection()
+    for label, run in queries:
+        captured.clear()
+        start = time.perf_counter()
+        run()
+        elapsed = (time.perf_counter() - start) * 1000
+        print(f"== {label} ({elapsed:.2f} ms)")
+        for statement, parameters in captured:
+            plan = raw.cursor().execute(f"EXPLAIN QUERY PLAN {statement}", parameters).fetchall()
+            for row in plan:
+                detail = row[-1]
+                print(f"   {detail}")
+                if detail.startswith("SCAN") and label not in EXPECTED_SCANS:
+                    unexpected.append((label, detail))
+    raw.close()
+    db.close()
+
+    print()
+    if unexpected:
+        print("Full scans found:")
+        for label, detail in unexpected:
+            print(f" - {label}: {detail}")
+        sys.exit(1)
+    print("No full table scans outside the listing endpoints.")
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,62 @@
+from contextlib import asynccontextmanager
+import asyncio
+import os
 from fastapi import FastAPI, Depends
 from fastapi.middleware.cors import CORSMiddleware
 from sqlalchemy.orm import Session
-from database import engine, Base, get_db
+from database import SessionLocal, get_db, use_async_router
 import models
-from models import User
-from passlib.context import CryptContext
-from controllers import auth_controller, course_controller, certificate_controller
+from controllers import auth_controller, course_controller, certificate_controller, learning_path_controller
 import attendance_routes, assessment_routes
-import uvicorn
+from utils.routing import overlay_routes
+from services.job_queue import JOB_WORKERS, job_queue
+from services.cpu_executor import cpu_executor
+from services.certificate_index import certificate_index
+from services.learning_path_cache import LEARNING_PATH_WARMUP, learning_path_cache, parse_warmup
 
-# Create Tables
-Base.metadata.create_all(bind=engine)
-
-pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
-def get_password_hash(password):
-    return pwd_context.hash(password)
+# Nothing below runs DDL, seeding or hashing at import time: schema is managed by
+# migrations (python migrate.py upgrade) and one-off setup happens in lifespan().
+SEED_DEMO_DATA = os.getenv("SEED_DEMO_DATA", "0") == "1"
 
 # Seed Dummy Data
 def seed_data():
-    db = next(get_db())
-    if not db.query(models.User).first():
-        print("Seeding dummy user...")
-        hashed_password = get_password_hash("password123")
-        dummy_user = models.User(
-            email="test@example.com", 
-            password=hashed_password, 
-            fullname="Test User"
-        )
-        db.add(dummy_user)
-        db.commit()
-        print("Dummy user created: test@example.com / password123")
-    else:
-        print("Database already contains users.")
+    db = SessionLocal()
+    try:
+        if not db.query(models.User).first():
+            print("Seeding dummy user...")
+            from services.implementations.user_service import hash_password
+            dummy_user = models.User(
+                email="test@example.com",
+                password=hash_password("password123"),
+                fullname="Test User"
+            )
+            db.add(dummy_user)
+            db.commit()
+            print("Dummy user created: test@example.com / password123")
+    finally:
+        db.close()
 
-seed_data()
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    if SEED_DEMO_DATA:
+        seed_data()
+    # Worker processes for PDFs and password hashing
+    cpu_executor.start()
+    # Popular learning paths, built in the background so startup does not wait for them
+    warm_up = asyncio.create_task(learning_path_cache.warm_up(parse_warmup(LEARNING_PATH_WARMUP)))
+    # Issued codes for /certificates/verify, rebuilt periodically to drop deleted ones
+    certificate_index.sync()
+    index_reload = asyncio.create_task(certificate_index.reload_periodically())
+    # Background job workers (certificate rendering); JOB_WORKERS=0 leaves jobs to another process
+    if JOB_WORKERS:
+        job_queue.start()
+    yield
+    warm_up.cancel()
+    index_reload.cancel()
+    job_queue.stop()
+    cpu_executor.shutdown()
 
-app = FastAPI(title="LMS API (MySQL)", description="Backend for LMS with MySQL Auth", version="3.0.0")
+app = FastAPI(title="LMS API (MySQL)", description="Backend for LMS with MySQL Auth", version="3.0.0", lifespan=lifespan)
 
 # CORS Configuration
 origins = ["*"]
@@ -52,11 +73,18 @@ app.add_middleware(
 async def root():
     return {"message": "Welcome to the LMS API (MySQL Version)"}
 
-app.include_router(auth_controller.router, prefix="/auth", tags=["Authentication"])
-app.include_router(course_controller.router, prefix="/courses", tags=["Courses"])
+# Controllers can be switched to their async handlers per router via ASYNC_ROUTERS
+def pick_router(controller, name):
+    if use_async_router(name):
+        return overlay_routes(controller.router, controller.async_router)
+    return controller.router
+
+app.include_router(pick_router(auth_controller, "auth"), prefix="/auth", tags=["Authentication"])
+app.include_router(pick_router(course_controller, "courses"), prefix="/courses", tags=["Courses"])
 app.include_router(attendance_routes.router, prefix="/attendance", tags=["Attendance"])
 app.include_router(assessment_routes.router, prefix="/assessments", tags=["Assessments"])
-app.include_router(certificate_controller.router, prefix="/certificates", tags=["Certificates"])
+app.include_router(pick_router(certificate_controller, "certificates"), prefix="/certificates", tags=["Certificates"])
+app.include_router(pick_router(learning_path_controller, "learning_paths"), prefix="/learning-paths", tags=["Learning Paths"])
 
 from routers import learning_path
 app.include_router(learning_path.router)
@@ -86,4 +114,5 @@ def get_dashboard_stats(user_id: int, db: Session = Depends(get_db)):
     }
 
 if __name__ == "__main__":
+    import uvicorn
     uvicorn.run("main:app", host="127.0.0.1", port=8000, reload=True)
@@ -0,0 +1,45 @@
+import argparse
+import sys
+
+import migrations
+from database import engine
+
+# Schema migrations CLI. Run before starting (or after deploying) the API:
+#   python migrate.py upgrade          apply all pending revisions
+#   python migrate.py upgrade --to 2   apply up to revision 2
+#   python migrate.py status           show applied / pending revisions
+#   python migrate.py stamp 3          mark revisions as applied without running them
+#   python migrate.py rebuild-search   repopulate the course search index from courses/lessons
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="LMS schema migrations")
+    sub = parser.add_subparsers(dest="command", required=True)
+    up = sub.add_parser("upgrade", help="apply pending revisions")
+    up.add_argument("--to", type=int, default=None, help="stop after this revision")
+    sub.add_parser("status", help="list revisions")
+    st = sub.add_parser("stamp", help="mark revisions applied without running them")
+    st.add_argument("revision", type=int)
+    sub.add_parser("rebuild-search", help="rebuild the FTS5 course search index")
+    args = parser.parse_args(argv)
+
+    if args.command == "upgrade":
+        version = migrations.upgrade(engine, target=args.to)
+        print(f"Database at revision {version}")
+    elif args.command == "status":
+        applied = migrations.applied_versions(engine)
+        for module in migrations.load_revisions():
+            state = "applied" if module.revision in applied else "pending"
+            print(f"{module.revision:04d} [{state}] {module.description}")
+    elif args.command == "stamp":
+        version = migrations.stamp(engine, args.revision)
+        print(f"Database stamped at revision {version}")
+    elif args.command == "rebuild-search":
+        from services import search_index
+        with engine.begin() as conn:
+            search_index.install(conn)
+            search_index.rebuild(conn)
+        print("Course search index rebuilt")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
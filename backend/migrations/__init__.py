@@ -0,0 +1,66 @@
+import importlib
+import pkgutil
+from datetime import datetime
+
+from sqlalchemy import text
+
+from migrations import versions
+
+# Applied revisions are tracked here; each row is one revision module in migrations/versions
+VERSION_TABLE = "schema_migrations"
+
+def load_revisions():
+    revisions = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        module = importlib.import_module(f"migrations.versions.{module_info.name}")
+        revisions.append(module)
+    revisions.sort(key=lambda module: module.revision)
+    numbers = [module.revision for module in revisions]
+    if len(numbers) != len(set(numbers)):
+        raise RuntimeError(f"Duplicate migration revision numbers: {numbers}")
+    return revisions
+
+def _ensure_version_table(engine):
+    with engine.begin() as conn:
+        conn.execute(text(
+            f"CREATE TABLE IF NOT EXISTS {VERSION_TABLE} ("
+            "version INTEGER PRIMARY KEY, description VARCHAR(255), applied_at VARCHAR(32))"
+        ))
+
+def applied_versions(engine):
+    _ensure_version_table(engine)
+    with engine.connect() as conn:
+        return {row[0] for row in conn.execute(text(f"SELECT version FROM {VERSION_TABLE}"))}
+
+def current_version(engine):
+    applied = applied_versions(engine)
+    return max(applied) if applied else 0
+
+def pending(engine):
+    applied = applied_versions(engine)
+    return [module for module in load_revisions() if module.revision not in applied]
+
+def _record(engine, module):
+    with engine.begin() as conn:
+        conn.execute(
+            text(f"INSERT INTO {VERSION_TABLE} (version, description, applied_at) VALUES (:v, :d, :t)"),
+            {"v": module.revision, "d": module.description, "t": datetime.utcnow().isoformat()}
+        )
+
+def upgrade(engine, target=None, log=print):
+    # Revisions manage their own transactions (index builds commit per index), and are
+    # written to be re-runnable, so an interrupted upgrade can simply be started again.
+    for module in pending(engine):
+        if target is not None and module.revision > target:
+            break
+        log(f"Applying {module.revision:04d}: {module.description}")
+        module.upgrade(engine, log)
+        _record(engine, module)
+    return current_version(engine)
+
+def stamp(engine, target):
+    # Mark revisions up to target as applied without running them
+    for module in pending(engine):
+        if module.revision <= target:
+            _record(engine, module)
+    return current_version(engine)
@@ -0,0 +1,88 @@
+import time
+
+from sqlalchemy import inspect, text
+
+def index_exists(engine, table, name):
+    return any(index["name"] == name for index in inspect(engine).get_indexes(table))
+
+def create_index_online(engine, name, table, columns, unique=False, log=print):
+    # Each index is built in its own short transaction so the write lock is only held
+    # while that one index is built, never across the whole migration. In WAL mode
+    # (DB_PROFILE=production) readers keep going while the index is built.
+    if index_exists(engine, table, name):
+        log(f"  index {name} already exists")
+        return
+    start = time.perf_counter()
+    unique_sql = "UNIQUE " if unique else ""
+    with engine.begin() as conn:
+        conn.execute(text(f"CREATE {unique_sql}INDEX IF NOT EXISTS {name} ON {table} ({', '.join(columns)})"))
+    log(f"  built {name} in {time.perf_counter() - start:.2f}s")
+
+def _duplicate_groups(conn, table, columns, aggregates):
+    # Rows with a NULL in the key are left alone: they are not duplicates for a unique index
+    key = ", ".join(columns)
+    not_null = " AND ".join(f"{column} IS NOT NULL" for column in columns)
+    return conn.execute(text(
+        f"SELECT {key}, {aggregates} FROM {table} WHERE {not_null} "
+        f"GROUP BY {key} HAVING COUNT(*) > 1"
+    )).all()
+
+def merge_duplicate_enrollments(engine, batch_size=500, log=print):
+    # Duplicates collapse into the lowest id, which keeps the earliest enrolled_at and is
+    # completed if any of the duplicates was. Merged in small committed batches so writers
+    # are blocked one batch at a time.
+    with engine.connect() as conn:
+        groups = _duplicate_groups(
+            conn, "enrollments", ["user_id", "course_id"],
+            "MIN(id), MIN(enrolled_at), MAX(COALESCE(is_completed, 0)), COUNT(*)"
+        )
+    removed = 0
+    for offset in range(0, len(groups), batch_size):
+        with engine.begin() as conn:
+            for user_id, course_id, keep_id, enrolled_at, completed, count in groups[offset:offset + batch_size]:
+                conn.execute(
+                    text("UPDATE enrollments SET enrolled_at = :enrolled_at, is_completed = :completed WHERE id = :id"),
+                    {"enrolled_at": enrolled_at, "completed": completed, "id": keep_id}
+                )
+                conn.execute(
+                    text("DELETE FROM enrollments WHERE user_id = :u AND course_id = :c AND id != :id"),
+                    {"u": user_id, "c": course_id, "id": keep_id}
+                )
+                removed += count - 1
+    if groups:
+        keys = ", ".join(f"({user_id}, {course_id})" for user_id, course_id, *_ in groups[:20])
+        more = f" and {len(groups) - 20} more" if len(groups) > 20 else ""
+        log(f"  merged {removed} duplicate enrollments into {len(groups)} rows (user_id, course_id): {keys}{more}")
+    return removed
+
+def dedupe_certificates(engine, log=print):
+    # A certificate code may already be in a user's hands, so a duplicate is only removed
+    # when it carries no code of its own. Two different codes for one (user, course) cannot
+    # be resolved here: the migration stops and lists them for a manual decision.
+    with engine.connect() as conn:
+        groups = _duplicate_groups(
+            conn, "certificates", ["user_id", "course_id"],
+            "COUNT(DISTINCT certificate_code), GROUP_CONCAT(certificate_code), COUNT(*)"
+        )
+    conflicts = [(user_id, course_id, codes) for user_id, course_id, distinct, codes, _ in groups if distinct > 1]
+    if conflicts:
+        details = "; ".join(f"user {user_id} course {course_id}: {codes}" for user_id, course_id, codes in conflicts)
+        raise RuntimeError(
+            f"{len(conflicts)} (user_id, course_id) pairs have several issued certificate codes. "
+            f"Keep one row per pair (delete or move the others), then run the upgrade again: {details}"
+        )
+    removed = 0
+    with engine.begin() as conn:
+        for user_id, course_id, *_ in groups:
+            # The row with the code (or the lowest id when none has one) stays
+            keep_id = conn.execute(text(
+                "SELECT id FROM certificates WHERE user_id = :u AND course_id = :c "
+                "ORDER BY certificate_code IS NULL, id LIMIT 1"
+            ), {"u": user_id, "c": course_id}).scalar()
+            removed += conn.execute(
+                text("DELETE FROM certificates WHERE user_id = :u AND course_id = :c AND id != :id"),
+                {"u": user_id, "c": course_id, "id": keep_id}
+            ).rowcount
+    if removed:
+        log(f"  removed {removed} certificate rows without a code that duplicated another certificate")
+    return removed
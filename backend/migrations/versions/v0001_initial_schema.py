@@ -0,0 +1,104 @@
+from sqlalchemy import (
+    MetaData, Table, Column, Integer, String, Text, DateTime, JSON, Boolean, ForeignKey, func
+)
+
+revision = 1
+description = "initial schema"
+
+# Frozen copy of the tables as they were before migrations existed.
+# Do not import models here: later model changes belong in new revisions.
+metadata = MetaData()
+
+Table(
+    "users", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("fullname", String(255)),
+    Column("email", String(255), unique=True, index=True, nullable=False),
+    Column("password", String(255), nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+Table(
+    "profiles", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), unique=True),
+    Column("avatar", String(500)),
+    Column("bio", Text, nullable=True),
+    Column("title", String(100)),
+    Column("social_links", JSON, nullable=True),
+)
+
+Table(
+    "courses", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("title", String(255), nullable=False),
+    Column("description", Text, nullable=False),
+    Column("level", String(50)),
+    Column("thumbnail", String(500), nullable=True),
+    Column("resource_url", String(500), nullable=True),
+    Column("total_duration", Integer),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+Table(
+    "lessons", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("course_id", Integer, ForeignKey("courses.id")),
+    Column("title", String(255), nullable=False),
+    Column("content", Text, nullable=True),
+    Column("video_url", String(500), nullable=True),
+    Column("duration", Integer),
+)
+
+Table(
+    "enrollments", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("course_id", Integer, ForeignKey("courses.id")),
+    Column("enrolled_at", DateTime(timezone=True), server_default=func.now()),
+    Column("is_completed", Boolean),
+)
+
+Table(
+    "attendance", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("course_id", Integer, ForeignKey("courses.id"), nullable=True),
+    Column("lesson_id", Integer, ForeignKey("lessons.id"), nullable=True),
+    Column("status", String(50)),
+    Column("date", DateTime(timezone=True), server_default=func.now()),
+)
+
+Table(
+    "assessments", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("course_id", Integer, ForeignKey("courses.id")),
+    Column("question", Text, nullable=False),
+    Column("option_a", String(255)),
+    Column("option_b", String(255)),
+    Column("option_c", String(255)),
+    Column("option_d", String(255)),
+    Column("correct_option", String(10)),
+)
+
+Table(
+    "assessment_results", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("course_id", Integer, ForeignKey("courses.id")),
+    Column("score", Integer),
+    Column("submitted_at", DateTime(timezone=True), server_default=func.now()),
+)
+
+Table(
+    "certificates", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id")),
+    Column("course_id", Integer, ForeignKey("courses.id")),
+    Column("certificate_code", String(100), unique=True),
+    Column("issued_date", DateTime(timezone=True), server_default=func.now()),
+)
+
+def upgrade(engine, log=print):
+    # checkfirst: databases created by the old create_all-at-import already have these
+    metadata.create_all(bind=engine, checkfirst=True)
@@ -0,0 +1,18 @@
+from sqlalchemy import inspect, text
+
+revision = 2
+description = "add courses.resource_url and attendance.course_id to pre-existing databases"
+
+# Replaces the old hand-run update_schema.py
+def upgrade(engine, log=print):
+    inspector = inspect(engine)
+    course_columns = {column["name"] for column in inspector.get_columns("courses")}
+    attendance_columns = {column["name"] for column in inspector.get_columns("attendance")}
+
+    with engine.begin() as conn:
+        if "resource_url" not in course_columns:
+            log("  adding courses.resource_url")
+            conn.execute(text("ALTER TABLE courses ADD COLUMN resource_url VARCHAR(500)"))
+        if "course_id" not in attendance_columns:
+            log("  adding attendance.course_id")
+            conn.execute(text("ALTER TABLE attendance ADD COLUMN course_id INTEGER REFERENCES courses(id)"))
@@ -0,0 +1,19 @@
+from migrations.online import create_index_online, dedupe_certificates, merge_duplicate_enrollments
+
+revision = 3
+description = "indexes and uniqueness for hot lookups"
+
+def upgrade(engine, log=print):
+    # Unique indexes cannot be built while duplicates exist. Duplicate certificates with
+    # different codes stop the upgrade before anything is changed; enrollments are merged
+    # (see migrations/online.py)
+    dedupe_certificates(engine, log=log)
+    merge_duplicate_enrollments(engine, log=log)
+
+    create_index_online(engine, "uq_enrollments_user_course", "enrollments", ["user_id", "course_id"], unique=True, log=log)
+    create_index_online(engine, "uq_certificates_user_course", "certificates", ["user_id", "course_id"], unique=True, log=log)
+    create_index_online(engine, "ix_attendance_user_date", "attendance", ["user_id", "date"], log=log)
+    create_index_online(engine, "ix_attendance_user_course_lesson", "attendance", ["user_id", "course_id", "lesson_id"], log=log)
+    create_index_online(engine, "ix_lessons_course_id", "lessons", ["course_id"], log=log)
+    create_index_online(engine, "ix_assessments_course_id", "assessments", ["course_id"], log=log)
+    create_index_online(engine, "ix_assessment_results_user_course", "assessment_results", ["user_id", "course_id"], log=log)
@@ -0,0 +1,58 @@
+from sqlalchemy import text
+
+revision = 4
+description = "FTS5 course/lesson search index with sync triggers"
+
+# Frozen copy of the index as first shipped. Do not import services.search_index here:
+# later changes to the index belong in new revisions.
+# Course rows use rowid = -course.id and lesson rows rowid = lesson.id.
+CREATE_TABLE = """
+CREATE VIRTUAL TABLE IF NOT EXISTS course_search USING fts5(
+    title, body, course_id UNINDEXED, lesson_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+)
+"""
+
+TRIGGERS = [
+    """CREATE TRIGGER IF NOT EXISTS courses_search_ai AFTER INSERT ON courses BEGIN
+        INSERT INTO course_search (rowid, title, body, course_id, lesson_id)
+        VALUES (-new.id, new.title, new.description, new.id, NULL);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS courses_search_au AFTER UPDATE OF title, description ON courses BEGIN
+        DELETE FROM course_search WHERE rowid = -old.id;
+        INSERT INTO course_search (rowid, title, body, course_id, lesson_id)
+        VALUES (-new.id, new.title, new.description, new.id, NULL);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS courses_search_ad AFTER DELETE ON courses BEGIN
+        DELETE FROM course_search WHERE rowid = -old.id;
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS lessons_search_ai AFTER INSERT ON lessons BEGIN
+        INSERT INTO course_search (rowid, title, body, course_id, lesson_id)
+        VALUES (new.id, new.title, new.content, new.course_id, new.id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS lessons_search_au AFTER UPDATE OF title, content, course_id ON lessons BEGIN
+        DELETE FROM course_search WHERE rowid = old.id;
+        INSERT INTO course_search (rowid, title, body, course_id, lesson_id)
+        VALUES (new.id, new.title, new.content, new.course_id, new.id);
+    END""",
+    """CREATE TRIGGER IF NOT EXISTS lessons_search_ad AFTER DELETE ON lessons BEGIN
+        DELETE FROM course_search WHERE rowid = old.id;
+    END""",
+]
+
+REBUILD = [
+    "DELETE FROM course_search",
+    "INSERT INTO course_search (rowid, title, body, course_id, lesson_id) "
+    "SELECT -id, title, description, id, NULL FROM courses",
+    "INSERT INTO course_search (rowid, title, body, course_id, lesson_id) "
+    "SELECT id, title, content, course_id, id FROM lessons",
+    "INSERT INTO course_search (course_search) VALUES ('optimize')",
+]
+
+def upgrade(engine, log=print):
+    if engine.dialect.name != "sqlite":
+        log("  skipped: FTS5 search is SQLite only")
+        return
+    with engine.begin() as conn:
+        for statement in [CREATE_TABLE, *TRIGGERS, *REBUILD]:
+            conn.execute(text(statement))
@@ -0,0 +1,29 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String, Text, DateTime, Index
+
+revision = 5
+description = "durable background job table"
+
+# Frozen copy of the jobs table as introduced by this revision
+metadata = MetaData()
+
+Table(
+    "jobs", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("kind", String(100), nullable=False),
+    Column("payload", Text, nullable=False),
+    Column("status", String(20), nullable=False),
+    Column("attempts", Integer, nullable=False),
+    Column("max_attempts", Integer, nullable=False),
+    Column("created_at", DateTime, nullable=False),
+    Column("run_after", DateTime, nullable=False),
+    Column("locked_until", DateTime, nullable=True),
+    Column("started_at", DateTime, nullable=True),
+    Column("finished_at", DateTime, nullable=True),
+    Column("last_error", Text, nullable=True),
+    Column("result", Text, nullable=True),
+    Index("ix_jobs_status_run_after", "status", "run_after"),
+)
+
+def upgrade(engine, log=print):
+    # checkfirst keeps the revision re-runnable
+    metadata.create_all(bind=engine, checkfirst=True)
@@ -0,0 +1,7 @@
+from migrations.online import create_index_online
+
+revision = 6
+description = "index certificates by course for cohort exports"
+
+def upgrade(engine, log=print):
+    create_index_online(engine, "ix_certificates_course_id", "certificates", ["course_id"], log=log)
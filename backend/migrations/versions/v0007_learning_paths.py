@@ -0,0 +1,45 @@
+from sqlalchemy import MetaData, Table, Column, Integer, String, DateTime, ForeignKey, Index, func
+
+revision = 7
+description = "persisted learning paths with per-day progress"
+
+# Frozen copy of the tables as introduced by this revision
+metadata = MetaData()
+
+Table("users", metadata, Column("id", Integer, primary_key=True))
+Table("courses", metadata, Column("id", Integer, primary_key=True))
+
+Table(
+    "learning_paths", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("user_id", Integer, ForeignKey("users.id"), nullable=False),
+    Column("course_id", Integer, ForeignKey("courses.id"), nullable=True),
+    Column("topic", String(255), nullable=False),
+    Column("topic_key", String(255), nullable=False),
+    Column("total_days", Integer, nullable=False),
+    Column("hours_per_day", Integer, nullable=False),
+    Column("completed_days", Integer, nullable=False),
+    Column("current_day", Integer, nullable=True),
+    Column("status", String(20), nullable=False),
+    Column("created_at", DateTime(timezone=True), server_default=func.now()),
+    Column("completed_at", DateTime(timezone=True), nullable=True),
+    Index("ix_learning_paths_user_status", "user_id", "status"),
+)
+
+Table(
+    "learning_path_days", metadata,
+    Column("id", Integer, primary_key=True, index=True),
+    Column("path_id", Integer, ForeignKey("learning_paths.id"), nullable=False),
+    Column("day", Integer, nullable=False),
+    Column("phase", String(100), nullable=False),
+    Column("topic", String(255), nullable=False),
+    Column("hours", Integer, nullable=False),
+    Column("activity", String(255), nullable=False),
+    Column("completed_at", DateTime(timezone=True), nullable=True),
+    Column("completed_by", String(20), nullable=True),
+    Index("uq_learning_path_days_path_day", "path_id", "day", unique=True),
+)
+
+def upgrade(engine, log=print):
+    # checkfirst keeps the revision re-runnable; users / courses already exist and are skipped
+    metadata.create_all(bind=engine, checkfirst=True)
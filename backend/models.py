@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, DateTime, JSON, Boolean, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 from database import Base
@@ -44,7 +44,7 @@ class Lesson(Base):
     __tablename__ = "lessons"
 
     id = Column(Integer, primary_key=True, index=True)
-    course_id = Column(Integer, ForeignKey("courses.id"))
+    course_id = Column(Integer, ForeignKey("courses.id"), index=True)
     title = Column(String(255), nullable=False)
     content = Column(Text, nullable=True) # Text content or HTML
     video_url = Column(String(500), nullable=True)
@@ -54,6 +54,10 @@ class Lesson(Base):
 
 class Enrollment(Base):
     __tablename__ = "enrollments"
+    __table_args__ = (
+        # One enrollment per user and course (get_enrollment / enroll_course rely on it)
+        Index("uq_enrollments_user_course", "user_id", "course_id", unique=True),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -66,6 +70,10 @@ class Enrollment(Base):
 
 class Attendance(Base):
     __tablename__ = "attendance"
+    __table_args__ = (
+        Index("ix_attendance_user_date", "user_id", "date"), # streaks, per-user history
+        Index("ix_attendance_user_course_lesson", "user_id", "course_id", "lesson_id"), # duplicate check
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -81,7 +89,7 @@ class Assessment(Base):
     __tablename__ = "assessments"
 
     id = Column(Integer, primary_key=True, index=True)
-    course_id = Column(Integer, ForeignKey("courses.id"))
+    course_id = Column(Integer, ForeignKey("courses.id"), index=True)
     question = Column(Text, nullable=False)
     option_a = Column(String(255))
     option_b = Column(String(255))
@@ -91,6 +99,9 @@ class Assessment(Base):
 
 class AssessmentResult(Base):
     __tablename__ = "assessment_results"
+    __table_args__ = (
+        Index("ix_assessment_results_user_course", "user_id", "course_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -100,6 +111,12 @@ class AssessmentResult(Base):
 
 class Certificate(Base):
     __tablename__ = "certificates"
+    __table_args__ = (
+        # One certificate per user and course (issue_certificate / complete_course rely on it)
+        Index("uq_certificates_user_course", "user_id", "course_id", unique=True),
+        # Course cohort export
+        Index("ix_certificates_course_id", "course_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     user_id = Column(Integer, ForeignKey("users.id"))
@@ -109,3 +126,66 @@ class Certificate(Base):
 
     user = relationship("User")
     course = relationship("Course")
+
+class Job(Base):
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # Workers claim the oldest runnable job: status = 'queued' AND run_after <= now
+        Index("ix_jobs_status_run_after", "status", "run_after"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    kind = Column(String(100), nullable=False)
+    payload = Column(Text, nullable=False)  # JSON
+    status = Column(String(20), nullable=False, default="queued")  # queued, running, succeeded, failed
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False, default=5)
+    # Timestamps are written by the queue (UTC, microseconds) so waits can be measured
+    created_at = Column(DateTime, nullable=False)
+    run_after = Column(DateTime, nullable=False)
+    locked_until = Column(DateTime, nullable=True)  # lease of the worker running it
+    started_at = Column(DateTime, nullable=True)
+    finished_at = Column(DateTime, nullable=True)
+    last_error = Column(Text, nullable=True)
+    result = Column(Text, nullable=True)  # JSON
+
+class LearningPath(Base):
+    __tablename__ = "learning_paths"
+    __table_args__ = (
+        # "Where am I": a user's paths, joined to their current day through uq_learning_path_days_path_day
+        Index("ix_learning_paths_user_status", "user_id", "status"),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    user_id = Column(Integer, ForeignKey("users.id"), nullable=False)
+    course_id = Column(Integer, ForeignKey("courses.id"), nullable=True)  # course whose progress it follows
+    topic = Column(String(255), nullable=False)
+    topic_key = Column(String(255), nullable=False)  # normalized topic, matched against course titles
+    total_days = Column(Integer, nullable=False)
+    hours_per_day = Column(Integer, nullable=False)
+    # Progress is kept up to date as attendance / completions arrive, never recomputed on read
+    completed_days = Column(Integer, nullable=False, default=0)
+    current_day = Column(Integer, nullable=True)  # next day to do; NULL once every day is done
+    status = Column(String(20), nullable=False, default="active")  # active, completed
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+
+    days = relationship("LearningPathDay", back_populates="path", order_by="LearningPathDay.day")
+
+class LearningPathDay(Base):
+    __tablename__ = "learning_path_days"
+    __table_args__ = (
+        Index("uq_learning_path_days_path_day", "path_id", "day", unique=True),
+    )
+
+    id = Column(Integer, primary_key=True, index=True)
+    path_id = Column(Integer, ForeignKey("learning_paths.id"), nullable=False)
+    day = Column(Integer, nullable=False)
+    phase = Column(String(100), nullable=False)
+    topic = Column(String(255), nullable=False)
+    hours = Column(Integer, nullable=False)
+    activity = Column(String(255), nullable=False)
+    completed_at = Column(DateTime(timezone=True), nullable=True)
+    completed_by = Column(String(20), nullable=True)  # attendance, completion
+
+    path = relationship("LearningPath", back_populates="days")
@@ -0,0 +1,51 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from repositories.interfaces.certificate_repository_interface import ICertificateRepository
+from repositories.implementations.certificate_repository import course_certificates_statement
+import models
+
+class AsyncCertificateRepository(ICertificateRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_code(self, code: str):
+        return await self.db.scalar(select(models.Certificate).where(models.Certificate.certificate_code == code))
+
+    async def get_by_user_and_course(self, user_id: int, course_id: int):
+        return await self.db.scalar(
+            select(models.Certificate).options(selectinload(models.Certificate.course)).where(
+                models.Certificate.user_id == user_id,
+                models.Certificate.course_id == course_id
+            )
+        )
+
+    async def create(self, certificate: models.Certificate):
+        self.db.add(certificate)
+        await self.db.flush()
+        await self.db.refresh(certificate, attribute_names=["issued_date", "course"])
+        return certificate
+
+    async def get_all_by_user(self, user_id: int):
+        return (await self.db.scalars(
+            select(models.Certificate).options(selectinload(models.Certificate.course)).where(
+                models.Certificate.user_id == user_id
+            )
+        )).all()
+
+    async def get_user_by_id(self, user_id: int):
+        return await self.db.scalar(select(models.User).where(models.User.id == user_id))
+
+    async def get_course_by_id(self, course_id: int):
+        return await self.db.scalar(select(models.Course).where(models.Course.id == course_id))
+
+    async def get_course_certificates(self, course_id: int):
+        return (await self.db.execute(course_certificates_statement(course_id))).all()
+
+    async def create_job(self, job: models.Job):
+        self.db.add(job)
+        await self.db.flush()
+        return job
+
+    async def get_job(self, job_id: int):
+        return await self.db.get(models.Job, job_id)
@@ -0,0 +1,140 @@
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from repositories.interfaces.course_repository_interface import ICourseRepository
+from repositories.implementations.course_repository import (
+    course_view_statements, enrollment_upsert, enrollment_insert_ignore, chunked
+)
+from services.search_index import SEARCH_SQL
+import models
+
+class AsyncCourseRepository(ICourseRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_course(self, course: models.Course) -> models.Course:
+        self.db.add(course)
+        await self.db.flush()
+        await self.db.refresh(course, attribute_names=["created_at", "lessons"])
+        return course
+
+    async def get_all_courses(self, after_id=None, limit=None, include_lessons=True):
+        stmt = select(models.Course)
+        if include_lessons:
+            stmt = stmt.options(selectinload(models.Course.lessons))
+        if after_id is not None:
+            stmt = stmt.where(models.Course.id > after_id)
+        stmt = stmt.order_by(models.Course.id)
+        if limit is not None:
+            stmt = stmt.limit(limit)
+        return (await self.db.scalars(stmt)).all()
+
+    async def get_course_by_id(self, course_id: int):
+        return await self.db.scalar(
+            select(models.Course).options(selectinload(models.Course.lessons)).where(models.Course.id == course_id)
+        )
+
+    async def search(self, match: str, limit: int):
+        return (await self.db.execute(SEARCH_SQL, {"match": match, "limit": limit})).mappings().all()
+
+    async def add_lesson(self, lesson: models.Lesson):
+        self.db.add(lesson)
+        await self.db.flush()
+        await self.db.refresh(lesson)
+        return lesson
+
+    async def get_lessons_by_course(self, course_id: int):
+        return (await self.db.scalars(select(models.Lesson).where(models.Lesson.course_id == course_id))).all()
+
+    async def bulk_insert_lessons(self, lessons):
+        if lessons:
+            await self.db.execute(insert(models.Lesson), lessons)
+        return len(lessons)
+
+    async def bulk_insert_courses(self, courses, lessons_per_course):
+        ids = []
+        if courses:
+            ids = list(await self.db.scalars(
+                insert(models.Course).returning(models.Course.id, sort_by_parameter_order=True), courses
+            ))
+            lessons = [
+                {**lesson, "course_id": course_id}
+                for course_id, course_lessons in zip(ids, lessons_per_course)
+                for lesson in course_lessons
+            ]
+            if lessons:
+                await self.db.execute(insert(models.Lesson), lessons)
+        return ids
+
+    async def get_course_view(self, course_id: int, user_id=None):
+        head, lessons = course_view_statements(course_id, user_id)
+        row = (await self.db.execute(head)).first()
+        if row is None:
+            return None, []
+        return tuple(row), [tuple(r) for r in await self.db.execute(lessons)]
+
+    async def get_enrollment(self, user_id: int, course_id: int):
+        return await self.db.scalar(select(models.Enrollment).where(
+            models.Enrollment.user_id == user_id,
+            models.Enrollment.course_id == course_id
+        ))
+
+    async def upsert_enrollment(self, user_id: int, course_id: int):
+        return (await self.db.scalars(
+            enrollment_upsert(user_id, course_id), execution_options={"populate_existing": True}
+        )).first()
+
+    async def find_user_ids(self, ids, emails):
+        found_ids = set()
+        for chunk in chunked(ids):
+            found_ids.update(await self.db.scalars(select(models.User.id).where(models.User.id.in_(chunk))))
+        found_emails = {}
+        for chunk in chunked(emails):
+            found_emails.update((await self.db.execute(
+                select(models.User.email, models.User.id).where(models.User.email.in_(chunk))
+            )).all())
+        return found_ids, found_emails
+
+    async def get_enrolled_user_ids(self, course_id: int):
+        return set(await self.db.scalars(select(models.Enrollment.user_id).where(models.Enrollment.course_id == course_id)))
+
+    async def bulk_insert_enrollments(self, course_id: int, user_ids):
+        inserted = 0
+        for chunk in chunked(user_ids, 5000):
+            result = await self.db.execute(
+                enrollment_insert_ignore(), [{"user_id": user_id, "course_id": course_id} for user_id in chunk]
+            )
+            inserted += result.rowcount
+        return inserted
+
+    async def update_enrollment(self, enrollment: models.Enrollment):
+        await self.db.flush()
+        return enrollment
+
+    async def get_certificate(self, user_id: int, course_id: int):
+        return await self.db.scalar(
+            select(models.Certificate).options(selectinload(models.Certificate.course)).where(
+                models.Certificate.user_id == user_id,
+                models.Certificate.course_id == course_id
+            )
+        )
+
+    async def create_certificate(self, certificate: models.Certificate):
+        self.db.add(certificate)
+        await self.db.flush()
+        await self.db.refresh(certificate, attribute_names=["issued_date", "course"])
+        return certificate
+
+    async def create_job(self, job: models.Job):
+        self.db.add(job)
+        await self.db.flush()
+        return job
+
+    async def create_attendance(self, attendance: models.Attendance):
+        self.db.add(attendance)
+        await self.db.flush()
+        await self.db.refresh(attendance)
+        return attendance
+
+    async def get_user_by_id(self, user_id: int):
+        return await self.db.scalar(select(models.User).where(models.User.id == user_id))
@@ -0,0 +1,50 @@
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from repositories.interfaces.learning_path_repository_interface import ILearningPathRepository
+from repositories.implementations.learning_path_repository import (
+    active_paths_statement, complete_days_statement, positions_statement
+)
+import models
+
+class AsyncLearningPathRepository(ILearningPathRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def create_path(self, path: models.LearningPath, days):
+        self.db.add(path)
+        await self.db.flush()
+        await self.db.refresh(path, attribute_names=["created_at"])
+        if days:
+            await self.db.execute(insert(models.LearningPathDay), [{**day, "path_id": path.id} for day in days])
+        return path
+
+    async def get_path(self, path_id: int):
+        return await self.db.scalar(
+            select(models.LearningPath).options(selectinload(models.LearningPath.days))
+            .where(models.LearningPath.id == path_id)
+        )
+
+    async def get_user_paths(self, user_id: int):
+        return (await self.db.scalars(
+            select(models.LearningPath).where(models.LearningPath.user_id == user_id).order_by(models.LearningPath.id)
+        )).all()
+
+    async def get_positions(self, user_id: int, active_only: bool = False):
+        return (await self.db.execute(positions_statement(user_id, active_only))).all()
+
+    async def find_active_paths(self, user_id: int, course_id: int, topic_keys):
+        return (await self.db.scalars(active_paths_statement(user_id, course_id, topic_keys))).all()
+
+    async def complete_days(self, path_id: int, through_day: int, source: str, when):
+        return (await self.db.execute(complete_days_statement(path_id, through_day, source, when))).rowcount
+
+    async def update_path(self, path: models.LearningPath):
+        await self.db.flush()
+        return path
+
+    async def get_user_by_id(self, user_id: int):
+        return await self.db.get(models.User, user_id)
+
+    async def get_course_by_id(self, course_id: int):
+        return await self.db.get(models.Course, course_id)
@@ -0,0 +1,37 @@
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import selectinload
+from repositories.interfaces.user_repository_interface import IUserRepository
+import models
+
+class AsyncUserRepository(IUserRepository):
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get_by_email(self, email: str):
+        return await self.db.scalar(select(models.User).where(models.User.email == email))
+
+    async def create(self, user: models.User):
+        self.db.add(user)
+        await self.db.flush()
+        await self.db.refresh(user)
+        return user
+
+    async def get_by_id(self, user_id: int):
+        # Profile is touched by update_profile, and lazy loads are not allowed on AsyncSession
+        return await self.db.scalar(
+            select(models.User).options(selectinload(models.User.profile)).where(models.User.id == user_id)
+        )
+
+    async def update(self, user: models.User):
+        await self.db.flush()
+        await self.db.refresh(user)
+        return user
+
+    async def create_profile(self, profile: models.Profile):
+        self.db.add(profile)
+        await self.db.flush()
+        return profile
+
+    async def get_all(self):
+        return (await self.db.scalars(select(models.User))).all()
@@ -1,7 +1,16 @@
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from repositories.interfaces.certificate_repository_interface import ICertificateRepository
 import models
 
+def course_certificates_statement(course_id: int):
+    return (
+        select(models.Certificate.certificate_code, models.User.fullname, models.Certificate.issued_date)
+        .join(models.User, models.User.id == models.Certificate.user_id)
+        .where(models.Certificate.course_id == course_id)
+        .order_by(models.Certificate.id)
+    )
+
 class CertificateRepository(ICertificateRepository):
     def __init__(self, db: Session):
         self.db = db
@@ -17,8 +26,7 @@ class CertificateRepository(ICertificateRepository):
     
     def create(self, certificate: models.Certificate):
         self.db.add(certificate)
-        self.db.commit()
-        self.db.refresh(certificate)
+        self.db.flush()
         return certificate
     
     def get_all_by_user(self, user_id: int):
@@ -29,3 +37,15 @@ class CertificateRepository(ICertificateRepository):
         
     def get_course_by_id(self, course_id: int):
         return self.db.query(models.Course).filter(models.Course.id == course_id).first()
+
+    def get_course_certificates(self, course_id: int):
+        # (certificate_code, fullname, issued_date) rows only, the archive never needs entities
+        return self.db.execute(course_certificates_statement(course_id)).all()
+
+    def create_job(self, job: models.Job):
+        self.db.add(job)
+        self.db.flush()
+        return job
+
+    def get_job(self, job_id: int):
+        return self.db.get(models.Job, job_id)
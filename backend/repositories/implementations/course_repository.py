@@ -1,47 +1,177 @@
-from sqlalchemy.orm import Session
+from sqlalchemy import and_, func, insert, literal, null, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session, selectinload
 from repositories.interfaces.course_repository_interface import ICourseRepository
+from services.search_index import SEARCH_SQL
 import models
 
+def course_view_statements(course_id, user_id):
+    # Two statements: the course with the user's enrollment and certificate joined in,
+    # then the ordered lessons joined to per-lesson attendance aggregated for the user
+    if user_id is None:
+        head = select(models.Course, null(), null()).where(models.Course.id == course_id)
+        lessons = select(models.Lesson, literal(0), null())
+    else:
+        head = (
+            select(models.Course, models.Enrollment, models.Certificate)
+            .outerjoin(models.Enrollment, and_(
+                models.Enrollment.course_id == models.Course.id, models.Enrollment.user_id == user_id
+            ))
+            .outerjoin(models.Certificate, and_(
+                models.Certificate.course_id == models.Course.id, models.Certificate.user_id == user_id
+            ))
+            .where(models.Course.id == course_id)
+            .limit(1)
+        )
+        attendance = (
+            select(
+                models.Attendance.lesson_id,
+                func.count().label("attendance_count"),
+                func.max(models.Attendance.date).label("last_attended_at"),
+            )
+            .where(
+                models.Attendance.user_id == user_id,
+                models.Attendance.course_id == course_id,
+                models.Attendance.lesson_id.is_not(None),
+            )
+            .group_by(models.Attendance.lesson_id)
+            .subquery()
+        )
+        lessons = (
+            select(models.Lesson, func.coalesce(attendance.c.attendance_count, 0), attendance.c.last_attended_at)
+            .outerjoin(attendance, attendance.c.lesson_id == models.Lesson.id)
+        )
+    lessons = lessons.where(models.Lesson.course_id == course_id).order_by(models.Lesson.id)
+    return head, lessons
+
+BULK_CHUNK_SIZE = 500
+
+def chunked(values, size=BULK_CHUNK_SIZE):
+    values = list(values)
+    for start in range(0, len(values), size):
+        yield values[start:start + size]
+
+def enrollment_insert_ignore():
+    # Rows enrolled concurrently between the set-difference and the insert are skipped, not errors.
+    # Core table insert (not ORM) so the executemany result reports rowcount.
+    return sqlite_insert(models.Enrollment.__table__).on_conflict_do_nothing(
+        index_elements=[models.Enrollment.user_id, models.Enrollment.course_id]
+    )
+
+def enrollment_upsert(user_id, course_id):
+    # INSERT ... SELECT FROM courses so a missing course inserts nothing (no separate lookup);
+    # on a duplicate the no-op DO UPDATE makes RETURNING hand back the existing row.
+    stmt = sqlite_insert(models.Enrollment).from_select(
+        ["user_id", "course_id"],
+        select(literal(user_id), models.Course.id).where(models.Course.id == course_id)
+    )
+    return stmt.on_conflict_do_update(
+        index_elements=[models.Enrollment.user_id, models.Enrollment.course_id],
+        set_={"user_id": stmt.excluded.user_id}
+    ).returning(models.Enrollment)
+
 class CourseRepository(ICourseRepository):
     def __init__(self, db: Session):
         self.db = db
 
     def create_course(self, course: models.Course) -> models.Course:
         self.db.add(course)
-        self.db.commit()
-        self.db.refresh(course)
+        self.db.flush()
         return course
     
-    def get_all_courses(self):
-        return self.db.query(models.Course).all()
+    def get_all_courses(self, after_id=None, limit=None, include_lessons=True):
+        # Keyset pagination on the primary key; lessons for the whole page come from one extra SELECT
+        query = self.db.query(models.Course)
+        if include_lessons:
+            query = query.options(selectinload(models.Course.lessons))
+        if after_id is not None:
+            query = query.filter(models.Course.id > after_id)
+        query = query.order_by(models.Course.id)
+        if limit is not None:
+            query = query.limit(limit)
+        return query.all()
     
     def get_course_by_id(self, course_id: int):
         return self.db.query(models.Course).filter(models.Course.id == course_id).first()
     
+    def search(self, match: str, limit: int):
+        return self.db.execute(SEARCH_SQL, {"match": match, "limit": limit}).mappings().all()
+
     def add_lesson(self, lesson: models.Lesson):
         self.db.add(lesson)
-        self.db.commit()
-        self.db.refresh(lesson)
+        self.db.flush()
         return lesson
     
     def get_lessons_by_course(self, course_id: int):
         return self.db.query(models.Lesson).filter(models.Lesson.course_id == course_id).all()
 
+    def bulk_insert_lessons(self, lessons):
+        if lessons:
+            self.db.execute(insert(models.Lesson), lessons)
+        return len(lessons)
+
+    def bulk_insert_courses(self, courses, lessons_per_course):
+        ids = []
+        if courses:
+            ids = list(self.db.scalars(
+                insert(models.Course).returning(models.Course.id, sort_by_parameter_order=True), courses
+            ))
+            lessons = [
+                {**lesson, "course_id": course_id}
+                for course_id, course_lessons in zip(ids, lessons_per_course)
+                for lesson in course_lessons
+            ]
+            if lessons:
+                self.db.execute(insert(models.Lesson), lessons)
+        return ids
+
+    def get_course_view(self, course_id: int, user_id=None):
+        head, lessons = course_view_statements(course_id, user_id)
+        row = self.db.execute(head).first()
+        if row is None:
+            return None, []
+        return tuple(row), [tuple(r) for r in self.db.execute(lessons)]
+
     def get_enrollment(self, user_id: int, course_id: int):
          return self.db.query(models.Enrollment).filter(
             models.Enrollment.user_id == user_id,
             models.Enrollment.course_id == course_id
         ).first()
     
-    def create_enrollment(self, enrollment: models.Enrollment):
-        self.db.add(enrollment)
-        self.db.commit()
-        self.db.refresh(enrollment)
+    def upsert_enrollment(self, user_id: int, course_id: int):
+        enrollment = self.db.scalars(
+            enrollment_upsert(user_id, course_id), execution_options={"populate_existing": True}
+        ).first()
+        if enrollment is not None:
+            # RETURNING loaded every column; detach so the unit of work's commit does not expire it
+            self.db.expunge(enrollment)
         return enrollment
     
+    def find_user_ids(self, ids, emails):
+        found_ids = set()
+        for chunk in chunked(ids):
+            found_ids.update(self.db.scalars(select(models.User.id).where(models.User.id.in_(chunk))))
+        found_emails = {}
+        for chunk in chunked(emails):
+            found_emails.update(self.db.execute(
+                select(models.User.email, models.User.id).where(models.User.email.in_(chunk))
+            ).all())
+        return found_ids, found_emails
+
+    def get_enrolled_user_ids(self, course_id: int):
+        return set(self.db.scalars(select(models.Enrollment.user_id).where(models.Enrollment.course_id == course_id)))
+
+    def bulk_insert_enrollments(self, course_id: int, user_ids):
+        inserted = 0
+        for chunk in chunked(user_ids, 5000):
+            result = self.db.execute(
+                enrollment_insert_ignore(), [{"user_id": user_id, "course_id": course_id} for user_id in chunk]
+            )
+            inserted += result.rowcount
+        return inserted
+
     def update_enrollment(self, enrollment: models.Enrollment):
-        self.db.commit()
-        self.db.refresh(enrollment)
+        self.db.flush()
         return enrollment
 
     def get_certificate(self, user_id: int, course_id: int):
@@ -52,14 +182,17 @@ class CourseRepository(ICourseRepository):
     
     def create_certificate(self, certificate: models.Certificate):
         self.db.add(certificate)
-        self.db.commit()
-        self.db.refresh(certificate)
+        self.db.flush()
         return certificate
 
+    def create_job(self, job: models.Job):
+        self.db.add(job)
+        self.db.flush()
+        return job
+
     def create_attendance(self, attendance: models.Attendance):
         self.db.add(attendance)
-        self.db.commit()
-        self.db.refresh(attendance)
+        self.db.flush()
         return attendance
         
     def get_user_by_id(self, user_id: int):
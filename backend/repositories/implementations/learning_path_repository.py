@@ -0,0 +1,83 @@
+from sqlalchemy import and_, insert, or_, select, update
+from sqlalchemy.orm import Session, selectinload
+from repositories.interfaces.learning_path_repository_interface import ILearningPathRepository
+import models
+
+def positions_statement(user_id: int, active_only: bool = False):
+    # ix_learning_paths_user_status finds the paths, uq_learning_path_days_path_day their current day
+    statement = (
+        select(models.LearningPath, models.LearningPathDay)
+        .outerjoin(models.LearningPathDay, and_(
+            models.LearningPathDay.path_id == models.LearningPath.id,
+            models.LearningPathDay.day == models.LearningPath.current_day
+        ))
+        .where(models.LearningPath.user_id == user_id)
+        .order_by(models.LearningPath.id)
+    )
+    if active_only:
+        statement = statement.where(models.LearningPath.status == "active")
+    return statement
+
+def active_paths_statement(user_id: int, course_id: int, topic_keys):
+    # Paths created for this course, or course-less paths on a topic the course covers
+    return select(models.LearningPath).where(
+        models.LearningPath.user_id == user_id,
+        models.LearningPath.status == "active",
+        or_(
+            models.LearningPath.course_id == course_id,
+            and_(models.LearningPath.course_id.is_(None), models.LearningPath.topic_key.in_(topic_keys))
+        )
+    ).order_by(models.LearningPath.id)
+
+def complete_days_statement(path_id: int, through_day: int, source: str, when):
+    return (
+        update(models.LearningPathDay)
+        .where(
+            models.LearningPathDay.path_id == path_id,
+            models.LearningPathDay.day <= through_day,
+            models.LearningPathDay.completed_at.is_(None)
+        )
+        .values(completed_at=when, completed_by=source)
+        .execution_options(synchronize_session=False)
+    )
+
+class LearningPathRepository(ILearningPathRepository):
+    def __init__(self, db: Session):
+        self.db = db
+
+    def create_path(self, path: models.LearningPath, days):
+        self.db.add(path)
+        self.db.flush()
+        if days:
+            self.db.execute(insert(models.LearningPathDay), [{**day, "path_id": path.id} for day in days])
+        return path
+
+    def get_path(self, path_id: int):
+        return self.db.scalar(
+            select(models.LearningPath).options(selectinload(models.LearningPath.days))
+            .where(models.LearningPath.id == path_id)
+        )
+
+    def get_user_paths(self, user_id: int):
+        return self.db.scalars(
+            select(models.LearningPath).where(models.LearningPath.user_id == user_id).order_by(models.LearningPath.id)
+        ).all()
+
+    def get_positions(self, user_id: int, active_only: bool = False):
+        return self.db.execute(positions_statement(user_id, active_only)).all()
+
+    def find_active_paths(self, user_id: int, course_id: int, topic_keys):
+        return self.db.scalars(active_paths_statement(user_id, course_id, topic_keys)).all()
+
+    def complete_days(self, path_id: int, through_day: int, source: str, when):
+        return self.db.execute(complete_days_statement(path_id, through_day, source, when)).rowcount
+
+    def update_path(self, path: models.LearningPath):
+        self.db.flush()
+        return path
+
+    def get_user_by_id(self, user_id: int):
+        return self.db.get(models.User, user_id)
+
+    def get_course_by_id(self, course_id: int):
+        return self.db.get(models.Course, course_id)
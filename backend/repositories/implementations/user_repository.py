@@ -11,21 +11,19 @@ class UserRepository(IUserRepository):
 
     def create(self, user: models.User):
         self.db.add(user)
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
     def get_by_id(self, user_id: int):
         return self.db.query(models.User).filter(models.User.id == user_id).first()
         
     def update(self, user: models.User):
-        self.db.commit()
-        self.db.refresh(user)
+        self.db.flush()
         return user
 
     def create_profile(self, profile: models.Profile):
         self.db.add(profile)
-        self.db.commit()
+        self.db.flush()
         return profile
     
     def get_all(self):
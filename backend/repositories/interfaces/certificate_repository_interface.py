@@ -20,3 +20,12 @@ class ICertificateRepository(ABC):
     
     @abstractmethod
     def get_course_by_id(self, course_id: int) -> Optional[models.Course]: pass
+
+    @abstractmethod
+    def get_course_certificates(self, course_id: int) -> List[tuple]: pass
+
+    @abstractmethod
+    def create_job(self, job: models.Job) -> models.Job: pass
+
+    @abstractmethod
+    def get_job(self, job_id: int) -> Optional[models.Job]: pass
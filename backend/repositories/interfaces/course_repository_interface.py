@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import Dict, List, Optional, Set, Tuple
 import models
 
 class ICourseRepository(ABC):
@@ -7,11 +7,14 @@ class ICourseRepository(ABC):
     def create_course(self, course: models.Course) -> models.Course: pass
     
     @abstractmethod
-    def get_all_courses(self) -> List[models.Course]: pass
+    def get_all_courses(self, after_id: Optional[int] = None, limit: Optional[int] = None, include_lessons: bool = True) -> List[models.Course]: pass
     
     @abstractmethod
     def get_course_by_id(self, course_id: int) -> Optional[models.Course]: pass
     
+    @abstractmethod
+    def search(self, match: str, limit: int) -> List[dict]: pass
+
     # Lessons
     @abstractmethod
     def add_lesson(self, lesson: models.Lesson) -> models.Lesson: pass
@@ -19,13 +22,34 @@ class ICourseRepository(ABC):
     @abstractmethod
     def get_lessons_by_course(self, course_id: int) -> List[models.Lesson]: pass
 
+    # Bulk import: one executemany per table, one commit
+    @abstractmethod
+    def bulk_insert_lessons(self, lessons: List[dict]) -> int: pass
+
+    @abstractmethod
+    def bulk_insert_courses(self, courses: List[dict], lessons_per_course: List[List[dict]]) -> List[int]: pass
+
+    # Course view: (course, enrollment, certificate) and (lesson, attendance_count, last_attended_at) rows
+    @abstractmethod
+    def get_course_view(self, course_id: int, user_id: Optional[int] = None) -> Tuple[Optional[tuple], List[tuple]]: pass
+
     # Enrollments
     @abstractmethod
     def get_enrollment(self, user_id: int, course_id: int) -> Optional[models.Enrollment]: pass
     
     @abstractmethod
-    def create_enrollment(self, enrollment: models.Enrollment) -> models.Enrollment: pass
+    def upsert_enrollment(self, user_id: int, course_id: int) -> Optional[models.Enrollment]: pass
     
+    # Bulk enrollment: lookups are chunked to stay under SQLite's bound-parameter limit
+    @abstractmethod
+    def find_user_ids(self, ids: List[int], emails: List[str]) -> Tuple[Set[int], Dict[str, int]]: pass
+
+    @abstractmethod
+    def get_enrolled_user_ids(self, course_id: int) -> Set[int]: pass
+
+    @abstractmethod
+    def bulk_insert_enrollments(self, course_id: int, user_ids: List[int]) -> int: pass
+
     @abstractmethod
     def update_enrollment(self, enrollment: models.Enrollment) -> models.Enrollment: pass
 
@@ -36,6 +60,10 @@ class ICourseRepository(ABC):
     @abstractmethod
     def create_certificate(self, certificate: models.Certificate) -> models.Certificate: pass
 
+    # Background jobs
+    @abstractmethod
+    def create_job(self, job: models.Job) -> models.Job: pass
+
     # Attendance
     @abstractmethod
     def create_attendance(self, attendance: models.Attendance) -> models.Attendance: pass
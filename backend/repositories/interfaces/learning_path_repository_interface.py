@@ -0,0 +1,34 @@
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import List, Optional
+import models
+
+class ILearningPathRepository(ABC):
+    @abstractmethod
+    def create_path(self, path: models.LearningPath, days: List[dict]) -> models.LearningPath: pass
+
+    @abstractmethod
+    def get_path(self, path_id: int) -> Optional[models.LearningPath]: pass
+
+    @abstractmethod
+    def get_user_paths(self, user_id: int) -> List[models.LearningPath]: pass
+
+    # (path, current day or None) per path of the user, in one query
+    @abstractmethod
+    def get_positions(self, user_id: int, active_only: bool = False) -> List[tuple]: pass
+
+    @abstractmethod
+    def find_active_paths(self, user_id: int, course_id: int, topic_keys: List[str]) -> List[models.LearningPath]: pass
+
+    # Marks days up to and including through_day done; returns how many changed
+    @abstractmethod
+    def complete_days(self, path_id: int, through_day: int, source: str, when: datetime) -> int: pass
+
+    @abstractmethod
+    def update_path(self, path: models.LearningPath) -> models.LearningPath: pass
+
+    @abstractmethod
+    def get_user_by_id(self, user_id: int) -> Optional[models.User]: pass
+
+    @abstractmethod
+    def get_course_by_id(self, course_id: int) -> Optional[models.Course]: pass
@@ -0,0 +1,41 @@
+from sqlalchemy.orm import Session
+from sqlalchemy.ext.asyncio import AsyncSession
+
+# Repositories only add/flush; a service wraps each write use case in a unit of work
+# so it commits once (or rolls back everything on error). Blocks may nest; only the
+# outermost one ends the transaction.
+class UnitOfWork:
+    def __init__(self, db: Session):
+        self.db = db
+        self._depth = 0
+
+    def __enter__(self):
+        self._depth += 1
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if self._depth == 0:
+            if exc_type is None:
+                self.db.commit()
+            else:
+                self.db.rollback()
+        return False
+
+class AsyncUnitOfWork:
+    def __init__(self, db: AsyncSession):
+        self.db = db
+        self._depth = 0
+
+    async def __aenter__(self):
+        self._depth += 1
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        self._depth -= 1
+        if self._depth == 0:
+            if exc_type is None:
+                await self.db.commit()
+            else:
+                await self.db.rollback()
+        return False
@@ -1,27 +1,49 @@
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from fastapi.responses import StreamingResponse
-from pydantic import BaseModel
-from services.path_generator import generate_schedule
-from utils.pdf_generator import create_learning_path_pdf
+from pydantic import BaseModel, Field
+from services.learning_path_cache import learning_path_cache, normalize
+from services.path_generator import iter_schedule_ndjson
+from utils.binary_response import binary_response
+from utils.learning_path_limits import LEARNING_PATH_MAX_DAYS, LEARNING_PATH_MAX_TOPIC_LENGTH
+from utils.fast_json import ORJSONResponse
 
 router = APIRouter(prefix="/learning-path", tags=["Learning Path"])
 
 class PathRequest(BaseModel):
-    course_name: str
-    days: int
-    hours_per_day: int
+    course_name: str = Field(min_length=1, max_length=LEARNING_PATH_MAX_TOPIC_LENGTH)
+    days: int = Field(ge=1, le=LEARNING_PATH_MAX_DAYS)
+    hours_per_day: int = Field(ge=1, le=24)
 
+# Schedules and PDFs are built in the CPU pool, never on the event loop, and cached per
+# normalized request (services/learning_path_cache.py)
 @router.post("/generate")
 async def generate_learning_path(request: PathRequest):
-    return generate_schedule(request.course_name, request.days, request.hours_per_day)
+    body = await learning_path_cache.schedule(request.course_name, request.days, request.hours_per_day)
+    return ORJSONResponse(content=body)
 
-@router.post("/download")
-async def download_learning_path_pdf(request: PathRequest):
-    data = generate_schedule(request.course_name, request.days, request.hours_per_day)
-    pdf_buffer = create_learning_path_pdf(data)
-    
+# Same schedule as NDJSON (summary line, then a line per day), produced while it is sent;
+# memory stays flat however long the plan is
+@router.post("/generate/stream")
+def stream_learning_path(request: PathRequest):
     return StreamingResponse(
-        pdf_buffer,
-        media_type="application/pdf",
-        headers={"Content-Disposition": f"attachment; filename={request.course_name}_path.pdf"}
+        iter_schedule_ndjson(*normalize(request.course_name, request.days, request.hours_per_day)),
+        media_type="application/x-ndjson"
     )
+
+async def _pdf_response(http_request: Request, request: PathRequest):
+    pdf, etag = await learning_path_cache.pdf(request.course_name, request.days, request.hours_per_day)
+    # The same request always renders the same bytes, so the content hash is a stable ETag
+    return binary_response(http_request, pdf, "application/pdf", filename=f"{request.course_name}_path.pdf", etag=etag)
+
+@router.post("/download")
+async def download_learning_path_pdf(http_request: Request, request: PathRequest):
+    return await _pdf_response(http_request, request)
+
+# GET twin of /download (query parameters) for clients that revalidate or resume with Range
+@router.get("/download")
+async def download_learning_path_pdf_get(http_request: Request, request: PathRequest = Depends()):
+    return await _pdf_response(http_request, request)
+
+@router.get("/cache/stats")
+def learning_path_cache_stats():
+    return learning_path_cache.stats()
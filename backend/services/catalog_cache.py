@@ -0,0 +1,97 @@
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request, Response
+
+from utils.binary_response import content_etag, etag_matches
+
+# In-process cache of serialized catalog responses (/courses/, /courses/{id}, /courses/{id}/lessons).
+# Every write path in CourseService calls bump(), which moves the version forward so all
+# older entries become misses. The cache is per worker process and bump() only reaches the
+# process that handled the write, so entries also expire after CATALOG_CACHE_TTL seconds:
+# that bounds how long other workers can serve a catalog that changed elsewhere.
+CATALOG_CACHE_MAX_ENTRIES = int(os.getenv("CATALOG_CACHE_MAX_ENTRIES", "1024"))
+CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL", "5"))
+
+class CacheEntry:
+    __slots__ = ("version", "body", "etag", "headers", "expires")
+
+    def __init__(self, version: int, body: bytes, headers: Optional[dict] = None, ttl: float = CATALOG_CACHE_TTL):
+        self.version = version
+        self.body = body
+        self.etag = content_etag(body)
+        self.headers = headers or {}
+        self.expires = time.monotonic() + ttl
+
+class CatalogCache:
+    def __init__(self, max_entries: int = CATALOG_CACHE_MAX_ENTRIES, ttl: float = CATALOG_CACHE_TTL):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.version = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.expired = 0
+        self.not_modified = 0
+
+    def bump(self):
+        with self._lock:
+            self.version += 1
+            self._entries.clear()
+            self.invalidations += 1
+
+    def lookup(self, key) -> Optional[CacheEntry]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.version == self.version:
+                if entry.expires > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return entry
+                del self._entries[key]
+                self.expired += 1
+            self.misses += 1
+            return None
+
+    def store(self, key, version: int, body: bytes, headers: Optional[dict] = None) -> CacheEntry:
+        # version is the one read before loading from the DB; if a write bumped it
+        # meanwhile, the entry is returned to the caller but not kept.
+        entry = CacheEntry(version, body, headers, self.ttl)
+        with self._lock:
+            if version == self.version:
+                self._entries[key] = entry
+                self._entries.move_to_end(key)
+                while len(self._entries) > self.max_entries:
+                    self._entries.popitem(last=False)
+        return entry
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "version": self.version,
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "ttl_seconds": self.ttl,
+                "bytes": sum(len(entry.body) for entry in self._entries.values()),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "not_modified": self.not_modified,
+                "invalidations": self.invalidations,
+                "expired": self.expired,
+            }
+
+catalog_cache = CatalogCache()
+
+def cached_json_response(request: Request, entry: CacheEntry) -> Response:
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache", **entry.headers}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        catalog_cache.not_modified += 1
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
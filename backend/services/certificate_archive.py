@@ -0,0 +1,96 @@
+import os
+import zipfile
+from collections import deque
+from datetime import datetime
+
+from fastapi.responses import StreamingResponse
+
+from services.certificate_store import certificate_store, render_certificate, store_key
+from services.cpu_executor import cpu_executor
+
+# ZIP of every certificate of a course, streamed as it is built: stored PDFs are copied
+# straight from the certificate store (one directory listing per archive), missing ones are rendered in the CPU pool with up to
+# ARCHIVE_RENDER_WINDOW renders in flight, and each entry is sent as soon as it is written.
+# Memory stays bounded by the window and the copy chunk size, whatever the cohort size.
+ARCHIVE_RENDER_WINDOW = int(os.getenv("ARCHIVE_RENDER_WINDOW", "8"))
+ARCHIVE_CHUNK_SIZE = 64 * 1024
+
+class _ZipSink:
+    # Write-only target for ZipFile; without tell()/seek() it writes a streamable archive
+    def __init__(self):
+        self._chunks = []
+
+    def write(self, data) -> int:
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def drain(self) -> bytes:
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+    def output(self):
+        # Whatever the archive wrote since the last call, as at most one non-empty chunk
+        data = self.drain()
+        if data:
+            yield data
+
+def _resolve(course_title, item):
+    # (code, issued_date, path, error): the stored PDF, rendered now if needed
+    code, fullname, issued_date, path, future = item
+    try:
+        if path is not None and os.path.exists(path):
+            return code, issued_date, path, None
+        if future is None:
+            # Evicted since the lookup
+            future = cpu_executor.submit(render_certificate, code, fullname, course_title, issued_date)
+        return code, issued_date, certificate_store.put(code, future.result(cpu_executor.timeout)).path, None
+    except Exception as e:
+        return code, issued_date, None, f"{type(e).__name__}: {e}"
+
+def _certificate_files(rows, course_title, window):
+    # Yields _resolve() results in row order, keeping up to `window` renders running
+    pending = deque()
+    stored_keys = certificate_store.stored_keys()
+    for code, fullname, issued_date in rows:
+        path, future = None, None
+        if store_key(code) in stored_keys:
+            path = certificate_store.path_for(code)
+        else:
+            future = cpu_executor.submit(render_certificate, code, fullname, course_title, issued_date)
+        pending.append((code, fullname, issued_date, path, future))
+        while pending and (len(pending) >= window or pending[0][4] is None or pending[0][4].done()):
+            yield _resolve(course_title, pending.popleft())
+    while pending:
+        yield _resolve(course_title, pending.popleft())
+
+def iter_certificate_archive(rows, course_title: str, window: int = ARCHIVE_RENDER_WINDOW):
+    sink = _ZipSink()
+    failed = []
+    # PDFs are already compressed; storing them keeps the stream cheap to produce
+    with zipfile.ZipFile(sink, "w", compression=zipfile.ZIP_STORED) as archive:
+        for code, issued_date, path, error in _certificate_files(rows, course_title, window):
+            if error:
+                # A render that failed or timed out is listed instead of aborting the download
+                failed.append(f"{code}: {error}")
+                continue
+            info = zipfile.ZipInfo(f"Certificate-{code}.pdf", date_time=(issued_date or datetime.utcnow()).timetuple()[:6])
+            with archive.open(info, "w") as entry, open(path, "rb") as pdf:
+                while chunk := pdf.read(ARCHIVE_CHUNK_SIZE):
+                    entry.write(chunk)
+                    yield from sink.output()
+            yield from sink.output()
+        if failed:
+            archive.writestr("FAILED.txt", "\n".join(failed) + "\n")
+    yield from sink.output()
+
+def certificate_archive_response(course, rows) -> StreamingResponse:
+    # Sync generator: Starlette iterates it in the threadpool, so both route flavours can use it
+    return StreamingResponse(
+        iter_certificate_archive(rows, course.title),
+        media_type="application/zip",
+        headers={"Content-Disposition": f'attachment; filename="course-{course.id}-certificates.zip"'}
+    )
@@ -0,0 +1,168 @@
+import json
+import os
+import time
+from datetime import datetime
+
+from sqlalchemy import func, select
+
+from database import BASE_DIR, SessionLocal
+from services.certificate_index import index_rows_statement
+from services.certificate_store import certificate_store, render_certificate, store_key
+import models
+
+# Renders certificate PDFs into the certificate store for rows that have none (seed scripts,
+# imports) or, with force, for every row (after a template change). Rows are read in keyset
+# batches (id > last_id) up to the highest id present when the run started; certificates
+# issued later are rendered by the job queue. After each batch the position and counters are
+# written to a JSON checkpoint, so an interrupted run continues where it stopped. Running
+# servers pick the new files up from the shared store directory (see certificate_store.py);
+# the checkpoint is kept outside it. The store directory is listed once per run and rows are
+# checked against that set of keys, so a run does not look up the store per row.
+BACKFILL_BATCH_SIZE = int(os.getenv("BACKFILL_BATCH_SIZE", "500"))
+BACKFILL_CHECKPOINT = os.getenv("BACKFILL_CHECKPOINT", os.path.join(BASE_DIR, "backfill-checkpoint.json"))
+# Certificates per pool task: a render takes ~0.1 ms, so one task per PDF would be mostly IPC
+BACKFILL_CHUNK_SIZE = int(os.getenv("BACKFILL_CHUNK_SIZE", "50"))
+MAX_FAILED_CODES = 1000
+
+def batch_statement(after_id: int, until_id: int, limit: int):
+    return index_rows_statement(after_id).where(models.Certificate.id <= until_id).limit(limit)
+
+def new_checkpoint(db, from_id: int = 0, force: bool = False) -> dict:
+    until_id = db.execute(select(func.max(models.Certificate.id))).scalar() or 0
+    return {
+        "until_id": until_id,
+        "last_id": from_id,
+        "force": force,
+        "rendered": 0,
+        "skipped": 0,
+        "failed": 0,
+        "failed_codes": [],
+        "elapsed_s": 0.0,
+        "done": False,
+    }
+
+def load_checkpoint(path: str):
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+def save_checkpoint(path: str, checkpoint: dict):
+    # Write then rename so a crash mid-write leaves the previous checkpoint intact
+    checkpoint["updated_at"] = datetime.utcnow().isoformat()
+    directory = os.path.dirname(path) or "."
+    os.makedirs(directory, exist_ok=True)
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(checkpoint, f, indent=2)
+    os.replace(tmp_path, path)
+
+def _remaining(db, checkpoint: dict) -> int:
+    return db.execute(
+        select(func.count(models.Certificate.id))
+        .where(models.Certificate.id > checkpoint["last_id"], models.Certificate.id <= checkpoint["until_id"])
+    ).scalar()
+
+def render_chunk(items) -> list:
+    # Pool task: [(code, fullname, course_title, issued_date)] -> [(code, pdf bytes or None, error)]
+    results = []
+    for code, fullname, title, issued_date in items:
+        try:
+            results.append((code, render_certificate(code, fullname, title, issued_date), None))
+        except Exception as e:
+            results.append((code, None, f"{type(e).__name__}: {e}"))
+    return results
+
+def _failed(checkpoint: dict, code: str, error: str):
+    checkpoint["failed"] += 1
+    if len(checkpoint["failed_codes"]) < MAX_FAILED_CODES:
+        checkpoint["failed_codes"].append(f"{code}: {error}")
+
+def _is_stored(checkpoint: dict, stored_keys: set, code: str) -> bool:
+    return not checkpoint["force"] and store_key(code) in stored_keys
+
+def _render_batch(rows, executor, store, stored_keys: set, checkpoint: dict, chunk_size: int):
+    # Every missing PDF of the batch is submitted at once (in chunks); the pool works through
+    # them while results are collected and written to the store in row order
+    items = []
+    for cert_id, code, issued_date, user_id, fullname, course_id, title in rows:
+        if _is_stored(checkpoint, stored_keys, code):
+            checkpoint["skipped"] += 1
+            continue
+        items.append((code, fullname, title, issued_date))
+    chunks = [items[i:i + chunk_size] for i in range(0, len(items), chunk_size)]
+    futures = [(chunk, executor.submit(render_chunk, chunk)) for chunk in chunks]
+    for chunk, future in futures:
+        try:
+            results = future.result(executor.timeout)
+        except Exception as e:
+            for code, *_ in chunk:
+                _failed(checkpoint, code, f"{type(e).__name__}: {e}")
+            continue
+        for code, pdf, error in results:
+            if error is not None:
+                _failed(checkpoint, code, error)
+                continue
+            store.put(code, pdf)
+            checkpoint["rendered"] += 1
+
+def run_backfill(checkpoint: dict, executor, store=certificate_store, session_factory=SessionLocal,
+                 batch_size: int = BACKFILL_BATCH_SIZE, chunk_size: int = BACKFILL_CHUNK_SIZE, checkpoint_path: str = None, dry_run: bool = False,
+                 report=print) -> dict:
+    # Dry runs only count what would be rendered and never touch the store or the checkpoint file
+    db = session_factory()
+    try:
+        total = _remaining(db, checkpoint)
+        report(f"{total} certificates to scan (id {checkpoint['last_id'] + 1}..{checkpoint['until_id']}, "
+               f"{'all' if checkpoint['force'] else 'missing PDFs only'}{', dry run' if dry_run else ''})")
+        verb = "would render" if dry_run else "rendered"
+        scanned = 0
+        started = time.perf_counter()
+        elapsed_before = checkpoint["elapsed_s"]
+        stored_keys = set() if checkpoint["force"] else store.stored_keys()
+        while True:
+            rows = db.execute(batch_statement(checkpoint["last_id"], checkpoint["until_id"], batch_size)).all()
+            if not rows:
+                break
+            batch_started = time.perf_counter()
+            rendered_before, failed_before = checkpoint["rendered"], checkpoint["failed"]
+            if dry_run:
+                for row in rows:
+                    if _is_stored(checkpoint, stored_keys, row[1]):
+                        checkpoint["skipped"] += 1
+                    else:
+                        checkpoint["rendered"] += 1
+            else:
+                _render_batch(rows, executor, store, stored_keys, checkpoint, chunk_size)
+            checkpoint["last_id"] = rows[-1][0]
+            checkpoint["elapsed_s"] = elapsed_before + time.perf_counter() - started
+            if checkpoint_path and not dry_run:
+                save_checkpoint(checkpoint_path, checkpoint)
+
+            scanned += len(rows)
+            elapsed = time.perf_counter() - started
+            rendered = checkpoint["rendered"] - rendered_before
+            failed = checkpoint["failed"] - failed_before
+            batch_s = time.perf_counter() - batch_started
+            eta = (total - scanned) * elapsed / scanned
+            report(f"[{scanned}/{total}] id <= {checkpoint['last_id']}: {rendered} {verb}, {failed} failed "
+                   f"in {batch_s:.2f}s ({rendered / batch_s if batch_s else 0:.0f}/s), "
+                   f"{scanned / elapsed:.0f} rows/s overall, ETA {eta:.0f}s")
+        checkpoint["done"] = True
+        if checkpoint_path and not dry_run:
+            save_checkpoint(checkpoint_path, checkpoint)
+    finally:
+        db.close()
+
+    report(f"Done: {verb} {checkpoint['rendered']}, skipped {checkpoint['skipped']} (PDF stored), "
+           f"failed {checkpoint['failed']} in {checkpoint['elapsed_s']:.1f}s")
+    if checkpoint["rendered"] and not dry_run:
+        report(f"Throughput: {checkpoint['rendered'] / checkpoint['elapsed_s']:.0f} PDFs/s")
+    for line in checkpoint["failed_codes"]:
+        report(f"  failed {line}")
+    stats = store.stats()
+    if stats["evictions"]:
+        report(f"Warning: the store evicted {stats['evictions']} PDFs to stay under "
+               f"{stats['max_bytes']} bytes; raise CERTIFICATE_STORE_MAX_BYTES to keep them all")
+    return checkpoint
@@ -0,0 +1,164 @@
+import asyncio
+import logging
+import os
+import re
+import threading
+import time
+from typing import Optional
+
+from sqlalchemy import select
+
+from database import SessionLocal
+from utils import fast_json
+import models
+
+# In-memory index of issued certificate codes for GET /certificates/verify/{code}.
+# Loaded once per process, then kept current with keyset catch-up queries (id > max_id):
+# issuing a certificate marks the index stale so the next unknown code triggers one right
+# away; otherwise unknown codes trigger at most one query per CERTIFICATE_INDEX_SYNC_SECONDS,
+# which also picks up certificates issued by other processes. Bogus codes never query the DB
+# more often than that. Holder names and course titles are stored once per user / course.
+# Catch-up only sees new rows, so the whole index is also rebuilt in the background every
+# CERTIFICATE_INDEX_RELOAD_SECONDS: deleted certificates stop verifying and renamed courses or
+# holders (changed in any process) show up within that interval.
+CERTIFICATE_INDEX_SYNC_SECONDS = float(os.getenv("CERTIFICATE_INDEX_SYNC_SECONDS", "1.0"))
+CERTIFICATE_INDEX_RELOAD_SECONDS = float(os.getenv("CERTIFICATE_INDEX_RELOAD_SECONDS", "300"))
+
+logger = logging.getLogger(__name__)
+
+_CODE = re.compile(r"^[A-Za-z0-9_-]{1,100}$")
+
+def index_rows_statement(after_id: int = 0):
+    return (
+        select(
+            models.Certificate.id, models.Certificate.certificate_code, models.Certificate.issued_date,
+            models.User.id, models.User.fullname, models.Course.id, models.Course.title
+        )
+        .join(models.User, models.User.id == models.Certificate.user_id)
+        .join(models.Course, models.Course.id == models.Certificate.course_id)
+        .where(models.Certificate.id > after_id)
+        .order_by(models.Certificate.id)
+    )
+
+def _add_rows(rows, entries: dict, names: dict, titles: dict) -> int:
+    # Returns the highest certificate id among rows
+    max_id = 0
+    for cert_id, code, issued_date, user_id, fullname, course_id, title in rows:
+        entries[code] = (user_id, course_id, issued_date.isoformat() if issued_date else None)
+        names[user_id] = fullname
+        titles[course_id] = title
+        max_id = max(max_id, cert_id)
+    return max_id
+
+class CertificateIndex:
+    def __init__(self, session_factory=SessionLocal, sync_seconds: float = CERTIFICATE_INDEX_SYNC_SECONDS,
+                 reload_seconds: float = CERTIFICATE_INDEX_RELOAD_SECONDS):
+        self.session_factory = session_factory
+        self.sync_seconds = sync_seconds
+        self.reload_seconds = reload_seconds
+        self._entries = {}  # code -> (user_id, course_id, issued_date ISO string)
+        self._names = {}  # user_id -> fullname
+        self._titles = {}  # course_id -> title
+        self.max_id = 0
+        self.loaded = False
+        self._stale = True
+        self._next_sync = 0.0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.rejects = 0
+        self.syncs = 0
+        self.reloads = 0
+
+    def _rows(self, after_id: int):
+        db = self.session_factory()
+        try:
+            return db.execute(index_rows_statement(after_id)).all()
+        finally:
+            db.close()
+
+    def sync(self):
+        # Full load the first time, then only certificates newer than the last one seen
+        rows = self._rows(self.max_id)
+        with self._lock:
+            self.max_id = max(self.max_id, _add_rows(rows, self._entries, self._names, self._titles))
+            self.loaded = True
+            self.syncs += 1
+
+    def reload(self):
+        # Rebuilt aside and swapped in, so lookups keep being served from the old index meanwhile.
+        # Rows a concurrent catch-up added past this snapshot come back with the next one.
+        entries, names, titles = {}, {}, {}
+        max_id = _add_rows(self._rows(0), entries, names, titles)
+        with self._lock:
+            self._entries, self._names, self._titles = entries, names, titles
+            self.max_id = max_id
+            self.loaded = True
+            self.reloads += 1
+
+    async def reload_periodically(self):
+        # Runs for the life of the app (started from the lifespan handler)
+        from starlette.concurrency import run_in_threadpool
+        while True:
+            await asyncio.sleep(self.reload_seconds)
+            try:
+                await run_in_threadpool(self.reload)
+            except Exception:
+                logger.exception("Certificate index reload failed")
+
+    def should_sync(self, code: str) -> bool:
+        # Called on a miss; claims the next catch-up so concurrent misses share one query.
+        # Strings that cannot be a certificate code never cause one.
+        if not _CODE.match(code):
+            return False
+        with self._lock:
+            now = time.monotonic()
+            if not self._stale and now < self._next_sync:
+                return False
+            self._stale = False
+            self._next_sync = now + self.sync_seconds
+            return True
+
+    def mark_stale(self):
+        # After a certificate commit in this process
+        self._stale = True
+
+    def rename_user(self, user_id: int, fullname: str):
+        with self._lock:
+            if user_id in self._names:
+                self._names[user_id] = fullname
+
+    def contains(self, code: str) -> bool:
+        # Known issued code (no stats, no DB); False may also mean "issued after the last sync"
+        return code in self._entries
+
+    def lookup(self, code: str) -> Optional[bytes]:
+        # Serialized verification result, or None when the code is unknown (so far)
+        entry = self._entries.get(code)
+        if entry is None:
+            self.rejects += 1
+            return None
+        self.hits += 1
+        user_id, course_id, issued_date = entry
+        return fast_json.dumps({
+            "valid": True,
+            "certificate_code": code,
+            "holder": self._names.get(user_id),
+            "course": self._titles.get(course_id),
+            "issued_date": issued_date,
+        })
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "loaded": self.loaded,
+                "codes": len(self._entries),
+                "holders": len(self._names),
+                "courses": len(self._titles),
+                "max_id": self.max_id,
+                "hits": self.hits,
+                "rejects": self.rejects,
+                "syncs": self.syncs,
+                "reloads": self.reloads,
+            }
+
+certificate_index = CertificateIndex()
@@ -0,0 +1,27 @@
+from dtos import schemas
+import models
+from repositories.implementations.certificate_repository import CertificateRepository
+from services.certificate_store import render_and_store
+from services.job_queue import PermanentJobError, handler, new_job
+
+# Certificate PDFs are rendered by the job workers instead of inside the request that issues them
+RENDER_CERTIFICATE = "certificate.render"
+
+def render_certificate_job(certificate_code: str) -> models.Job:
+    return new_job(RENDER_CERTIFICATE, {"certificate_code": certificate_code})
+
+@handler(RENDER_CERTIFICATE)
+def render_certificate(db, payload: dict) -> dict:
+    repo = CertificateRepository(db)
+    cert = repo.get_by_code(payload["certificate_code"])
+    if not cert:
+        raise PermanentJobError(f"certificate {payload['certificate_code']} not found")
+    user = repo.get_user_by_id(cert.user_id)
+    course = repo.get_course_by_id(cert.course_id)
+    stored = render_and_store(cert.certificate_code, user.fullname, course.title, cert.issued_date)
+    return {"certificate_code": cert.certificate_code, "bytes": stored.size, "etag": stored.etag}
+
+def issue_response(cert: models.Certificate, job: models.Job) -> schemas.CertificateIssueResponse:
+    response = schemas.CertificateIssueResponse.model_validate(cert)
+    response.render_job_id = job.id
+    return response
@@ -0,0 +1,273 @@
+import hashlib
+import os
+import re
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Optional
+
+from fastapi import Request, Response
+
+from database import BASE_DIR
+from utils.binary_response import file_response
+
+# Rendered certificate PDFs on disk, one file per certificate named <code>.pdf. Files are
+# written once at issue time and served as-is; when the store grows past
+# CERTIFICATE_STORE_MAX_BYTES the least recently served files are deleted and get
+# re-rendered on their next download. The directory is shared by every process (API
+# workers, job workers, the backfill CLI); each keeps an index of it (content hash, stat)
+# that is only a shortcut: a lookup is one stat of the certificate's own file, and the file
+# is hashed again only when it was replaced since. Whole-directory scans happen once per
+# process and then at most every CERTIFICATE_STORE_RESCAN_SECONDS to enforce the size cap,
+# never per lookup and never while holding the index lock.
+CERTIFICATE_STORE_DIR = os.getenv("CERTIFICATE_STORE_DIR", os.path.join(BASE_DIR, "certificate_store"))
+CERTIFICATE_STORE_MAX_BYTES = int(os.getenv("CERTIFICATE_STORE_MAX_BYTES", str(512 * 1024 * 1024)))
+CERTIFICATE_STORE_RESCAN_SECONDS = float(os.getenv("CERTIFICATE_STORE_RESCAN_SECONDS", "30"))
+
+# The download URL has no content hash and its bytes change when a certificate is rendered
+# again (template change, backfill --force), so clients revalidate every time; with the
+# ETag that is a 304 without a body when nothing changed
+CERTIFICATE_CACHE_CONTROL = "no-cache"
+
+_SAFE_CODE = re.compile(r"^[A-Za-z0-9_-]{1,100}$")
+_FILE_NAME = re.compile(r"^(?P<key>[A-Za-z0-9_-]+)\.pdf$")
+# Earlier layout, <key>.<content hash>.pdf; renamed to <key>.pdf by the first scan
+_LEGACY_FILE_NAME = re.compile(r"^(?P<key>[A-Za-z0-9_-]+)\.[0-9a-f]{32}\.pdf$")
+
+def store_key(code: str) -> str:
+    # Codes are used as file names; anything unusual is hashed instead
+    if _SAFE_CODE.match(code):
+        return code
+    return "h" + hashlib.blake2b(code.encode(), digest_size=16).hexdigest()
+
+def _digest(pdf: bytes) -> str:
+    return hashlib.blake2b(pdf, digest_size=16).hexdigest()
+
+def _same_file(a: os.stat_result, b: os.stat_result) -> bool:
+    # Files are replaced by rename, so a rewrite always changes the inode
+    return (a.st_ino, a.st_size, a.st_mtime_ns) == (b.st_ino, b.st_size, b.st_mtime_ns)
+
+class StoredCertificate:
+    __slots__ = ("path", "size", "digest", "etag", "stat")
+
+    def __init__(self, path: str, digest: Optional[str], stat: os.stat_result):
+        # digest is None for files only seen in a directory scan (hashed when first served)
+        self.path = path
+        self.size = stat.st_size
+        self.digest = digest
+        self.etag = f'"{digest}"' if digest else None
+        self.stat = stat
+
+class CertificateStore:
+    def __init__(self, directory: str = CERTIFICATE_STORE_DIR, max_bytes: int = CERTIFICATE_STORE_MAX_BYTES,
+                 rescan_seconds: float = CERTIFICATE_STORE_RESCAN_SECONDS):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.rescan_seconds = rescan_seconds
+        self._entries = OrderedDict()  # key -> StoredCertificate, least recently used first
+        self._bytes = 0
+        self._scanned_at = None
+        self._scanning = False
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.writes = 0
+        self.evictions = 0
+        self.scans = 0
+
+    def path_for(self, code: str) -> str:
+        return os.path.join(self.directory, f"{store_key(code)}.pdf")
+
+    def _scan(self) -> dict:
+        # key -> stat of every stored file; renames files left in the earlier layout
+        os.makedirs(self.directory, exist_ok=True)
+        found, legacy = {}, []
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                try:
+                    match = _FILE_NAME.match(entry.name)
+                    if match and entry.is_file():
+                        found[match["key"]] = entry.stat()
+                    elif _LEGACY_FILE_NAME.match(entry.name):
+                        legacy.append((entry.stat().st_mtime, entry.name, entry.path))
+                except FileNotFoundError:
+                    pass  # evicted by another process while listing
+        renamed = set()
+        for _, name, path in sorted(legacy):  # oldest first, so the newest old rendering wins
+            key = _LEGACY_FILE_NAME.match(name)["key"]
+            try:
+                if key in found and key not in renamed:
+                    self._unlink(path)  # already written in the current layout
+                    continue
+                target = os.path.join(self.directory, f"{key}.pdf")
+                os.replace(path, target)
+                found[key] = os.stat(target)
+                renamed.add(key)
+            except FileNotFoundError:
+                pass
+        self.scans += 1
+        return found
+
+    def stored_keys(self) -> set:
+        # Keys of every certificate on disk, from one directory listing (for bulk callers:
+        # test `store_key(code) in keys` instead of a lookup per row)
+        return set(self._scan())
+
+    def _sync_if_due(self):
+        # Rebuild the index from the directory: files written by other processes are added
+        # (as least recently used), files they removed are dropped, and our own recency order
+        # is kept for the rest. The listing runs outside the lock, by one thread at a time.
+        with self._lock:
+            due = self._scanned_at is None or time.monotonic() - self._scanned_at >= self.rescan_seconds
+            if not due or self._scanning:
+                return
+            self._scanning = True
+        try:
+            on_disk = self._scan()
+            with self._lock:
+                path = lambda key: os.path.join(self.directory, f"{key}.pdf")
+                entries = OrderedDict(
+                    (key, StoredCertificate(path(key), None, stat))
+                    for key, stat in sorted(on_disk.items(), key=lambda item: item[1].st_mtime)
+                    if key not in self._entries
+                )
+                for key, stored in self._entries.items():
+                    if key in on_disk:
+                        same = _same_file(stored.stat, on_disk[key])
+                        entries[key] = stored if same else StoredCertificate(path(key), None, on_disk[key])
+                self._entries = entries
+                self._bytes = sum(stored.size for stored in entries.values())
+                self._scanned_at = time.monotonic()
+        finally:
+            with self._lock:
+                self._scanning = False
+
+    def _replace(self, key, stored):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+        self._entries[key] = stored
+        self._bytes += stored.size
+
+    def _drop(self, key):
+        old = self._entries.pop(key, None)
+        if old is not None:
+            self._bytes -= old.size
+
+    def _unlink(self, path):
+        try:
+            os.unlink(path)
+        except FileNotFoundError:
+            pass
+
+    def _evict(self, keep: str):
+        # Least recently used first, never the entry that was just written; the files are
+        # deleted after the lock is released
+        paths = []
+        with self._lock:
+            while self._bytes > self.max_bytes and len(self._entries) > 1:
+                key, stored = next(iter(self._entries.items()))
+                if key == keep:
+                    self._entries.move_to_end(key)
+                    continue
+                self._drop(key)
+                paths.append(stored.path)
+                self.evictions += 1
+        for path in paths:
+            self._unlink(path)
+
+    def get(self, code: str) -> Optional[StoredCertificate]:
+        if self._scanned_at is None:
+            self._sync_if_due()  # once per process: picks up and converts existing files
+        key = store_key(code)
+        path = self.path_for(code)
+        try:
+            stat = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                # Removed behind our back (evicted by another process, manual cleanup) or never stored
+                self._drop(key)
+                self.misses += 1
+            return None
+        with self._lock:
+            stored = self._entries.get(key)
+            if stored is not None and stored.digest and _same_file(stored.stat, stat):
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return stored
+        # Written or replaced by another process since we last looked: hash it, unlocked
+        try:
+            with open(path, "rb") as f:
+                stored = StoredCertificate(path, _digest(f.read()), os.fstat(f.fileno()))
+        except FileNotFoundError:
+            with self._lock:
+                self.misses += 1
+            return None
+        with self._lock:
+            self._replace(key, stored)
+            self.disk_hits += 1
+        return stored
+
+    def put(self, code: str, pdf: bytes) -> StoredCertificate:
+        key = store_key(code)
+        path = self.path_for(code)
+        os.makedirs(self.directory, exist_ok=True)
+        # Write to a temp file and rename so readers never see a partial PDF
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                f.write(pdf)
+            os.replace(tmp_path, path)
+        except BaseException:
+            self._unlink(tmp_path)
+            raise
+        stored = StoredCertificate(path, _digest(pdf), os.stat(path))
+        with self._lock:
+            self._replace(key, stored)
+            self.writes += 1
+        # The cap is for the whole directory, whichever process wrote the files
+        self._sync_if_due()
+        self._evict(keep=key)
+        return stored
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.disk_hits + self.misses
+            return {
+                "directory": self.directory,
+                "files": len(self._entries),
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "disk_hits": self.disk_hits,
+                "misses": self.misses,
+                "hit_rate": round((self.hits + self.disk_hits) / lookups, 4) if lookups else 0.0,
+                "writes": self.writes,
+                "evictions": self.evictions,
+                "scans": self.scans,
+            }
+
+certificate_store = CertificateStore()
+
+def render_certificate(code, fullname, course_title, issued_date) -> bytes:
+    from utils.pdf_generator import generate_certificate_pdf
+    return generate_certificate_pdf(fullname, course_title, str(issued_date), code).getvalue()
+
+# Rendering runs in the CPU pool; only the file write happens in the caller
+def render_and_store(code, fullname, course_title, issued_date) -> StoredCertificate:
+    from services.cpu_executor import cpu_executor
+    pdf = cpu_executor.run(render_certificate, code, fullname, course_title, issued_date)
+    return certificate_store.put(code, pdf)
+
+async def render_and_store_async(code, fullname, course_title, issued_date) -> StoredCertificate:
+    from services.cpu_executor import cpu_executor
+    pdf = await cpu_executor.run_async(render_certificate, code, fullname, course_title, issued_date)
+    return certificate_store.put(code, pdf)
+
+def certificate_file_response(request: Request, stored: StoredCertificate, code: str) -> Response:
+    return file_response(
+        request, stored.path, stored.etag, "application/pdf", filename=f"Certificate-{code}.pdf",
+        cache_control=CERTIFICATE_CACHE_CONTROL, stat_result=stored.stat
+    )
@@ -0,0 +1,182 @@
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from concurrent.futures import BrokenExecutor, Future, ProcessPoolExecutor, TimeoutError as FutureTimeout
+
+from fastapi import HTTPException
+
+# Shared process pool for CPU bound work (PDF rendering, schedule generation, password
+# hashing) so it neither blocks the event loop nor holds the GIL against request threads.
+# Tasks must be module level functions with picklable arguments and results.
+# CPU_WORKERS=0 runs tasks inline instead (in the calling thread / the threadpool).
+CPU_WORKERS = int(os.getenv("CPU_WORKERS", str(min(4, os.cpu_count() or 1))))
+CPU_TASK_TIMEOUT = float(os.getenv("CPU_TASK_TIMEOUT", "30"))
+# spawn: forking a process that already runs threads (uvicorn, job workers) is unsafe
+CPU_START_METHOD = os.getenv("CPU_START_METHOD", "spawn")
+# Workers run at a lower priority so the request serving process wins when cores are short
+CPU_WORKER_NICE = int(os.getenv("CPU_WORKER_NICE", "10"))
+# A task nobody waits for any more (timed out, client gone) keeps running; if it is still
+# running this many seconds later its worker is considered stuck and the pool is recycled
+CPU_STUCK_AFTER = float(os.getenv("CPU_STUCK_AFTER", "60"))
+
+def _init_worker(niceness):
+    if niceness and hasattr(os, "nice"):
+        os.nice(niceness)
+
+class CpuExecutor:
+    def __init__(self, workers: int = CPU_WORKERS, timeout: float = CPU_TASK_TIMEOUT,
+                 start_method: str = CPU_START_METHOD, stuck_after: float = CPU_STUCK_AFTER):
+        self.workers = workers
+        self.timeout = timeout
+        self.start_method = start_method
+        self.stuck_after = stuck_after
+        self._pool = None
+        self._abandoned = {}  # running future nobody waits for -> (pool, stuck deadline)
+        self._lock = threading.Lock()
+        self.submitted = 0
+        self.timeouts = 0
+        self.cancelled = 0
+        self.abandoned = 0
+        self.restarts = 0
+
+    def _get_pool(self) -> ProcessPoolExecutor:
+        with self._lock:
+            if self._pool is None:
+                self._pool = ProcessPoolExecutor(
+                    self.workers, mp_context=multiprocessing.get_context(self.start_method),
+                    initializer=_init_worker, initargs=(CPU_WORKER_NICE,)
+                )
+            self.submitted += 1
+            return self._pool
+
+    def start(self):
+        # Spawn the worker processes up front instead of on the first request
+        if self.workers:
+            pool = self._get_pool()
+            list(pool.map(abs, range(self.workers)))
+
+    def shutdown(self):
+        with self._lock:
+            pool, self._pool = self._pool, None
+        if pool is not None:
+            pool.shutdown(wait=True, cancel_futures=True)
+
+    def _discard(self, pool):
+        with self._lock:
+            if self._pool is pool:
+                self._pool = None
+
+    def _submit(self, fn, args):
+        # The pool can be replaced between lookup and submit (a stuck worker was killed)
+        self._recycle_stuck()
+        for attempt in range(2):
+            pool = self._get_pool()
+            try:
+                return pool, pool.submit(fn, *args)
+            except (BrokenExecutor, RuntimeError):
+                if attempt:
+                    raise
+                self._discard(pool)
+
+    def _abandon(self, pool, future):
+        # Only this task is given up on. A queued task is simply dropped; a running one cannot
+        # be stopped without killing its worker (and every other task in the pool with it), so
+        # it is left to finish and its result discarded.
+        if future.cancel():
+            self.cancelled += 1
+            return
+        with self._lock:
+            self.abandoned += 1
+            self._abandoned[future] = (pool, time.monotonic() + self.stuck_after)
+        future.add_done_callback(self._forget)
+
+    def _forget(self, future):
+        with self._lock:
+            self._abandoned.pop(future, None)
+
+    def _recycle_stuck(self):
+        # An abandoned task still running past its deadline holds a worker for good: replace
+        # the pool and terminate the old processes. Tasks caught in the old pool see
+        # BrokenExecutor and are resubmitted once by run().
+        now = time.monotonic()
+        with self._lock:
+            pool = self._pool
+            if pool is None or not any(
+                owner is pool and deadline <= now for owner, deadline in self._abandoned.values()
+            ):
+                return
+            self._pool = None
+            self.restarts += 1
+            self._abandoned = {f: entry for f, entry in self._abandoned.items() if entry[0] is not pool}
+        processes = list((getattr(pool, "_processes", None) or {}).values())
+        pool.shutdown(wait=False, cancel_futures=True)
+        for process in processes:
+            process.terminate()
+
+    def submit(self, fn, *args) -> Future:
+        # For callers that keep several tasks in flight; wait with future.result(self.timeout)
+        if not self.workers:
+            future = Future()
+            try:
+                future.set_result(fn(*args))
+            except Exception as e:
+                future.set_exception(e)
+            return future
+        return self._submit(fn, args)[1]
+
+    def run(self, fn, *args, timeout: float = None):
+        if not self.workers:
+            return fn(*args)
+        timeout = self.timeout if timeout is None else timeout
+        for attempt in range(2):
+            pool, future = self._submit(fn, args)
+            try:
+                return future.result(timeout)
+            except FutureTimeout:
+                self.timeouts += 1
+                self._abandon(pool, future)
+                raise HTTPException(status_code=503, detail="Task timed out")
+            except BrokenExecutor:
+                if attempt:
+                    raise
+                self._discard(pool)
+
+    async def run_async(self, fn, *args, timeout: float = None):
+        if not self.workers:
+            from starlette.concurrency import run_in_threadpool
+            return await run_in_threadpool(fn, *args)
+        timeout = self.timeout if timeout is None else timeout
+        for attempt in range(2):
+            pool, future = self._submit(fn, args)
+            try:
+                return await asyncio.wait_for(asyncio.wrap_future(future), timeout)
+            except asyncio.TimeoutError:
+                self.timeouts += 1
+                self._abandon(pool, future)
+                raise HTTPException(status_code=503, detail="Task timed out")
+            except asyncio.CancelledError:
+                # The request went away (client disconnect, shutdown)
+                self._abandon(pool, future)
+                raise
+            except BrokenExecutor:
+                if attempt:
+                    raise
+                self._discard(pool)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "workers": self.workers,
+                "running": self._pool is not None,
+                "timeout_s": self.timeout,
+                "submitted": self.submitted,
+                "timeouts": self.timeouts,
+                "cancelled": self.cancelled,
+                "abandoned": self.abandoned,
+                "running_abandoned": len(self._abandoned),
+                "restarts": self.restarts,
+            }
+
+cpu_executor = CpuExecutor()
@@ -0,0 +1,76 @@
+from services.interfaces.certificate_service_interface import ICertificateService
+from repositories.interfaces.certificate_repository_interface import ICertificateRepository
+from repositories.unit_of_work import AsyncUnitOfWork
+from dtos import schemas
+import models
+from fastapi import HTTPException
+from services.certificate_store import StoredCertificate, certificate_store, render_and_store_async
+from services.certificate_jobs import issue_response, render_certificate_job
+from services.job_queue import job_queue
+from services.certificate_index import certificate_index
+import uuid
+
+class AsyncCertificateService(ICertificateService):
+    def __init__(self, cert_repo: ICertificateRepository, uow: AsyncUnitOfWork):
+        self.cert_repo = cert_repo
+        self.uow = uow
+
+    async def get_certificate_file(self, certificate_code: str) -> StoredCertificate:
+        cert = None
+        if not certificate_index.contains(certificate_code):
+            cert = await self.cert_repo.get_by_code(certificate_code)
+            if not cert:
+                raise HTTPException(status_code=404, detail="Certificate not found")
+
+        stored = certificate_store.get(certificate_code)
+        if stored:
+            return stored
+
+        if cert is None:
+            cert = await self.cert_repo.get_by_code(certificate_code)
+            if not cert:
+                raise HTTPException(status_code=404, detail="Certificate not found")
+
+        user = await self.cert_repo.get_user_by_id(cert.user_id)
+        course = await self.cert_repo.get_course_by_id(cert.course_id)
+        return await render_and_store_async(cert.certificate_code, user.fullname, course.title, cert.issued_date)
+
+    async def issue_certificate(self, course_id: int, user_id: int) -> schemas.CertificateIssueResponse:
+        existing = await self.cert_repo.get_by_user_and_course(user_id, course_id)
+        if existing:
+            return existing
+
+        cert_code = str(uuid.uuid4()).split('-')[0].upper()
+        cert = models.Certificate(
+            user_id=user_id,
+            course_id=course_id,
+            certificate_code=f"LMS-{cert_code}"
+        )
+        async with self.uow:
+            saved_cert = await self.cert_repo.create(cert)
+            job = await self.cert_repo.create_job(render_certificate_job(saved_cert.certificate_code))
+
+        job_queue.notify()
+        certificate_index.mark_stale()
+        return issue_response(saved_cert, job)
+
+    async def get_user_certificates(self, user_id: int) -> list[schemas.CertificateResponse]:
+        return await self.cert_repo.get_all_by_user(user_id)
+
+    async def get_certificate(self, course_id: int, user_id: int) -> schemas.CertificateResponse:
+        cert = await self.cert_repo.get_by_user_and_course(user_id, course_id)
+        if not cert:
+            raise HTTPException(status_code=404, detail="Certificate not found")
+        return cert
+
+    async def get_course_archive(self, course_id: int):
+        course = await self.cert_repo.get_course_by_id(course_id)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course not found")
+        return course, await self.cert_repo.get_course_certificates(course_id)
+
+    async def get_job(self, job_id: int) -> schemas.JobResponse:
+        job = await self.cert_repo.get_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
@@ -0,0 +1,192 @@
+from typing import Optional
+from services.interfaces.course_service_interface import ICourseService
+from repositories.interfaces.course_repository_interface import ICourseRepository
+from services.interfaces.learning_path_service_interface import ILearningPathService
+from repositories.unit_of_work import AsyncUnitOfWork
+from dtos import schemas
+import models
+from fastapi import HTTPException
+from services.catalog_cache import catalog_cache
+from services.search_index import build_match_expression
+from services.implementations.course_service import (
+    serialize_course_page, serialize_course, serialize_lessons, validate_records, lesson_rows, course_rows,
+    build_course_view, split_user_refs, bulk_enroll_plan
+)
+from services.certificate_jobs import issue_response, render_certificate_job
+from services.job_queue import job_queue
+from services.certificate_index import certificate_index
+import uuid
+
+class AsyncCourseService(ICourseService):
+    def __init__(self, course_repo: ICourseRepository, uow: AsyncUnitOfWork, paths: Optional[ILearningPathService] = None):
+        self.course_repo = course_repo
+        self.uow = uow
+        # Learning paths that follow course progress; updated in the same transaction
+        self.paths = paths
+
+    async def create_course(self, course: schemas.CourseCreate) -> schemas.CourseResponse:
+        db_course = models.Course(
+            title=course.title,
+            description=course.description,
+            level=course.level,
+            thumbnail=course.thumbnail,
+            total_duration=course.total_duration
+        )
+        async with self.uow:
+            saved_course = await self.course_repo.create_course(db_course)
+        catalog_cache.bump()
+        return saved_course
+
+    async def get_courses(self, after_id=None, limit=None, include_lessons=True) -> list[schemas.CourseResponse]:
+        return await self.course_repo.get_all_courses(after_id, limit, include_lessons)
+
+    async def get_course(self, course_id: int) -> schemas.CourseResponse:
+        course = await self.course_repo.get_course_by_id(course_id)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course not found")
+        return course
+
+    async def add_lesson(self, course_id: int, lesson: schemas.LessonCreate) -> schemas.LessonResponse:
+        course = await self.course_repo.get_course_by_id(course_id)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course not found")
+
+        db_lesson = models.Lesson(**lesson.dict(), course_id=course_id)
+        async with self.uow:
+            saved_lesson = await self.course_repo.add_lesson(db_lesson)
+        catalog_cache.bump()
+        return saved_lesson
+
+    async def get_lessons(self, course_id: int) -> list[schemas.LessonResponse]:
+        return await self.course_repo.get_lessons_by_course(course_id)
+
+    async def bulk_add_lessons(self, course_id: int, records, parse_errors) -> schemas.BulkImportResult:
+        if not await self.course_repo.get_course_by_id(course_id):
+            raise HTTPException(status_code=404, detail="Course not found")
+        errors = list(parse_errors)
+        valid = validate_records(schemas.LessonCreate, records, errors)
+        async with self.uow:
+            inserted = await self.course_repo.bulk_insert_lessons(lesson_rows(course_id, [lesson for _, lesson in valid]))
+        if inserted:
+            catalog_cache.bump()
+        return schemas.BulkImportResult(
+            received=len(records) + len(parse_errors), inserted=inserted, lessons_inserted=inserted,
+            errors=sorted(errors, key=lambda err: err["index"])
+        )
+
+    async def import_courses(self, records, parse_errors) -> schemas.BulkImportResult:
+        errors = list(parse_errors)
+        valid = validate_records(schemas.CourseImport, records, errors)
+        async with self.uow:
+            ids = await self.course_repo.bulk_insert_courses(
+                course_rows(valid), [[lesson.model_dump() for lesson in course.lessons] for _, course in valid]
+            )
+        if ids:
+            catalog_cache.bump()
+        return schemas.BulkImportResult(
+            received=len(records) + len(parse_errors), inserted=len(ids),
+            lessons_inserted=sum(len(course.lessons) for _, course in valid), ids=ids,
+            errors=sorted(errors, key=lambda err: err["index"])
+        )
+
+    async def get_course_view(self, course_id: int, user_id=None) -> schemas.CourseView:
+        return build_course_view(*await self.course_repo.get_course_view(course_id, user_id))
+
+    async def search_courses(self, query: str, limit: int) -> list[schemas.CourseSearchHit]:
+        match = build_match_expression(query)
+        if not match:
+            return []
+        return await self.course_repo.search(match, limit)
+
+    async def get_courses_cached(self, after_id=None, limit=None, include_lessons=True):
+        key = ("courses", after_id, limit, include_lessons)
+        entry = catalog_cache.lookup(key)
+        if entry:
+            return entry
+        version = catalog_cache.version
+        courses = await self.get_courses(after_id, limit, include_lessons)
+        body, headers = serialize_course_page(courses, limit, include_lessons)
+        return catalog_cache.store(key, version, body, headers)
+
+    async def get_course_cached(self, course_id: int):
+        key = ("course", course_id)
+        entry = catalog_cache.lookup(key)
+        if entry:
+            return entry
+        version = catalog_cache.version
+        return catalog_cache.store(key, version, serialize_course(await self.get_course(course_id)))
+
+    async def get_lessons_cached(self, course_id: int):
+        key = ("lessons", course_id)
+        entry = catalog_cache.lookup(key)
+        if entry:
+            return entry
+        version = catalog_cache.version
+        return catalog_cache.store(key, version, serialize_lessons(await self.get_lessons(course_id)))
+
+    async def enroll_course(self, course_id: int, user_id: int) -> schemas.EnrollmentResponse:
+        # Single idempotent upsert; concurrent calls all get the same row
+        async with self.uow:
+            enrollment = await self.course_repo.upsert_enrollment(user_id, course_id)
+        if not enrollment:
+            raise HTTPException(status_code=404, detail="Course not found")
+        return enrollment
+
+    async def bulk_enroll(self, course_id: int, records, parse_errors) -> schemas.BulkEnrollResult:
+        if not await self.course_repo.get_course_by_id(course_id):
+            raise HTTPException(status_code=404, detail="Course not found")
+        errors = list(parse_errors)
+        ids, emails = split_user_refs(records, errors)
+        user_ids, not_found = bulk_enroll_plan(ids, emails, *await self.course_repo.find_user_ids(list(ids), list(emails)))
+        new_ids = sorted(user_ids - await self.course_repo.get_enrolled_user_ids(course_id))
+        async with self.uow:
+            enrolled = await self.course_repo.bulk_insert_enrollments(course_id, new_ids)
+        return schemas.BulkEnrollResult(
+            received=len(records) + len(parse_errors), resolved=len(user_ids), enrolled=enrolled,
+            already_enrolled=len(user_ids) - enrolled, not_found=not_found,
+            errors=sorted(errors, key=lambda err: err["index"])
+        )
+
+    async def get_status(self, course_id: int, user_id: int) -> schemas.EnrollmentResponse:
+        enrollment = await self.course_repo.get_enrollment(user_id, course_id)
+        if not enrollment:
+            raise HTTPException(status_code=404, detail="Not enrolled")
+        return enrollment
+
+    async def complete_course(self, course_id: int, user_id: int) -> schemas.CertificateIssueResponse:
+        # Completion, attendance and certificate commit together or not at all
+        async with self.uow:
+            enrollment = await self.course_repo.get_enrollment(user_id, course_id)
+            if not enrollment:
+                raise HTTPException(status_code=400, detail="User not enrolled in this course")
+
+            enrollment.is_completed = True
+            await self.course_repo.update_enrollment(enrollment)
+
+            # Add Attendance
+            attendance = models.Attendance(
+                user_id=user_id,
+                course_id=course_id,
+                status="Completed"
+            )
+            await self.course_repo.create_attendance(attendance)
+            if self.paths:
+                await self.paths.record_progress(user_id, course_id, completed=True)
+
+            # Issue Certificate
+            existing_cert = await self.course_repo.get_certificate(user_id, course_id)
+            if existing_cert:
+                return existing_cert
+
+            cert_code = str(uuid.uuid4()).split('-')[0].upper()
+            cert = models.Certificate(
+                user_id=user_id,
+                course_id=course_id,
+                certificate_code=f"LMS-{cert_code}"
+            )
+            saved_cert = await self.course_repo.create_certificate(cert)
+            job = await self.course_repo.create_job(render_certificate_job(saved_cert.certificate_code))
+
+        job_queue.notify()
+        certificate_index.mark_stale()
+        return issue_response(saved_cert, job)
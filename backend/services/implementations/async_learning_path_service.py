@@ -0,0 +1,47 @@
+from datetime import datetime, timezone
+from services.interfaces.learning_path_service_interface import ILearningPathService
+from repositories.interfaces.learning_path_repository_interface import ILearningPathRepository
+from repositories.unit_of_work import AsyncUnitOfWork
+from dtos import schemas
+from fastapi import HTTPException
+from services.implementations.learning_path_service import advance_path, new_learning_path, position
+from services.path_generator import course_topic_keys
+
+class AsyncLearningPathService(ILearningPathService):
+    def __init__(self, path_repo: ILearningPathRepository, uow: AsyncUnitOfWork):
+        self.path_repo = path_repo
+        self.uow = uow
+
+    async def create_path(self, request: schemas.LearningPathCreate) -> schemas.LearningPathResponse:
+        if not await self.path_repo.get_user_by_id(request.user_id):
+            raise HTTPException(status_code=404, detail="User not found")
+        if request.course_id is not None and not await self.path_repo.get_course_by_id(request.course_id):
+            raise HTTPException(status_code=404, detail="Course not found")
+        path, days = new_learning_path(request)
+        async with self.uow:
+            await self.path_repo.create_path(path, days)
+        return path
+
+    async def get_path(self, path_id: int) -> schemas.LearningPathDetail:
+        path = await self.path_repo.get_path(path_id)
+        if not path:
+            raise HTTPException(status_code=404, detail="Learning path not found")
+        return path
+
+    async def get_user_paths(self, user_id: int):
+        return await self.path_repo.get_user_paths(user_id)
+
+    async def get_positions(self, user_id: int, active_only: bool = False):
+        return [position(path, day) for path, day in await self.path_repo.get_positions(user_id, active_only)]
+
+    async def record_progress(self, user_id: int, course_id: int, completed: bool = False) -> int:
+        course = await self.path_repo.get_course_by_id(course_id)
+        if not course:
+            return 0
+        paths = await self.path_repo.find_active_paths(user_id, course_id, course_topic_keys(course.title))
+        now = datetime.now(timezone.utc)
+        for path in paths:
+            through = advance_path(path, None if completed else 1, now)
+            await self.path_repo.complete_days(path.id, through, "completion" if completed else "attendance", now)
+            await self.path_repo.update_path(path)
+        return len(paths)
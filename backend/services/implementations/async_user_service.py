@@ -0,0 +1,91 @@
+from services.interfaces.user_service_interface import IUserService
+from repositories.interfaces.user_repository_interface import IUserRepository
+from repositories.unit_of_work import AsyncUnitOfWork
+from dtos import schemas
+import models
+from services.implementations.user_service import hash_password, verify_password
+from fastapi import HTTPException
+from services.cpu_executor import cpu_executor
+from services.certificate_index import certificate_index
+
+class AsyncUserService(IUserService):
+    def __init__(self, user_repo: IUserRepository, uow: AsyncUnitOfWork):
+        self.user_repo = user_repo
+        self.uow = uow
+
+    # Hashing is CPU bound, keep it off the event loop
+    async def _verify_password(self, plain_password, hashed_password):
+        return await cpu_executor.run_async(verify_password, plain_password, hashed_password)
+
+    async def _get_password_hash(self, password):
+        return await cpu_executor.run_async(hash_password, password)
+
+    async def register_user(self, user_create: schemas.UserCreate) -> schemas.UserResponse:
+        user_create.email = user_create.email.lower()
+        if await self.user_repo.get_by_email(user_create.email):
+            raise HTTPException(status_code=400, detail="Email already registered")
+
+        hashed_password = await self._get_password_hash(user_create.password)
+        new_user = models.User(
+            email=user_create.email,
+            password=hashed_password,
+            fullname=user_create.fullname
+        )
+        async with self.uow:
+            saved_user = await self.user_repo.create(new_user)
+
+            new_profile = models.Profile(user_id=saved_user.id)
+            await self.user_repo.create_profile(new_profile)
+
+        return saved_user
+
+    async def login_user(self, user_login: schemas.UserLogin) -> schemas.Token:
+        user_login.email = user_login.email.lower()
+        user = await self.user_repo.get_by_email(user_login.email)
+
+        if not user or not await self._verify_password(user_login.password, user.password):
+            raise HTTPException(status_code=400, detail="Invalid credentials")
+
+        return {
+            "access_token": f"user_{user.id}_{user.email}",
+            "token_type": "bearer",
+            "user_id": user.id,
+            "email": user.email,
+            "fullname": user.fullname
+        }
+
+    async def get_all_users(self) -> list[schemas.UserResponse]:
+        return await self.user_repo.get_all()
+
+    async def update_profile(self, user_id: int, profile_update: schemas.UserProfileUpdate) -> schemas.UserResponse:
+        async with self.uow:
+            user = await self.user_repo.get_by_id(user_id)
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+
+            if profile_update.fullname:
+                user.fullname = profile_update.fullname
+
+            if profile_update.email:
+                if profile_update.email != user.email:
+                    existing = await self.user_repo.get_by_email(profile_update.email)
+                    if existing:
+                        raise HTTPException(status_code=400, detail="Email already currently in use")
+                    user.email = profile_update.email.lower()
+
+            if not user.profile:
+                new_profile = models.Profile(user_id=user.id)
+                await self.user_repo.create_profile(new_profile)
+                user.profile = new_profile
+
+            if profile_update.bio is not None:
+                user.profile.bio = profile_update.bio
+            if profile_update.title is not None:
+                user.profile.title = profile_update.title
+            if profile_update.avatar is not None:
+                user.profile.avatar = profile_update.avatar
+
+            updated = await self.user_repo.update(user)
+
+        certificate_index.rename_user(updated.id, updated.fullname)
+        return updated
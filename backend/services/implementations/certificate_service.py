@@ -1,31 +1,45 @@
 from services.interfaces.certificate_service_interface import ICertificateService
 from repositories.interfaces.certificate_repository_interface import ICertificateRepository
+from repositories.unit_of_work import UnitOfWork
 from dtos import schemas
 import models
 from fastapi import HTTPException
+from services.certificate_store import StoredCertificate, certificate_store, render_and_store
+from services.certificate_jobs import issue_response, render_certificate_job
+from services.job_queue import job_queue
+from services.certificate_index import certificate_index
 import uuid
-# Note: StreamingResponse needs to be handled in the controller if possible, 
-# or we return the buffer/generator here. The interface said Any.
-# Better to return the buffer.
+# Downloads return a StoredCertificate (file on disk); the controller turns it into a FileResponse.
 
 class CertificateService(ICertificateService):
-    def __init__(self, cert_repo: ICertificateRepository):
+    def __init__(self, cert_repo: ICertificateRepository, uow: UnitOfWork):
         self.cert_repo = cert_repo
+        self.uow = uow
+
+    def get_certificate_file(self, certificate_code: str) -> StoredCertificate:
+        # Codes in the verification index are served from the PDF store without touching the
+        # DB; any other code must exist in the DB first, so made-up codes never reach the disk.
+        # Rendered again only on a store miss.
+        cert = None
+        if not certificate_index.contains(certificate_code):
+            cert = self.cert_repo.get_by_code(certificate_code)
+            if not cert:
+                raise HTTPException(status_code=404, detail="Certificate not found")
+
+        stored = certificate_store.get(certificate_code)
+        if stored:
+            return stored
+
+        if cert is None:
+            cert = self.cert_repo.get_by_code(certificate_code)
+            if not cert:
+                raise HTTPException(status_code=404, detail="Certificate not found")
 
-    def get_download_stream(self, certificate_code: str):
-        cert = self.cert_repo.get_by_code(certificate_code)
-        if not cert:
-            raise HTTPException(status_code=404, detail="Certificate not found")
-            
         user = self.cert_repo.get_user_by_id(cert.user_id)
         course = self.cert_repo.get_course_by_id(cert.course_id)
-        
-        from utils.pdf_generator import generate_certificate_pdf
-        pdf_buffer = generate_certificate_pdf(user.fullname, course.title, str(cert.issued_date), cert.certificate_code)
-        
-        return pdf_buffer
+        return render_and_store(cert.certificate_code, user.fullname, course.title, cert.issued_date)
 
-    def issue_certificate(self, course_id: int, user_id: int) -> schemas.CertificateResponse:
+    def issue_certificate(self, course_id: int, user_id: int) -> schemas.CertificateIssueResponse:
         existing = self.cert_repo.get_by_user_and_course(user_id, course_id)
         if existing:
             return existing
@@ -36,18 +50,14 @@ class CertificateService(ICertificateService):
             course_id=course_id,
             certificate_code=f"LMS-{cert_code}"
         )
-        saved_cert = self.cert_repo.create(cert)
-        
-        # Generate PDF (side effect)
-        try:
-            user = self.cert_repo.get_user_by_id(user_id)
-            course = self.cert_repo.get_course_by_id(course_id)
-            from utils.pdf_generator import generate_certificate_pdf
-            generate_certificate_pdf(user.fullname, course.title, saved_cert.issued_date, saved_cert.certificate_code)
-        except Exception as e:
-            print(f"PDF Generation failed: {e}")
-            
-        return saved_cert
+        with self.uow:
+            saved_cert = self.cert_repo.create(cert)
+            # Rendered into the PDF store by a job worker
+            job = self.cert_repo.create_job(render_certificate_job(saved_cert.certificate_code))
+
+        job_queue.notify()
+        certificate_index.mark_stale()
+        return issue_response(saved_cert, job)
 
     def get_user_certificates(self, user_id: int) -> list[schemas.CertificateResponse]:
         return self.cert_repo.get_all_by_user(user_id)
@@ -57,3 +67,16 @@ class CertificateService(ICertificateService):
         if not cert:
             raise HTTPException(status_code=404, detail="Certificate not found")
         return cert
+
+    def get_course_archive(self, course_id: int):
+        # Course and its certificate rows; the controller streams them as a ZIP
+        course = self.cert_repo.get_course_by_id(course_id)
+        if not course:
+            raise HTTPException(status_code=404, detail="Course not found")
+        return course, self.cert_repo.get_course_certificates(course_id)
+
+    def get_job(self, job_id: int) -> schemas.JobResponse:
+        job = self.cert_repo.get_job(job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return job
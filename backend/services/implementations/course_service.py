@@ -1,13 +1,109 @@
+from typing import Optional
 from services.interfaces.course_service_interface import ICourseService
 from repositories.interfaces.course_repository_interface import ICourseRepository
+from services.interfaces.learning_path_service_interface import ILearningPathService
+from repositories.unit_of_work import UnitOfWork
 from dtos import schemas
 import models
 from fastapi import HTTPException
+from pydantic import ValidationError
+from dtos import adapters
+from services.catalog_cache import catalog_cache
+from services.search_index import build_match_expression
+from utils import fast_json
+from services.certificate_jobs import issue_response, render_certificate_job
+from services.job_queue import job_queue
+from services.certificate_index import certificate_index
 import uuid
 
+def validate_records(model, records, errors):
+    valid = []
+    for index, record in records:
+        try:
+            valid.append((index, model.model_validate(record)))
+        except ValidationError as e:
+            errors.append({"index": index, "error": "; ".join(
+                f"{'.'.join(str(part) for part in err['loc']) or 'row'}: {err['msg']}" for err in e.errors()
+            )})
+    return valid
+
+def lesson_rows(course_id, lessons):
+    return [{**lesson.model_dump(), "course_id": course_id} for lesson in lessons]
+
+def course_rows(courses):
+    return [course.model_dump(exclude={"lessons"}) for _, course in courses]
+
+def split_user_refs(records, errors):
+    # Sorts raw values into user ids and emails, keeping first-seen order and dropping repeats
+    ids, emails = {}, {}
+    for index, value in records:
+        if isinstance(value, int) and not isinstance(value, bool):
+            ids.setdefault(value, str(value))
+        elif isinstance(value, str) and value.strip().isdigit():
+            ids.setdefault(int(value), value.strip())
+        elif isinstance(value, str) and "@" in value:
+            emails.setdefault(value.strip(), value.strip())
+        else:
+            errors.append({"index": index, "error": "Expected a user id or an email"})
+    return ids, emails
+
+def bulk_enroll_plan(ids, emails, found_ids, found_emails):
+    user_ids = set(found_ids) | set(found_emails.values())
+    not_found = [ref for user_id, ref in ids.items() if user_id not in found_ids]
+    not_found += [email for email in emails if email not in found_emails]
+    return user_ids, not_found
+
+def build_course_view(head, lesson_rows) -> schemas.CourseView:
+    if head is None:
+        raise HTTPException(status_code=404, detail="Course not found")
+    course, enrollment, certificate = head
+    lessons = [
+        schemas.LessonProgress(
+            id=lesson.id, course_id=lesson.course_id, title=lesson.title, content=lesson.content,
+            video_url=lesson.video_url, duration=lesson.duration,
+            attended=count > 0, attendance_count=count, last_attended_at=last_attended_at
+        )
+        for lesson, count, last_attended_at in lesson_rows
+    ]
+    if certificate is not None:
+        # The course is already loaded; build the nested title instead of touching the relationship
+        certificate = schemas.CertificateResponse(
+            id=certificate.id, course_id=certificate.course_id, certificate_code=certificate.certificate_code,
+            issued_date=certificate.issued_date, user_id=certificate.user_id,
+            course=schemas.CertificateCourse(title=course.title)
+        )
+    return schemas.CourseView(
+        course=schemas.CourseSummaryResponse.model_validate(course),
+        lessons=lessons,
+        enrollment=enrollment,
+        certificate=certificate,
+        attended_lessons=sum(1 for lesson in lessons if lesson.attended),
+    )
+
+def serialize_course_page(courses, limit, include_lessons):
+    headers = {"X-Next-After-Id": str(courses[-1].id)} if limit and len(courses) == limit else None
+    if fast_json.FAST_RESPONSES:
+        encoder = adapters.COURSE_ROWS if include_lessons else adapters.COURSE_SUMMARY_ROWS
+        return fast_json.dumps(encoder.encode_many(courses)), headers
+    adapter = adapters.COURSE_LIST if include_lessons else adapters.COURSE_SUMMARY_LIST
+    return adapter.dump_json(adapter.validate_python(courses, from_attributes=True)), headers
+
+def serialize_course(course):
+    if fast_json.FAST_RESPONSES:
+        return fast_json.dumps(adapters.COURSE_ROWS.encode(course))
+    return adapters.COURSE.dump_json(adapters.COURSE.validate_python(course, from_attributes=True))
+
+def serialize_lessons(lessons):
+    if fast_json.FAST_RESPONSES:
+        return fast_json.dumps(adapters.LESSON_ROWS.encode_many(lessons))
+    return adapters.LESSON_LIST.dump_json(adapters.LESSON_LIST.validate_python(lessons, from_attributes=True))
+
 class CourseService(ICourseService):
-    def __init__(self, course_repo: ICourseRepository):
+    def __init__(self, course_repo: ICourseRepository, uow: UnitOfWork, paths: Optional[ILearningPathService] = None):
         self.course_repo = course_repo
+        self.uow = uow
+        # Learning paths that follow course progress; updated in the same transaction
+        self.paths = paths
 
     def create_course(self, course: schemas.CourseCreate) -> schemas.CourseResponse:
         db_course = models.Course(
@@ -17,10 +113,13 @@ class CourseService(ICourseService):
             thumbnail=course.thumbnail,
             total_duration=course.total_duration
         )
-        return self.course_repo.create_course(db_course)
+        with self.uow:
+            saved_course = self.course_repo.create_course(db_course)
+        catalog_cache.bump()
+        return saved_course
 
-    def get_courses(self) -> list[schemas.CourseResponse]:
-        return self.course_repo.get_all_courses()
+    def get_courses(self, after_id=None, limit=None, include_lessons=True) -> list[schemas.CourseResponse]:
+        return self.course_repo.get_all_courses(after_id, limit, include_lessons)
 
     def get_course(self, course_id: int) -> schemas.CourseResponse:
         course = self.course_repo.get_course_by_id(course_id)
@@ -35,22 +134,100 @@ class CourseService(ICourseService):
             
         # Convert DTO to Model
         db_lesson = models.Lesson(**lesson.dict(), course_id=course_id)
-        return self.course_repo.add_lesson(db_lesson)
+        with self.uow:
+            saved_lesson = self.course_repo.add_lesson(db_lesson)
+        catalog_cache.bump()
+        return saved_lesson
 
     def get_lessons(self, course_id: int) -> list[schemas.LessonResponse]:
         return self.course_repo.get_lessons_by_course(course_id)
 
+    def bulk_add_lessons(self, course_id: int, records, parse_errors) -> schemas.BulkImportResult:
+        if not self.course_repo.get_course_by_id(course_id):
+            raise HTTPException(status_code=404, detail="Course not found")
+        errors = list(parse_errors)
+        valid = validate_records(schemas.LessonCreate, records, errors)
+        with self.uow:
+            inserted = self.course_repo.bulk_insert_lessons(lesson_rows(course_id, [lesson for _, lesson in valid]))
+        if inserted:
+            catalog_cache.bump()
+        return schemas.BulkImportResult(
+            received=len(records) + len(parse_errors), inserted=inserted, lessons_inserted=inserted,
+            errors=sorted(errors, key=lambda err: err["index"])
+        )
+
+    def import_courses(self, records, parse_errors) -> schemas.BulkImportResult:
+        errors = list(parse_errors)
+        valid = validate_records(schemas.CourseImport, records, errors)
+        with self.uow:
+            ids = self.course_repo.bulk_insert_courses(
+                course_rows(valid), [[lesson.model_dump() for lesson in course.lessons] for _, course in valid]
+            )
+        if ids:
+            catalog_cache.bump()
+        return schemas.BulkImportResult(
+            received=len(records) + len(parse_errors), inserted=len(ids),
+            lessons_inserted=sum(len(course.lessons) for _, course in valid), ids=ids,
+            errors=sorted(errors, key=lambda err: err["index"])
+        )
+
+    def get_course_view(self, course_id: int, user_id=None) -> schemas.CourseView:
+        return build_course_view(*self.course_repo.get_course_view(course_id, user_id))
+
+    def search_courses(self, query: str, limit: int) -> list[schemas.CourseSearchHit]:
+        match = build_match_expression(query)
+        if not match:
+            return []
+        return self.course_repo.search(match, limit)
+
+    # Cached catalog reads: return serialized JSON entries from catalog_cache
+    def get_courses_cached(self, after_id=None, limit=None, include_lessons=True):
+        key = ("courses", after_id, limit, include_lessons)
+        entry = catalog_cache.lookup(key)
+        if entry:
+            return entry
+        version = catalog_cache.version
+        body, headers = serialize_course_page(self.get_courses(after_id, limit, include_lessons), limit, include_lessons)
+        return catalog_cache.store(key, version, body, headers)
+
+    def get_course_cached(self, course_id: int):
+        key = ("course", course_id)
+        entry = catalog_cache.lookup(key)
+        if entry:
+            return entry
+        version = catalog_cache.version
+        return catalog_cache.store(key, version, serialize_course(self.get_course(course_id)))
+
+    def get_lessons_cached(self, course_id: int):
+        key = ("lessons", course_id)
+        entry = catalog_cache.lookup(key)
+        if entry:
+            return entry
+        version = catalog_cache.version
+        return catalog_cache.store(key, version, serialize_lessons(self.get_lessons(course_id)))
+
     def enroll_course(self, course_id: int, user_id: int) -> schemas.EnrollmentResponse:
-        course = self.course_repo.get_course_by_id(course_id)
-        if not course:
+        # Single idempotent upsert; concurrent calls all get the same row
+        with self.uow:
+            enrollment = self.course_repo.upsert_enrollment(user_id, course_id)
+        if not enrollment:
             raise HTTPException(status_code=404, detail="Course not found")
-            
-        enrollment = self.course_repo.get_enrollment(user_id, course_id)
-        if enrollment:
-            return enrollment
-            
-        new_enrollment = models.Enrollment(user_id=user_id, course_id=course_id)
-        return self.course_repo.create_enrollment(new_enrollment)
+        return enrollment
+
+    def bulk_enroll(self, course_id: int, records, parse_errors) -> schemas.BulkEnrollResult:
+        if not self.course_repo.get_course_by_id(course_id):
+            raise HTTPException(status_code=404, detail="Course not found")
+        errors = list(parse_errors)
+        ids, emails = split_user_refs(records, errors)
+        user_ids, not_found = bulk_enroll_plan(ids, emails, *self.course_repo.find_user_ids(list(ids), list(emails)))
+        new_ids = sorted(user_ids - self.course_repo.get_enrolled_user_ids(course_id))
+        with self.uow:
+            enrolled = self.course_repo.bulk_insert_enrollments(course_id, new_ids)
+        return schemas.BulkEnrollResult(
+            received=len(records) + len(parse_errors), resolved=len(user_ids), enrolled=enrolled,
+            already_enrolled=len(user_ids) - enrolled, not_found=not_found,
+            errors=sorted(errors, key=lambda err: err["index"])
+        )
 
     def get_status(self, course_id: int, user_id: int) -> schemas.EnrollmentResponse:
         enrollment = self.course_repo.get_enrollment(user_id, course_id)
@@ -58,45 +235,41 @@ class CourseService(ICourseService):
             raise HTTPException(status_code=404, detail="Not enrolled")
         return enrollment
 
-    def complete_course(self, course_id: int, user_id: int) -> schemas.CertificateResponse:
-        enrollment = self.course_repo.get_enrollment(user_id, course_id)
-        if not enrollment:
-             raise HTTPException(status_code=400, detail="User not enrolled in this course")
-        
-        enrollment.is_completed = True
-        self.course_repo.update_enrollment(enrollment)
-        
-        # Add Attendance
-        attendance = models.Attendance(
-            user_id=user_id,
-            course_id=course_id,
-            status="Completed"
-        )
-        self.course_repo.create_attendance(attendance)
-        
-        # Issue Certificate
-        existing_cert = self.course_repo.get_certificate(user_id, course_id)
-        if existing_cert:
-            return existing_cert
-            
-        cert_code = str(uuid.uuid4()).split('-')[0].upper()
-        cert = models.Certificate(
-            user_id=user_id,
-            course_id=course_id,
-            certificate_code=f"LMS-{cert_code}"
-        )
-        saved_cert = self.course_repo.create_certificate(cert)
-        
-        # Generate PDF
-        try:
-            user = self.course_repo.get_user_by_id(user_id)
-            course = self.course_repo.get_course_by_id(course_id) # Should exist
-            
-            # Need to fix import path for pdf_generator or move it.
-            # Assuming utils is in sys.path or relative import
-            from utils.pdf_generator import generate_certificate_pdf
-            generate_certificate_pdf(user.fullname, course.title, saved_cert.issued_date, saved_cert.certificate_code)
-        except Exception as e:
-            print(f"PDF Generation failed: {e}")
-            
-        return saved_cert
+    def complete_course(self, course_id: int, user_id: int) -> schemas.CertificateIssueResponse:
+        # Completion, attendance and certificate commit together or not at all
+        with self.uow:
+            enrollment = self.course_repo.get_enrollment(user_id, course_id)
+            if not enrollment:
+                raise HTTPException(status_code=400, detail="User not enrolled in this course")
+
+            enrollment.is_completed = True
+            self.course_repo.update_enrollment(enrollment)
+
+            # Add Attendance
+            attendance = models.Attendance(
+                user_id=user_id,
+                course_id=course_id,
+                status="Completed"
+            )
+            self.course_repo.create_attendance(attendance)
+            if self.paths:
+                self.paths.record_progress(user_id, course_id, completed=True)
+
+            # Issue Certificate
+            existing_cert = self.course_repo.get_certificate(user_id, course_id)
+            if existing_cert:
+                return existing_cert
+
+            cert_code = str(uuid.uuid4()).split('-')[0].upper()
+            cert = models.Certificate(
+                user_id=user_id,
+                course_id=course_id,
+                certificate_code=f"LMS-{cert_code}"
+            )
+            saved_cert = self.course_repo.create_certificate(cert)
+            # The PDF is rendered by a job worker; the job commits with the certificate
+            job = self.course_repo.create_job(render_certificate_job(saved_cert.certificate_code))
+
+        job_queue.notify()
+        certificate_index.mark_stale()
+        return issue_response(saved_cert, job)
@@ -0,0 +1,92 @@
+from datetime import datetime, timezone
+from services.interfaces.learning_path_service_interface import ILearningPathService
+from repositories.interfaces.learning_path_repository_interface import ILearningPathRepository
+from repositories.unit_of_work import UnitOfWork
+from dtos import schemas
+import models
+from fastapi import HTTPException
+from services.path_generator import course_topic_keys, iter_schedule, topic_key
+
+# Progress is stored, not derived: each path keeps completed_days and current_day (the next
+# day to do), and days are done in order, so an attendance moves the pointer one day and a
+# course completion moves it to the end. Reads never scan the days.
+
+def new_learning_path(request: schemas.LearningPathCreate):
+    # (path, day rows) built from the schedule generator
+    topic = " ".join(request.course_name.split())
+    days = [
+        {"day": item["day"], "phase": item["phase"], "topic": item["topic"],
+         "hours": item["hours"], "activity": item["activity"]}
+        for item in iter_schedule(topic, request.days, request.hours_per_day)
+    ]
+    path = models.LearningPath(
+        user_id=request.user_id,
+        course_id=request.course_id,
+        topic=topic,
+        topic_key=topic_key(topic),
+        total_days=len(days),
+        hours_per_day=request.hours_per_day,
+        completed_days=0,
+        current_day=1 if days else None,
+        status="active"
+    )
+    return path, days
+
+def advance_path(path: models.LearningPath, steps, now: datetime) -> int:
+    # Moves the path `steps` days forward (to the end when None); returns the last day now done
+    if steps is None:
+        through = path.total_days
+    else:
+        through = min(path.current_day + steps - 1, path.total_days)
+    path.completed_days = through
+    if through < path.total_days:
+        path.current_day = through + 1
+    else:
+        path.current_day = None
+        path.status = "completed"
+        path.completed_at = now
+    return through
+
+def position(path, day) -> schemas.LearningPathPosition:
+    result = schemas.LearningPathPosition.model_validate(path)
+    result.current = schemas.LearningPathDayResponse.model_validate(day) if day is not None else None
+    return result
+
+class LearningPathService(ILearningPathService):
+    def __init__(self, path_repo: ILearningPathRepository, uow: UnitOfWork):
+        self.path_repo = path_repo
+        self.uow = uow
+
+    def create_path(self, request: schemas.LearningPathCreate) -> schemas.LearningPathResponse:
+        if not self.path_repo.get_user_by_id(request.user_id):
+            raise HTTPException(status_code=404, detail="User not found")
+        if request.course_id is not None and not self.path_repo.get_course_by_id(request.course_id):
+            raise HTTPException(status_code=404, detail="Course not found")
+        path, days = new_learning_path(request)
+        with self.uow:
+            self.path_repo.create_path(path, days)
+        return path
+
+    def get_path(self, path_id: int) -> schemas.LearningPathDetail:
+        path = self.path_repo.get_path(path_id)
+        if not path:
+            raise HTTPException(status_code=404, detail="Learning path not found")
+        return path
+
+    def get_user_paths(self, user_id: int):
+        return self.path_repo.get_user_paths(user_id)
+
+    def get_positions(self, user_id: int, active_only: bool = False):
+        return [position(path, day) for path, day in self.path_repo.get_positions(user_id, active_only)]
+
+    def record_progress(self, user_id: int, course_id: int, completed: bool = False) -> int:
+        course = self.path_repo.get_course_by_id(course_id)
+        if not course:
+            return 0
+        paths = self.path_repo.find_active_paths(user_id, course_id, course_topic_keys(course.title))
+        now = datetime.now(timezone.utc)
+        for path in paths:
+            through = advance_path(path, None if completed else 1, now)
+            self.path_repo.complete_days(path.id, through, "completion" if completed else "attendance", now)
+            self.path_repo.update_path(path)
+        return len(paths)
@@ -1,20 +1,39 @@
 from services.interfaces.user_service_interface import IUserService
 from repositories.interfaces.user_repository_interface import IUserRepository
+from repositories.unit_of_work import UnitOfWork
 from dtos import schemas
 import models
-from passlib.context import CryptContext
 from fastapi import HTTPException, status
+from services.cpu_executor import cpu_executor
+from services.certificate_index import certificate_index
+
+_pwd_context = None
+
+def get_pwd_context():
+    # Built once per process on first use; passlib is not needed to import the app
+    global _pwd_context
+    if _pwd_context is None:
+        from passlib.context import CryptContext
+        _pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+    return _pwd_context
+
+# pbkdf2 runs in the CPU pool; these are the module level entry points it calls
+def hash_password(password: str) -> str:
+    return get_pwd_context().hash(password)
+
+def verify_password(plain_password: str, hashed_password: str) -> bool:
+    return get_pwd_context().verify(plain_password, hashed_password)
 
 class UserService(IUserService):
-    def __init__(self, user_repo: IUserRepository):
+    def __init__(self, user_repo: IUserRepository, uow: UnitOfWork):
         self.user_repo = user_repo
-        self.pwd_context = CryptContext(schemes=["pbkdf2_sha256"], deprecated="auto")
+        self.uow = uow
 
     def _verify_password(self, plain_password, hashed_password):
-        return self.pwd_context.verify(plain_password, hashed_password)
+        return cpu_executor.run(verify_password, plain_password, hashed_password)
 
     def _get_password_hash(self, password):
-        return self.pwd_context.hash(password)
+        return cpu_executor.run(hash_password, password)
 
     def register_user(self, user_create: schemas.UserCreate) -> schemas.UserResponse:
         # Convert DTO to Entity logic
@@ -28,11 +47,12 @@ class UserService(IUserService):
             password=hashed_password, 
             fullname=user_create.fullname
         )
-        saved_user = self.user_repo.create(new_user)
-        
-        # Create Profile
-        new_profile = models.Profile(user_id=saved_user.id)
-        self.user_repo.create_profile(new_profile)
+        with self.uow:
+            saved_user = self.user_repo.create(new_user)
+
+            # Create Profile
+            new_profile = models.Profile(user_id=saved_user.id)
+            self.user_repo.create_profile(new_profile)
         
         return saved_user
 
@@ -55,34 +75,39 @@ class UserService(IUserService):
         return self.user_repo.get_all()
 
     def update_profile(self, user_id: int, profile_update: schemas.UserProfileUpdate) -> schemas.UserResponse:
-        user = self.user_repo.get_by_id(user_id)
-        if not user:
-            raise HTTPException(status_code=404, detail="User not found")
-            
-        if profile_update.fullname:
-            user.fullname = profile_update.fullname
-            
-        if profile_update.email:
-            if profile_update.email != user.email:
-                existing = self.user_repo.get_by_email(profile_update.email)
-                if existing:
-                    raise HTTPException(status_code=400, detail="Email already currently in use")
-                user.email = profile_update.email.lower()
-
-        # Update Profile fields
-        # user.profile should be loaded by SQLAlchemy if accessed within session
-        # If not, we might need eager loading in repo, but lazy loading works if session is open.
-        if not user.profile:
-             new_profile = models.Profile(user_id=user.id)
-             self.user_repo.create_profile(new_profile)
-             # Refreshing user to get profile relation
-             user = self.user_repo.get_by_id(user_id)
-        
-        if profile_update.bio is not None:
-            user.profile.bio = profile_update.bio
-        if profile_update.title is not None:
-            user.profile.title = profile_update.title
-        if profile_update.avatar is not None:
-            user.profile.avatar = profile_update.avatar
-            
-        return self.user_repo.update(user)
+        with self.uow:
+            user = self.user_repo.get_by_id(user_id)
+            if not user:
+                raise HTTPException(status_code=404, detail="User not found")
+
+            if profile_update.fullname:
+                user.fullname = profile_update.fullname
+
+            if profile_update.email:
+                if profile_update.email != user.email:
+                    existing = self.user_repo.get_by_email(profile_update.email)
+                    if existing:
+                        raise HTTPException(status_code=400, detail="Email already currently in use")
+                    user.email = profile_update.email.lower()
+
+            # Update Profile fields
+            # user.profile should be loaded by SQLAlchemy if accessed within session
+            # If not, we might need eager loading in repo, but lazy loading works if session is open.
+            if not user.profile:
+                 new_profile = models.Profile(user_id=user.id)
+                 self.user_repo.create_profile(new_profile)
+                 # Nothing is expired before the commit, so link the relation directly
+                 user.profile = new_profile
+
+            if profile_update.bio is not None:
+                user.profile.bio = profile_update.bio
+            if profile_update.title is not None:
+                user.profile.title = profile_update.title
+            if profile_update.avatar is not None:
+                user.profile.avatar = profile_update.avatar
+
+            updated = self.user_repo.update(user)
+
+        # Verification shows the holder's current name
+        certificate_index.rename_user(updated.id, updated.fullname)
+        return updated
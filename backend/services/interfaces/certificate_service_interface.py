@@ -4,13 +4,19 @@ from dtos import schemas
 
 class ICertificateService(ABC):
     @abstractmethod
-    def get_download_stream(self, certificate_code: str) -> Any: pass
+    def get_certificate_file(self, certificate_code: str) -> Any: pass
     
     @abstractmethod
-    def issue_certificate(self, course_id: int, user_id: int) -> schemas.CertificateResponse: pass
+    def issue_certificate(self, course_id: int, user_id: int) -> schemas.CertificateIssueResponse: pass
     
     @abstractmethod
     def get_user_certificates(self, user_id: int) -> List[schemas.CertificateResponse]: pass
     
     @abstractmethod
     def get_certificate(self, course_id: int, user_id: int) -> schemas.CertificateResponse: pass
+
+    @abstractmethod
+    def get_course_archive(self, course_id: int) -> Any: pass
+
+    @abstractmethod
+    def get_job(self, job_id: int) -> schemas.JobResponse: pass
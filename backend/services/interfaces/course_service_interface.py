@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List
+from typing import List, Optional, Any
 from dtos import schemas
 
 class ICourseService(ABC):
@@ -7,7 +7,7 @@ class ICourseService(ABC):
     def create_course(self, course: schemas.CourseCreate) -> schemas.CourseResponse: pass
     
     @abstractmethod
-    def get_courses(self) -> List[schemas.CourseResponse]: pass
+    def get_courses(self, after_id: Optional[int] = None, limit: Optional[int] = None, include_lessons: bool = True) -> List[schemas.CourseResponse]: pass
     
     @abstractmethod
     def get_course(self, course_id: int) -> schemas.CourseResponse: pass
@@ -18,11 +18,38 @@ class ICourseService(ABC):
     @abstractmethod
     def get_lessons(self, course_id: int) -> List[schemas.LessonResponse]: pass
     
+    # records: (index, raw JSON value) pairs, parse_errors: rows already rejected by the reader
+    @abstractmethod
+    def bulk_add_lessons(self, course_id: int, records: List[Any], parse_errors: List[dict]) -> schemas.BulkImportResult: pass
+
+    @abstractmethod
+    def import_courses(self, records: List[Any], parse_errors: List[dict]) -> schemas.BulkImportResult: pass
+
+    @abstractmethod
+    def get_course_view(self, course_id: int, user_id: Optional[int] = None) -> schemas.CourseView: pass
+
+    @abstractmethod
+    def search_courses(self, query: str, limit: int) -> List[schemas.CourseSearchHit]: pass
+
+    # Cached, pre-serialized catalog reads (see services/catalog_cache.py)
+    @abstractmethod
+    def get_courses_cached(self, after_id: Optional[int] = None, limit: Optional[int] = None, include_lessons: bool = True) -> Any: pass
+
+    @abstractmethod
+    def get_course_cached(self, course_id: int) -> Any: pass
+
+    @abstractmethod
+    def get_lessons_cached(self, course_id: int) -> Any: pass
+
     @abstractmethod
     def enroll_course(self, course_id: int, user_id: int) -> schemas.EnrollmentResponse: pass
     
+    # records: (index, user id or email) pairs from a JSON array, NDJSON or CSV body
+    @abstractmethod
+    def bulk_enroll(self, course_id: int, records: List[Any], parse_errors: List[dict]) -> schemas.BulkEnrollResult: pass
+
     @abstractmethod
     def get_status(self, course_id: int, user_id: int) -> schemas.EnrollmentResponse: pass
     
     @abstractmethod
-    def complete_course(self, course_id: int, user_id: int) -> schemas.CertificateResponse: pass
+    def complete_course(self, course_id: int, user_id: int) -> schemas.CertificateIssueResponse: pass
@@ -0,0 +1,20 @@
+from abc import ABC, abstractmethod
+from typing import List
+from dtos import schemas
+
+class ILearningPathService(ABC):
+    @abstractmethod
+    def create_path(self, request: schemas.LearningPathCreate) -> schemas.LearningPathResponse: pass
+
+    @abstractmethod
+    def get_path(self, path_id: int) -> schemas.LearningPathDetail: pass
+
+    @abstractmethod
+    def get_user_paths(self, user_id: int) -> List[schemas.LearningPathResponse]: pass
+
+    @abstractmethod
+    def get_positions(self, user_id: int, active_only: bool = False) -> List[schemas.LearningPathPosition]: pass
+
+    # Called inside the caller's unit of work when attendance is marked or a course completed
+    @abstractmethod
+    def record_progress(self, user_id: int, course_id: int, completed: bool = False) -> int: pass
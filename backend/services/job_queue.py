@@ -0,0 +1,268 @@
+import json
+import logging
+import os
+import random
+import threading
+import time
+from collections import deque
+from datetime import datetime, timedelta
+from typing import Optional
+
+from sqlalchemy import and_, delete, func, or_, select, update
+
+from database import SessionLocal
+import models
+
+# Background jobs stored in the jobs table of the application DB, so they survive restarts
+# and are enqueued in the same transaction as the change that needs them. Worker threads
+# claim one job at a time with an atomic UPDATE ... RETURNING and hold it under a lease;
+# a job whose lease runs out (worker crashed, process killed) is picked up again.
+# Failures are retried with exponential backoff until max_attempts, then marked failed.
+# Succeeded jobs are deleted JOB_RETENTION_SECONDS after they finished (failed ones are kept
+# for inspection); a worker sweeps them at most every JOB_PURGE_INTERVAL seconds.
+JOB_WORKERS = int(os.getenv("JOB_WORKERS", "2"))
+JOB_POLL_INTERVAL = float(os.getenv("JOB_POLL_INTERVAL", "1.0"))
+JOB_LEASE_SECONDS = float(os.getenv("JOB_LEASE_SECONDS", "60"))
+JOB_MAX_ATTEMPTS = int(os.getenv("JOB_MAX_ATTEMPTS", "5"))
+JOB_RETRY_BASE_SECONDS = float(os.getenv("JOB_RETRY_BASE_SECONDS", "2"))
+JOB_RETRY_MAX_SECONDS = float(os.getenv("JOB_RETRY_MAX_SECONDS", "300"))
+JOB_RETENTION_SECONDS = float(os.getenv("JOB_RETENTION_SECONDS", str(7 * 24 * 3600)))
+JOB_PURGE_INTERVAL = float(os.getenv("JOB_PURGE_INTERVAL", "300"))
+# Rows deleted per transaction, so a large sweep never holds the write lock for long
+JOB_PURGE_BATCH = 1000
+
+QUEUED, RUNNING, SUCCEEDED, FAILED = "queued", "running", "succeeded", "failed"
+
+# Latency samples kept for the percentiles in stats()
+LATENCY_WINDOW = 1000
+
+logger = logging.getLogger(__name__)
+
+class PermanentJobError(Exception):
+    # Raised by a handler when retrying cannot help (e.g. the row it works on is gone)
+    pass
+
+_handlers = {}
+
+def handler(kind: str):
+    def register(func):
+        _handlers[kind] = func
+        return func
+    return register
+
+def new_job(kind: str, payload: dict, max_attempts: int = JOB_MAX_ATTEMPTS) -> models.Job:
+    now = datetime.utcnow()
+    return models.Job(
+        kind=kind, payload=json.dumps(payload), status=QUEUED, attempts=0,
+        max_attempts=max_attempts, created_at=now, run_after=now
+    )
+
+def retry_delay(attempts: int) -> float:
+    # 2s, 4s, 8s ... capped, with jitter so failed jobs do not retry in lockstep
+    delay = min(JOB_RETRY_MAX_SECONDS, JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1))
+    return delay * random.uniform(0.5, 1.0)
+
+def claim_statement(now: datetime, lease_until: datetime):
+    job = models.Job
+    next_id = (
+        select(job.id)
+        .where(or_(
+            and_(job.status == QUEUED, job.run_after <= now),
+            and_(job.status == RUNNING, job.locked_until < now),
+        ))
+        .order_by(job.run_after, job.id)
+        .limit(1)
+        .scalar_subquery()
+    )
+    return (
+        update(job)
+        .where(job.id == next_id)
+        .values(status=RUNNING, attempts=job.attempts + 1, locked_until=lease_until, started_at=now)
+        .returning(job.id, job.kind, job.payload, job.attempts, job.max_attempts, job.created_at, job.run_after)
+    )
+
+def purge_statement(cutoff: datetime, limit: int = JOB_PURGE_BATCH):
+    job = models.Job
+    batch = (
+        select(job.id)
+        .where(job.status == SUCCEEDED, job.finished_at < cutoff)
+        .limit(limit)
+        .scalar_subquery()
+    )
+    return delete(job).where(job.id.in_(batch))
+
+def _percentiles(samples) -> dict:
+    if not samples:
+        return {"p50": None, "p95": None, "max": None}
+    ordered = sorted(samples)
+    pick = lambda q: round(ordered[min(len(ordered) - 1, int(q * len(ordered)))], 2)
+    return {"p50": pick(0.5), "p95": pick(0.95), "max": round(ordered[-1], 2)}
+
+class JobQueue:
+    def __init__(self, session_factory=SessionLocal, workers: int = JOB_WORKERS,
+                 poll_interval: float = JOB_POLL_INTERVAL, lease_seconds: float = JOB_LEASE_SECONDS,
+                 retention_seconds: float = JOB_RETENTION_SECONDS, purge_interval: float = JOB_PURGE_INTERVAL):
+        self.session_factory = session_factory
+        self.workers = workers
+        self.poll_interval = poll_interval
+        self.lease_seconds = lease_seconds
+        self.retention_seconds = retention_seconds
+        self.purge_interval = purge_interval
+        self._next_purge = 0.0  # time.monotonic() of the next sweep
+        self._wake = threading.Event()
+        self._stop = threading.Event()
+        self._threads = []
+        self._lock = threading.Lock()
+        self._wait_ms = deque(maxlen=LATENCY_WINDOW)  # run_after -> claimed
+        self._run_ms = deque(maxlen=LATENCY_WINDOW)  # claimed -> finished
+        self.succeeded = 0
+        self.retried = 0
+        self.failed = 0
+        self.purged = 0
+
+    def start(self):
+        if self._threads:
+            return
+        self._stop.clear()
+        for n in range(self.workers):
+            thread = threading.Thread(target=self._worker, name=f"job-worker-{n}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+
+    def stop(self, timeout: float = 10):
+        # Running jobs finish; anything still queued waits in the table for the next start
+        self._stop.set()
+        self._wake.set()
+        for thread in self._threads:
+            thread.join(timeout)
+        self._threads = []
+
+    def notify(self):
+        # Called after a commit that enqueued jobs so idle workers do not wait for the next poll
+        self._wake.set()
+
+    def _worker(self):
+        while not self._stop.is_set():
+            self._wake.clear()
+            try:
+                while not self._stop.is_set() and self.run_next():
+                    pass
+                self._purge_if_due()
+            except Exception:
+                logger.exception("Job worker error")
+            self._wake.wait(self.poll_interval)
+
+    def _purge_if_due(self):
+        # One sweep per interval across this process's workers
+        with self._lock:
+            if time.monotonic() < self._next_purge:
+                return
+            self._next_purge = time.monotonic() + self.purge_interval
+        self.purge()
+
+    def purge(self, now: Optional[datetime] = None) -> int:
+        # Deletes succeeded jobs that finished more than retention_seconds ago
+        cutoff = (now or datetime.utcnow()) - timedelta(seconds=self.retention_seconds)
+        removed = 0
+        while True:
+            db = self.session_factory()
+            try:
+                count = db.execute(purge_statement(cutoff)).rowcount
+                db.commit()
+            finally:
+                db.close()
+            removed += count
+            if count < JOB_PURGE_BATCH:
+                break
+        with self._lock:
+            self.purged += removed
+        return removed
+
+    def run_next(self) -> bool:
+        # Claims and runs one job; False when nothing is runnable
+        db = self.session_factory()
+        try:
+            now = datetime.utcnow()
+            claimed = db.execute(claim_statement(now, now + timedelta(seconds=self.lease_seconds))).first()
+            db.commit()
+            if claimed is None:
+                return False
+            self._run(db, claimed, now)
+            return True
+        finally:
+            db.close()
+
+    def _run(self, db, claimed, claimed_at: datetime):
+        job_id, kind, payload, attempts, max_attempts, _, run_after = claimed
+        with self._lock:
+            self._wait_ms.append(max(0.0, (claimed_at - run_after).total_seconds() * 1000))
+
+        start = time.perf_counter()
+        result, error, permanent = None, None, False
+        if attempts > max_attempts:
+            # Its lease expired on the last attempt: the worker died mid-job
+            error, permanent = "lease expired on the final attempt", True
+        elif kind not in _handlers:
+            error, permanent = f"no handler for job kind {kind!r}", True
+        else:
+            try:
+                result = _handlers[kind](db, json.loads(payload))
+                db.commit()
+            except PermanentJobError as e:
+                db.rollback()
+                error, permanent = str(e) or type(e).__name__, True
+            except Exception as e:
+                db.rollback()
+                error = f"{type(e).__name__}: {e}"
+        elapsed_ms = (time.perf_counter() - start) * 1000
+
+        now = datetime.utcnow()
+        if error is None:
+            values = {"status": SUCCEEDED, "finished_at": now, "locked_until": None,
+                      "last_error": None, "result": json.dumps(result) if result is not None else None}
+        elif permanent or attempts >= max_attempts:
+            values = {"status": FAILED, "finished_at": now, "locked_until": None, "last_error": error}
+        else:
+            values = {"status": QUEUED, "locked_until": None, "last_error": error,
+                      "run_after": now + timedelta(seconds=retry_delay(attempts))}
+
+        # Only the holder of this attempt may settle it (the lease may have been taken over)
+        db.execute(
+            update(models.Job)
+            .where(models.Job.id == job_id, models.Job.status == RUNNING, models.Job.attempts == attempts)
+            .values(**values)
+        )
+        db.commit()
+
+        with self._lock:
+            self._run_ms.append(elapsed_ms)
+            if error is None:
+                self.succeeded += 1
+            elif values["status"] == FAILED:
+                self.failed += 1
+            else:
+                self.retried += 1
+
+    def stats(self) -> dict:
+        db = self.session_factory()
+        try:
+            depth = dict(db.execute(
+                select(models.Job.status, func.count()).group_by(models.Job.status)
+            ).all())
+            oldest = db.scalar(select(func.min(models.Job.run_after)).where(models.Job.status == QUEUED))
+        finally:
+            db.close()
+        with self._lock:
+            return {
+                "workers": len(self._threads),
+                "depth": {status: depth.get(status, 0) for status in (QUEUED, RUNNING, SUCCEEDED, FAILED)},
+                "oldest_queued_age_s": round(max(0.0, (datetime.utcnow() - oldest).total_seconds()), 3) if oldest else None,
+                "wait_ms": _percentiles(self._wait_ms),
+                "run_ms": _percentiles(self._run_ms),
+                "succeeded": self.succeeded,
+                "retried": self.retried,
+                "failed": self.failed,
+                "purged": self.purged,
+            }
+
+job_queue = JobQueue()
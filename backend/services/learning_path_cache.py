@@ -0,0 +1,160 @@
+import asyncio
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from services.cpu_executor import cpu_executor
+from services.path_generator import learning_path_pdf, schedule_json
+from utils.binary_response import content_etag
+
+# Learning paths are a pure function of (topic, days, hours_per_day) and most requests ask for
+# the same few combinations, so the serving process keeps the serialized schedules and the
+# rendered PDFs keyed on the normalized request, each bounded by total bytes (schedules by
+# count as well). Identical
+# requests that miss at the same time share one computation in the CPU pool.
+# LEARNING_PATH_WARMUP lists topic:days:hours_per_day combinations built at startup.
+LEARNING_PATH_CACHE_ENTRIES = int(os.getenv("LEARNING_PATH_CACHE_ENTRIES", "256"))
+LEARNING_PATH_SCHEDULE_CACHE_BYTES = int(os.getenv("LEARNING_PATH_SCHEDULE_CACHE_BYTES", str(32 * 1024 * 1024)))
+LEARNING_PATH_PDF_CACHE_BYTES = int(os.getenv("LEARNING_PATH_PDF_CACHE_BYTES", str(64 * 1024 * 1024)))
+LEARNING_PATH_WARMUP = os.getenv(
+    "LEARNING_PATH_WARMUP", "python:30:2,javascript:30:2,react:30:2,java:30:2"
+)
+
+logger = logging.getLogger(__name__)
+
+def normalize(topic: str, days: int, hours_per_day: int) -> tuple:
+    # Case is kept (the name is printed in the schedule); surrounding and repeated spaces are not
+    return " ".join(topic.split()), days, hours_per_day
+
+def parse_warmup(spec: str) -> list:
+    combinations = []
+    for item in filter(None, (part.strip() for part in spec.split(","))):
+        try:
+            topic, days, hours = item.rsplit(":", 2)
+            combinations.append(normalize(topic, int(days), int(hours)))
+        except ValueError:
+            logger.warning("Ignoring learning path warm-up entry %r (expected topic:days:hours_per_day)", item)
+    return combinations
+
+class _LRU:
+    def __init__(self, max_entries: Optional[int] = None, max_bytes: Optional[int] = None):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self._entries = OrderedDict()  # key -> (value, size), least recently used first
+        self._bytes = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry[0]
+
+    def put(self, key, value, size: int):
+        with self._lock:
+            if self.max_bytes is not None and size > self.max_bytes:
+                return
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._bytes -= old[1]
+            self._entries[key] = (value, size)
+            self._bytes += size
+            while self._entries and (
+                (self.max_entries is not None and len(self._entries) > self.max_entries)
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)
+            ):
+                _, (_, evicted_size) = self._entries.popitem(last=False)
+                self._bytes -= evicted_size
+                self.evictions += 1
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+
+    def stats(self) -> dict:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "max_entries": self.max_entries,
+                "bytes": self._bytes,
+                "max_bytes": self.max_bytes,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": round(self.hits / lookups, 4) if lookups else 0.0,
+                "evictions": self.evictions,
+            }
+
+class LearningPathCache:
+    def __init__(self, max_schedules: int = LEARNING_PATH_CACHE_ENTRIES,
+                 max_pdf_bytes: int = LEARNING_PATH_PDF_CACHE_BYTES,
+                 max_schedule_bytes: int = LEARNING_PATH_SCHEDULE_CACHE_BYTES):
+        self.schedules = _LRU(max_entries=max_schedules, max_bytes=max_schedule_bytes)
+        self.pdfs = _LRU(max_bytes=max_pdf_bytes)
+        self._inflight = {}  # (kind, key) -> asyncio.Task; only touched on the event loop
+        self.shared = 0
+
+    async def _get(self, cache: _LRU, kind: str, key: tuple, build):
+        value = cache.get(key)
+        if value is not None:
+            return value
+        task = self._inflight.get((kind, key))
+        if task is None:
+            task = asyncio.ensure_future(build())
+            self._inflight[(kind, key)] = task
+            task.add_done_callback(lambda _: self._inflight.pop((kind, key), None))
+        else:
+            self.shared += 1
+        # Shielded: a caller that goes away does not cancel the work others wait on
+        return await asyncio.shield(task)
+
+    async def schedule(self, topic: str, days: int, hours_per_day: int) -> bytes:
+        # The schedule serialized as JSON
+        key = normalize(topic, days, hours_per_day)
+
+        async def build():
+            body = await cpu_executor.run_async(schedule_json, *key)
+            self.schedules.put(key, body, len(body))
+            return body
+
+        return await self._get(self.schedules, "schedule", key, build)
+
+    async def pdf(self, topic: str, days: int, hours_per_day: int) -> tuple:
+        # (pdf bytes, etag)
+        key = normalize(topic, days, hours_per_day)
+
+        async def build():
+            pdf = await cpu_executor.run_async(learning_path_pdf, *key)
+            entry = (pdf, content_etag(pdf))
+            self.pdfs.put(key, entry, len(pdf))
+            return entry
+
+        return await self._get(self.pdfs, "pdf", key, build)
+
+    async def warm_up(self, combinations: list):
+        # Sequential, so warming up never takes more than one pool worker at a time
+        for topic, days, hours_per_day in combinations:
+            try:
+                await self.schedule(topic, days, hours_per_day)
+                await self.pdf(topic, days, hours_per_day)
+            except Exception:
+                logger.exception("Learning path warm-up failed for %s:%s:%s", topic, days, hours_per_day)
+
+    def clear(self):
+        self.schedules.clear()
+        self.pdfs.clear()
+
+    def stats(self) -> dict:
+        return {"schedules": self.schedules.stats(), "pdfs": self.pdfs.stats(), "shared_misses": self.shared}
+
+learning_path_cache = LearningPathCache()
@@ -1,4 +1,4 @@
-from typing import List, Dict
+from typing import Dict, Iterator, List, Tuple
 import math
 
 # Knowledge base for common topics
@@ -29,82 +29,84 @@ TOPIC_KNOWLEDGE_BASE = {
     ]
 }
 
-def generate_schedule(topic: str, days: int, hours_per_day: int) -> Dict:
+def topic_key(topic: str) -> str:
+    return " ".join(topic.lower().split())
+
+def course_topic_keys(course_title: str) -> List[str]:
+    # Learning path topics a course counts for: its full title, plus any known topic named
+    # in it ("Python Programming" -> "python programming", "python")
+    key = topic_key(course_title)
+    words = key.split()
+    return [key] + [known for known in TOPIC_KNOWLEDGE_BASE if known in words and known != key]
+
+def _base_topics(topic: str) -> List[str]:
+    # Known topics or generic ones
     topic_key = topic.lower()
-    
-    # Get topics or generate generic ones
     if topic_key in TOPIC_KNOWLEDGE_BASE:
-        base_topics = TOPIC_KNOWLEDGE_BASE[topic_key]
-    else:
-        base_topics = [f"{topic} Fundamentals {i+1}" for i in range(12)]
+        return TOPIC_KNOWLEDGE_BASE[topic_key]
+    return [f"{topic} Fundamentals {i+1}" for i in range(12)]
 
-    # Calculate phases
-    total_hours = days * hours_per_day
-    
-    # Define phase distribution (approximate)
-    # Phase 1: Basics (30%)
-    # Phase 2: Core/Deep Dive (40%)
-    # Phase 3: Advanced/Project (30%)
-    
+def schedule_phases(days: int, topic_count: int = 12) -> List[Tuple[str, int, int, int, str]]:
+    # (phase, days, first topic index, end topic index, activity)
+    # Phase 1: Basics (30%), Phase 2: Core/Deep Dive (40%), Phase 3: Advanced/Project (remainder)
     phase1_days = math.ceil(days * 0.3)
     phase2_days = math.ceil(days * 0.4)
-    # Remainder for phase 3
     phase3_days = days - phase1_days - phase2_days
-    
-    schedule = []
-    
-    # Helper to get topic index
-    def get_topic(day_idx, total_days_in_phase, phase_topics_start, phase_topics_end):
-        # Map day progress to topic index range
-        progress = day_idx / total_days_in_phase
-        topic_idx = phase_topics_start + int(progress * (phase_topics_end - phase_topics_start))
-        if topic_idx >= len(base_topics):
-            topic_idx = len(base_topics) - 1
-        return base_topics[topic_idx]
+    return [
+        ("Fundamentals", phase1_days, 0, topic_count // 3, "Read docs & practice basic syntax"),
+        ("Deep Dive", phase2_days, topic_count // 3, 2 * topic_count // 3, "Build small components/scripts"),
+        ("Advanced & Projects", phase3_days, 2 * topic_count // 3, topic_count, "Final Project implementation"),
+    ]
 
-    # Generate Schedule
-    current_day = 1
-    
-    # Phase 1
-    for i in range(phase1_days):
-        topic_name = get_topic(i, phase1_days, 0, len(base_topics) // 3)
-        schedule.append({
-            "day": current_day,
-            "phase": "Fundamentals",
-            "topic": topic_name,
-            "hours": hours_per_day,
-            "activity": "Read docs & practice basic syntax"
-        })
-        current_day += 1
-        
-    # Phase 2
-    for i in range(phase2_days):
-        topic_name = get_topic(i, phase2_days, len(base_topics) // 3, 2 * len(base_topics) // 3)
-        schedule.append({
-            "day": current_day,
-            "phase": "Deep Dive",
-            "topic": topic_name,
-            "hours": hours_per_day,
-            "activity": "Build small components/scripts"
-        })
-        current_day += 1
-        
-    # Phase 3
-    for i in range(phase3_days):
-        topic_name = get_topic(i, phase3_days, 2 * len(base_topics) // 3, len(base_topics))
-        schedule.append({
-            "day": current_day,
-            "phase": "Advanced & Projects",
-            "topic": topic_name,
-            "hours": hours_per_day,
-            "activity": "Final Project implementation"
-        })
-        current_day += 1
-        
+def schedule_summary(topic: str, days: int, hours_per_day: int) -> Dict:
     return {
         "course_name": topic,
         "total_days": days,
         "hours_per_day": hours_per_day,
-        "total_hours": total_hours,
-        "schedule": schedule
+        "total_hours": days * hours_per_day,
     }
+
+def iter_schedule(topic: str, days: int, hours_per_day: int) -> Iterator[Dict]:
+    # One day at a time, so long plans can be streamed or paginated without building the list
+    base_topics = _base_topics(topic)
+    current_day = 1
+    for phase, phase_days, first_topic, end_topic, activity in schedule_phases(days, len(base_topics)):
+        for i in range(phase_days):
+            # Map day progress within the phase to a topic in the phase's range
+            topic_idx = min(first_topic + int(i / phase_days * (end_topic - first_topic)), len(base_topics) - 1)
+            yield {
+                "day": current_day,
+                "phase": phase,
+                "topic": base_topics[topic_idx],
+                "hours": hours_per_day,
+                "activity": activity
+            }
+            current_day += 1
+
+def generate_schedule(topic: str, days: int, hours_per_day: int) -> Dict:
+    return {**schedule_summary(topic, days, hours_per_day), "schedule": list(iter_schedule(topic, days, hours_per_day))}
+
+def schedule_json(topic: str, days: int, hours_per_day: int) -> bytes:
+    # Serialized in the worker: bytes are cheaper to send back than the nested dicts
+    from utils.fast_json import dumps
+    return dumps(generate_schedule(topic, days, hours_per_day))
+
+def iter_schedule_ndjson(topic: str, days: int, hours_per_day: int, lines_per_chunk: int = 64) -> Iterator[bytes]:
+    # NDJSON: the summary line first, then one line per day, sent in chunks of lines_per_chunk
+    from utils.fast_json import dumps
+    yield dumps(schedule_summary(topic, days, hours_per_day)) + b"\n"
+    lines = []
+    for item in iter_schedule(topic, days, hours_per_day):
+        lines.append(dumps(item))
+        if len(lines) == lines_per_chunk:
+            yield b"\n".join(lines) + b"\n"
+            lines = []
+    if lines:
+        yield b"\n".join(lines) + b"\n"
+
+def learning_path_pdf(topic: str, days: int, hours_per_day: int) -> bytes:
+    # Schedule and PDF in one call so a CPU pool worker does both in a single round trip.
+    # reportlab is heavy, only load it once a PDF is actually requested
+    from utils.pdf_generator import create_learning_path_pdf
+    data = {**schedule_summary(topic, days, hours_per_day), "schedule": iter_schedule(topic, days, hours_per_day)}
+    return create_learning_path_pdf(data).getvalue()
@@ -0,0 +1,77 @@
+import re
+
+from sqlalchemy import text
+
+# SQLite FTS5 index over course titles/descriptions and lesson titles/content.
+# Course rows use rowid = -course.id and lesson rows rowid = lesson.id, so triggers
+# can address a row directly instead of scanning the UNINDEXED columns.
+SEARCH_TABLE = "course_search"
+
+CREATE_TABLE = f"""
+CREATE VIRTUAL TABLE IF NOT EXISTS {SEARCH_TABLE} USING fts5(
+    title, body, course_id UNINDEXED, lesson_id UNINDEXED,
+    tokenize = 'unicode61 remove_diacritics 2', prefix = '2 3'
+)
+"""
+
+TRIGGERS = [
+    f"""CREATE TRIGGER IF NOT EXISTS courses_search_ai AFTER INSERT ON courses BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, title, body, course_id, lesson_id)
+        VALUES (-new.id, new.title, new.description, new.id, NULL);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS courses_search_au AFTER UPDATE OF title, description ON courses BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = -old.id;
+        INSERT INTO {SEARCH_TABLE} (rowid, title, body, course_id, lesson_id)
+        VALUES (-new.id, new.title, new.description, new.id, NULL);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS courses_search_ad AFTER DELETE ON courses BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = -old.id;
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS lessons_search_ai AFTER INSERT ON lessons BEGIN
+        INSERT INTO {SEARCH_TABLE} (rowid, title, body, course_id, lesson_id)
+        VALUES (new.id, new.title, new.content, new.course_id, new.id);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS lessons_search_au AFTER UPDATE OF title, content, course_id ON lessons BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+        INSERT INTO {SEARCH_TABLE} (rowid, title, body, course_id, lesson_id)
+        VALUES (new.id, new.title, new.content, new.course_id, new.id);
+    END""",
+    f"""CREATE TRIGGER IF NOT EXISTS lessons_search_ad AFTER DELETE ON lessons BEGIN
+        DELETE FROM {SEARCH_TABLE} WHERE rowid = old.id;
+    END""",
+]
+
+# bm25 weights: title matches count 5x more than body matches; bm25 is lower-is-better, so negate it
+SEARCH_SQL = text(f"""
+SELECT s.course_id, s.lesson_id, c.title AS course_title,
+       snippet({SEARCH_TABLE}, 0, '<mark>', '</mark>', '…', 12) AS title,
+       snippet({SEARCH_TABLE}, 1, '<mark>', '</mark>', '…', 24) AS snippet,
+       -bm25({SEARCH_TABLE}, 5.0, 1.0) AS score
+FROM {SEARCH_TABLE} AS s
+JOIN courses AS c ON c.id = s.course_id
+WHERE {SEARCH_TABLE} MATCH :match
+ORDER BY score DESC
+LIMIT :limit
+""")
+
+def build_match_expression(query: str):
+    # Every word must match, each as a prefix: "pyth basi" -> "pyth"* "basi"*
+    terms = re.findall(r"\w+", query)
+    return " ".join(f'"{term}"*' for term in terms) or None
+
+def install(conn):
+    conn.execute(text(CREATE_TABLE))
+    for trigger in TRIGGERS:
+        conn.execute(text(trigger))
+
+def rebuild(conn):
+    conn.execute(text(f"DELETE FROM {SEARCH_TABLE}"))
+    conn.execute(text(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, body, course_id, lesson_id) "
+        "SELECT -id, title, description, id, NULL FROM courses"
+    ))
+    conn.execute(text(
+        f"INSERT INTO {SEARCH_TABLE} (rowid, title, body, course_id, lesson_id) "
+        "SELECT id, title, content, course_id, id FROM lessons"
+    ))
+    conn.execute(text(f"INSERT INTO {SEARCH_TABLE} ({SEARCH_TABLE}) VALUES ('optimize')"))
@@ -0,0 +1,122 @@
+import asyncio
+import os
+import tempfile
+
+import conftest  # CPU pool runs inline; must come before the services imports
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from routers import learning_path
+from utils.binary_response import (
+    BINARY_CHUNK_SIZE, BytesResponse, RangeNotSatisfiable, binary_response, content_etag, file_response, parse_range
+)
+
+# Binary downloads: Content-Length, fixed size chunks, Range / 206 / 416 and If-None-Match.
+# Usage: python test_binary_response.py
+
+BODY = bytes(range(256)) * 1000  # 256000 bytes, not a multiple of the chunk size
+
+def _app(path):
+    app = FastAPI()
+
+    @app.get("/bytes")
+    def get_bytes(request: Request):
+        return binary_response(request, BODY, "application/pdf", filename="body.pdf")
+
+    @app.get("/file")
+    def get_file(request: Request):
+        return file_response(request, path, content_etag(BODY), "application/pdf", filename="body.pdf")
+
+    app.include_router(learning_path.router)
+    return TestClient(app)
+
+def test_parse_range():
+    assert parse_range("bytes=0-99", 1000) == (0, 99)
+    assert parse_range("bytes=900-", 1000) == (900, 999)
+    assert parse_range("bytes=-100", 1000) == (900, 999)
+    assert parse_range("bytes=990-2000", 1000) == (990, 999)
+    assert parse_range("bytes=-5000", 1000) == (0, 999)
+    # Ignored (whole body): malformed, reversed or several ranges
+    for header in ("bytes=", "items=0-1", "bytes=5-1", "bytes=0-1,5-6"):
+        assert parse_range(header, 1000) is None, header
+    for header in ("bytes=1000-", "bytes=-0"):
+        try:
+            parse_range(header, 1000)
+        except RangeNotSatisfiable:
+            continue
+        raise AssertionError(f"{header} should not be satisfiable")
+
+def test_bytes_response_sends_fixed_chunks():
+    messages = []
+
+    async def receive():
+        return {"type": "http.request"}
+
+    async def send(message):
+        messages.append(message)
+
+    asyncio.run(BytesResponse(BODY, media_type="application/pdf")({"type": "http", "method": "GET"}, receive, send))
+
+    headers = dict(messages[0]["headers"])
+    assert headers[b"content-length"] == str(len(BODY)).encode()
+    sizes = [len(message["body"]) for message in messages[1:]]
+    assert sizes[:-1] == [BINARY_CHUNK_SIZE] * (len(sizes) - 1) and 0 < sizes[-1] <= BINARY_CHUNK_SIZE
+    assert [message["more_body"] for message in messages[1:]] == [True] * (len(sizes) - 1) + [False]
+    assert b"".join(message["body"] for message in messages[1:]) == BODY
+
+def test_range_and_conditional_requests():
+    path = os.path.join(tempfile.mkdtemp(), "body.pdf")
+    with open(path, "wb") as f:
+        f.write(BODY)
+    client = _app(path)
+    etag = content_etag(BODY)
+
+    for url in ("/bytes", "/file"):
+        full = client.get(url)
+        assert full.status_code == 200 and full.content == BODY, url
+        assert full.headers["content-length"] == str(len(BODY))
+        assert full.headers["accept-ranges"] == "bytes" and full.headers["etag"] == etag
+        assert full.headers["content-disposition"] == 'attachment; filename="body.pdf"'
+
+        # Resume after the first 100000 bytes
+        part = client.get(url, headers={"Range": "bytes=100000-"})
+        assert part.status_code == 206, url
+        assert part.content == BODY[100000:]
+        assert part.headers["content-range"] == f"bytes 100000-{len(BODY) - 1}/{len(BODY)}"
+        assert part.headers["content-length"] == str(len(BODY) - 100000)
+
+        assert client.get(url, headers={"Range": "bytes=-10"}).content == BODY[-10:]
+        unsatisfiable = client.get(url, headers={"Range": f"bytes={len(BODY)}-"})
+        assert unsatisfiable.status_code == 416
+        assert unsatisfiable.headers["content-range"] == f"bytes */{len(BODY)}"
+
+        # A changed resource (If-Range mismatch) is sent whole
+        stale = client.get(url, headers={"Range": "bytes=0-9", "If-Range": '"other"'})
+        assert stale.status_code == 200 and stale.content == BODY
+        assert client.get(url, headers={"Range": "bytes=0-9", "If-Range": etag}).content == BODY[:10]
+
+        not_modified = client.get(url, headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304 and not_modified.content == b""
+        assert not_modified.headers["etag"] == etag
+
+def test_learning_path_pdf():
+    client = _app(None)
+    params = {"course_name": "python", "days": 30, "hours_per_day": 2}
+    posted = client.post("/learning-path/download", json=params)
+    assert posted.status_code == 200 and posted.content.startswith(b"%PDF-")
+    assert posted.headers["content-length"] == str(len(posted.content))
+    etag = posted.headers["etag"]
+
+    # Same request, same bytes: the GET twin revalidates and resumes against the POST's ETag
+    assert client.get("/learning-path/download", params=params, headers={"If-None-Match": etag}).status_code == 304
+    tail = client.get("/learning-path/download", params=params, headers={"Range": "bytes=1000-", "If-Range": etag})
+    assert tail.status_code == 206 and tail.content == posted.content[1000:]
+    # Conditional headers do not apply to POST
+    assert client.post("/learning-path/download", json=params, headers={"If-None-Match": etag}).status_code == 200
+
+if __name__ == "__main__":
+    test_parse_range()
+    test_bytes_response_sends_fixed_chunks()
+    test_range_and_conditional_requests()
+    test_learning_path_pdf()
+    print("Binary response checks passed.")
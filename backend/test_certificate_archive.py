@@ -0,0 +1,61 @@
+import io
+import zipfile
+from datetime import datetime
+
+import conftest  # scratch certificate store; must come before the services imports
+from services.certificate_archive import iter_certificate_archive
+from services.certificate_store import certificate_store, render_certificate
+
+# The cohort archive streams entries as they are ready, survives failed renders and finds
+# stored PDFs from one store listing.
+# Usage: python test_certificate_archive.py
+
+ISSUED = datetime(2026, 1, 2, 3, 4, 5)
+
+def _rows(prefix, count):
+    return [(f"{prefix}-{i:04d}", f"Student {i}", ISSUED) for i in range(count)]
+
+def test_archive_streams_before_all_renders_finish():
+    rows = _rows("ARCH", 24)
+    # Half are already in the store, the rest must be rendered while streaming
+    for code, fullname, issued in rows[::2]:
+        certificate_store.put(code, render_certificate(code, fullname, "Course", issued))
+
+    chunks = iter_certificate_archive(rows, "Course", window=4)
+    first = next(chunks)
+    stored_at_first_chunk = sum(certificate_store.get(code) is not None for code, _, _ in rows)
+    body = first + b"".join(chunks)
+
+    assert stored_at_first_chunk < len(rows), "archive waited for every render"
+    archive = zipfile.ZipFile(io.BytesIO(body))
+    assert archive.testzip() is None
+    assert archive.namelist() == [f"Certificate-{code}.pdf" for code, _, _ in rows]
+    assert all(archive.read(name).startswith(b"%PDF-") for name in archive.namelist())
+    assert all(certificate_store.get(code) is not None for code, _, _ in rows)
+
+def test_failed_render_is_listed():
+    rows = _rows("FAIL", 3)
+    rows[1] = (rows[1][0], None, ISSUED)  # no name to draw: reportlab raises
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(iter_certificate_archive(rows, "Course"))))
+
+    assert archive.namelist() == [f"Certificate-{rows[0][0]}.pdf", f"Certificate-{rows[2][0]}.pdf", "FAILED.txt"]
+    assert archive.read("FAILED.txt").startswith(rows[1][0].encode())
+
+def test_stored_certificates_come_from_one_listing():
+    rows = _rows("LIST", 12)
+    for code, fullname, issued in rows:
+        certificate_store.put(code, render_certificate(code, fullname, "Course", issued))
+    before = certificate_store.stats()
+
+    archive = zipfile.ZipFile(io.BytesIO(b"".join(iter_certificate_archive(rows, "Course"))))
+
+    after = certificate_store.stats()
+    assert len(archive.namelist()) == len(rows)
+    assert after["scans"] - before["scans"] == 1
+    assert [after[k] - before[k] for k in ("hits", "disk_hits", "misses", "writes")] == [0, 0, 0, 0]
+
+if __name__ == "__main__":
+    test_archive_streams_before_all_renders_finish()
+    test_failed_render_is_listed()
+    test_stored_certificates_come_from_one_listing()
+    print("Certificate archive checks passed.")
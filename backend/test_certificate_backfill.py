@@ -0,0 +1,119 @@
+import os
+import tempfile
+
+from conftest import scratch_database, seed
+from services import certificate_backfill as backfill
+from services.certificate_store import CertificateStore, render_certificate
+from services.cpu_executor import CpuExecutor
+import models
+
+# Backfill renders every missing PDF exactly once, resumes from its checkpoint after an
+# interruption, leaves the store alone in dry-run mode and lists the store once per run
+# instead of looking up every row.
+# Usage: python test_certificate_backfill.py
+
+CERTIFICATES = 23
+
+class CountingExecutor(CpuExecutor):
+    def __init__(self):
+        super().__init__(workers=0)
+        self.codes = []
+
+    def submit(self, fn, *args):
+        self.codes.extend(code for code, *_ in args[0])
+        return super().submit(fn, *args)
+
+class CountingStore(CertificateStore):
+    def __init__(self):
+        super().__init__(tempfile.mkdtemp(), rescan_seconds=3600)
+        self.lookups = 0
+
+    def get(self, code):
+        self.lookups += 1
+        return super().get(code)
+
+class Interrupted(Exception):
+    pass
+
+def _session_factory():
+    _, Session = scratch_database("backfill")
+    seed(Session, *[models.Course(id=i, title=f"Course {i}", description="d") for i in range(1, CERTIFICATES + 1)])
+    seed(Session, *[models.Certificate(user_id=1, course_id=i, certificate_code=f"BF-{i:04d}")
+                    for i in range(1, CERTIFICATES + 1)])
+    return Session
+
+def _checkpoint(Session, force=False):
+    db = Session()
+    try:
+        return backfill.new_checkpoint(db, force=force)
+    finally:
+        db.close()
+
+def _codes():
+    return [f"BF-{i:04d}" for i in range(1, CERTIFICATES + 1)]
+
+def test_dry_run_renders_nothing():
+    Session = _session_factory()
+    store = CertificateStore(tempfile.mkdtemp())
+    store.put("BF-0001", render_certificate("BF-0001", "Ada", "Course 1", None))
+    executor = CountingExecutor()
+
+    result = backfill.run_backfill(_checkpoint(Session), executor, store=store, session_factory=Session,
+                                   batch_size=5, dry_run=True, report=lambda line: None)
+
+    assert (result["rendered"], result["skipped"]) == (CERTIFICATES - 1, 1)
+    assert executor.codes == [] and store.stats()["files"] == 1
+
+def test_interrupted_run_resumes_from_checkpoint():
+    Session = _session_factory()
+    store = CertificateStore(tempfile.mkdtemp())
+    path = os.path.join(tempfile.mkdtemp(), "checkpoint.json")
+    executor = CountingExecutor()
+    lines = []
+
+    def crash_after_two_batches(line):
+        lines.append(line)
+        if len(lines) == 3:  # header line + two batches
+            raise Interrupted()
+
+    try:
+        backfill.run_backfill(_checkpoint(Session), executor, store=store, session_factory=Session,
+                              batch_size=5, checkpoint_path=path, report=crash_after_two_batches)
+        raise AssertionError("the run was not interrupted")
+    except Interrupted:
+        pass
+    saved = backfill.load_checkpoint(path)
+    assert saved["last_id"] == 10 and saved["rendered"] == 10 and not saved["done"]
+
+    result = backfill.run_backfill(saved, executor, store=store, session_factory=Session,
+                                   batch_size=5, chunk_size=2, checkpoint_path=path, report=lambda line: None)
+    assert result["done"] and result["rendered"] == CERTIFICATES and result["failed"] == 0
+    assert executor.codes == _codes(), "each certificate is rendered exactly once"
+    assert all(store.get(code) is not None for code in _codes())
+
+    # A second run finds everything stored; --force renders it all again
+    again = backfill.run_backfill(_checkpoint(Session), executor, store=store, session_factory=Session,
+                                  report=lambda line: None)
+    assert (again["rendered"], again["skipped"]) == (0, CERTIFICATES)
+    forced = backfill.run_backfill(_checkpoint(Session, force=True), executor, store=store,
+                                   session_factory=Session, report=lambda line: None)
+    assert forced["rendered"] == CERTIFICATES and executor.codes == _codes() * 2
+
+def test_one_store_listing_per_run():
+    Session = _session_factory()
+    store = CountingStore()
+    store.put("BF-0001", render_certificate("BF-0001", "Ada", "Course 1", None))
+    scans = store.scans
+
+    for dry_run in (True, False):
+        result = backfill.run_backfill(_checkpoint(Session), CountingExecutor(), store=store, session_factory=Session,
+                                       batch_size=2, dry_run=dry_run, report=lambda line: None)
+        assert (result["rendered"], result["skipped"]) == (CERTIFICATES - 1, 1)
+    assert store.lookups == 0
+    assert store.scans - scans == 2, "one listing per run, however many rows and batches"
+
+if __name__ == "__main__":
+    test_dry_run_renders_nothing()
+    test_one_store_listing_per_run()
+    test_interrupted_run_resumes_from_checkpoint()
+    print("Certificate backfill checks passed.")
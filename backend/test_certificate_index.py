@@ -0,0 +1,88 @@
+import json
+
+from conftest import scratch_database, seed
+from sqlalchemy import event
+
+from services.certificate_index import CertificateIndex
+import models
+
+# Verification lookups come from memory; unknown codes reach the DB at most once per interval.
+# Usage: python test_certificate_index.py
+
+def _index(sync_seconds=3600):
+    engine, Session = scratch_database("index")
+    seed(
+        Session,
+        models.Course(id=1, title="Course", description="d"),
+        models.Course(id=2, title="Other", description="d"),
+        models.Certificate(user_id=1, course_id=1, certificate_code="LMS-0001"),
+    )
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(1))
+    index = CertificateIndex(Session, sync_seconds)
+    index.sync()
+    return index, Session, statements
+
+def _verify(index, code):
+    # Same steps as the route
+    body = index.lookup(code)
+    if body is None and index.should_sync(code):
+        index.sync()
+        body = index.lookup(code)
+    return json.loads(body) if body else None
+
+def test_known_code_needs_no_query():
+    index, _, statements = _index()
+    statements.clear()
+    result = _verify(index, "LMS-0001")
+    assert result["holder"] == "Ada" and result["course"] == "Course"
+    assert not statements
+
+def test_bogus_codes_are_throttled():
+    index, _, statements = _index()
+    _verify(index, "LMS-FFFF")  # the index starts stale: first miss catches up
+    statements.clear()
+    for i in range(500):
+        assert _verify(index, f"LMS-BOGUS{i}") is None
+    assert _verify(index, "not a code!") is None
+    assert not statements, f"{len(statements)} queries for bogus codes"
+
+def test_issue_marks_index_stale():
+    index, Session, _ = _index()
+    _verify(index, "LMS-FFFF")
+    db = Session()
+    db.add(models.Certificate(user_id=1, course_id=2, certificate_code="LMS-0002"))
+    db.commit()
+    db.close()
+    assert _verify(index, "LMS-0002") is None  # throttled, not yet known
+    index.mark_stale()
+    assert _verify(index, "LMS-0002")["course"] == "Other"
+
+def test_rename_user():
+    index, _, _ = _index()
+    index.rename_user(1, "Ada Lovelace")
+    assert _verify(index, "LMS-0001")["holder"] == "Ada Lovelace"
+
+def test_reload_drops_deleted_and_renamed():
+    index, Session, _ = _index()
+    db = Session()
+    db.add(models.Certificate(user_id=1, course_id=2, certificate_code="LMS-0002"))
+    db.commit()
+    index.sync()
+    db.query(models.Certificate).filter(models.Certificate.certificate_code == "LMS-0001").delete()
+    db.get(models.Course, 2).title = "Other, renamed"
+    db.commit()
+    db.close()
+    assert _verify(index, "LMS-0001") is not None  # catch-up only sees new rows
+    index.reload()
+    assert _verify(index, "LMS-0001") is None
+    assert _verify(index, "LMS-0002")["course"] == "Other, renamed"
+    assert index.stats()["reloads"] == 1 and index.stats()["codes"] == 1
+
+if __name__ == "__main__":
+    test_known_code_needs_no_query()
+    test_bogus_codes_are_throttled()
+    test_issue_marks_index_stale()
+    test_rename_user()
+    test_reload_drops_deleted_and_renamed()
+    print("Certificate index checks passed.")
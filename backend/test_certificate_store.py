@@ -0,0 +1,89 @@
+import os
+import tempfile
+import time
+
+from conftest import scratch_database, seed
+from fastapi import HTTPException
+
+from repositories.implementations.certificate_repository import CertificateRepository
+from repositories.unit_of_work import UnitOfWork
+from services.certificate_store import CertificateStore, certificate_store
+from services.implementations.certificate_service import CertificateService
+import models
+
+# Processes sharing one store directory: files written elsewhere are found instead of being
+# re-rendered, re-renders replace the old file, and the size cap holds for the whole directory.
+# Lookups never list the directory, and made-up download codes never reach the disk.
+# Usage: python test_certificate_store.py
+
+def _pair(max_bytes=10_000):
+    directory = tempfile.mkdtemp()
+    return directory, CertificateStore(directory, max_bytes, rescan_seconds=0), CertificateStore(directory, max_bytes, rescan_seconds=0)
+
+def test_files_from_another_process_are_found():
+    _, api, worker = _pair()
+    assert api.get("A") is None
+    worker.put("A", b"a" * 100)
+    assert api.get("A") is not None and api.get("A") is not None
+    stats = api.stats()
+    assert (stats["misses"], stats["disk_hits"], stats["hits"]) == (1, 1, 1)
+
+def test_rerender_elsewhere_replaces_the_file():
+    _, api, worker = _pair()
+    worker.put("A", b"old" * 10)
+    assert api.get("A") is not None
+    worker.put("A", b"new" * 10)
+    with open(api.get("A").path, "rb") as f:
+        assert f.read() == b"new" * 10
+
+def test_cap_covers_the_whole_directory():
+    directory, api, worker = _pair(max_bytes=250)
+    for store, code in ((api, "A"), (api, "B"), (worker, "C")):
+        store.put(code, code.encode() * 100)
+        time.sleep(0.01)  # distinct mtimes: the oldest file goes first
+    assert sorted(name[0] for name in os.listdir(directory) if name.endswith(".pdf")) == ["B", "C"]
+    assert worker.stats()["bytes"] == 200
+
+def test_lookups_do_not_scan():
+    _, api, worker = _pair()
+    for i in range(50):
+        worker.put(f"C{i}", b"x" * 10)
+    assert api.get("C1") is not None  # first use: one scan to load the index
+    for i in range(200):
+        assert api.get(f"UNKNOWN-{i}") is None
+    assert api.get("C2") is not None and api.get("C2").etag
+    assert api.stats()["scans"] == 1
+    assert api.stored_keys() == {f"C{i}" for i in range(50)}
+
+def test_earlier_layout_is_converted():
+    directory, api, _ = _pair()
+    with open(os.path.join(directory, "OLD." + "a" * 32 + ".pdf"), "wb") as f:
+        f.write(b"old layout")
+    with open(api.get("OLD").path, "rb") as f:
+        assert f.read() == b"old layout"
+    assert os.listdir(directory) == ["OLD.pdf"]
+
+def test_unknown_download_code_skips_the_store():
+    _, Session = scratch_database("store")
+    seed(Session, models.Course(id=1, title="Course", description="d"),
+         models.Certificate(user_id=1, course_id=1, certificate_code="STORE-0001"))
+    db = Session()
+    service = CertificateService(CertificateRepository(db), UnitOfWork(db))
+    before = certificate_store.stats()
+    try:
+        service.get_certificate_file("MADE-UP")
+        raise AssertionError("a made-up code was served")
+    except HTTPException as e:
+        assert e.status_code == 404
+    assert certificate_store.stats()["misses"] == before["misses"]
+    assert service.get_certificate_file("STORE-0001").etag  # known code: rendered and stored
+    db.close()
+
+if __name__ == "__main__":
+    test_files_from_another_process_are_found()
+    test_rerender_elsewhere_replaces_the_file()
+    test_cap_covers_the_whole_directory()
+    test_lookups_do_not_scan()
+    test_earlier_layout_is_converted()
+    test_unknown_download_code_skips_the_store()
+    print("Certificate store checks passed.")
@@ -0,0 +1,47 @@
+import re
+import zlib
+
+from utils.pdf_generator import CertificateTemplate, generate_certificate_pdf
+
+# The stamped certificate must be a well formed PDF carrying the variable text.
+# Usage: python test_certificate_template.py
+
+def _objects(pdf):
+    # xref offsets must point at the matching "N 0 obj" header
+    start = int(re.search(rb"startxref\n(\d+)\n%%EOF\n$", pdf).group(1))
+    assert pdf[start:].startswith(b"xref\n0 9\n")
+    offsets = [int(line[:10]) for line in pdf[start:].split(b"\n")[3:11]]
+    for number, offset in enumerate(offsets, start=1):
+        assert pdf[offset:].startswith(b"%d 0 obj\n" % number), f"object {number} not at {offset}"
+    return offsets
+
+def test_template_pdf_structure():
+    pdf = generate_certificate_pdf("Ada (Lovelace) \\ Byron", "Python Mastery", "2026-01-01", "LMS-0001").getvalue()
+    assert pdf.startswith(b"%PDF-1.4\n")
+    offsets = _objects(pdf)
+    content = pdf[offsets[6]:offsets[7]]
+    stream = zlib.decompress(content.split(b"stream\n", 1)[1].rsplit(b"\nendstream", 1)[0])
+    assert stream.startswith(b"q /Static Do Q")
+    assert rb"(Ada \(Lovelace\) \\ Byron) Tj" in stream
+    assert b"(Verification Code: LMS-0001) Tj" in stream
+
+def test_uncompressed_template():
+    pdf = CertificateTemplate(compress=False).render("Ada", "Course", "2026-01-01", "LMS-0002")
+    _objects(pdf)
+    assert b"(Ada) Tj" in pdf and b"FlateDecode" not in pdf
+
+def test_same_input_same_bytes():
+    # No timestamps or random IDs, so the store's content hash (ETag) is stable
+    render = lambda: generate_certificate_pdf("Ada", "Course", "2026-01-01", "LMS-0003").getvalue()
+    assert render() == render()
+
+def test_text_outside_winansi_uses_canvas():
+    pdf = generate_certificate_pdf("李雷", "Course", "2026-01-01", "LMS-0004").getvalue()
+    assert b"ReportLab" in pdf
+
+if __name__ == "__main__":
+    test_template_pdf_structure()
+    test_uncompressed_template()
+    test_same_input_same_bytes()
+    test_text_outside_winansi_uses_canvas()
+    print("Certificate template checks passed.")
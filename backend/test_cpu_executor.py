@@ -0,0 +1,73 @@
+import asyncio
+import threading
+import time
+
+from fastapi import HTTPException
+
+from services.cpu_executor import CpuExecutor
+
+# One task timing out or losing its caller must not take down the other tasks in the pool;
+# only a worker that stays stuck gets the pool recycled.
+# Usage: python test_cpu_executor.py
+
+def slow(seconds, value):
+    time.sleep(seconds)
+    return value
+
+def _timed_out(executor, *args):
+    try:
+        executor.run(slow, *args, timeout=0.3)
+    except HTTPException as e:
+        return e.status_code == 503
+    return False
+
+def test_timeout_spares_other_tasks():
+    executor = CpuExecutor(workers=2, stuck_after=60)
+    executor.start()
+    try:
+        results = []
+        neighbour = threading.Thread(target=lambda: results.append(executor.run(slow, 1.5, "neighbour")))
+        neighbour.start()
+        time.sleep(0.2)
+        assert _timed_out(executor, 3, "late")
+        neighbour.join()
+        assert results == ["neighbour"]
+        stats = executor.stats()
+        assert (stats["timeouts"], stats["abandoned"], stats["restarts"]) == (1, 1, 0)
+    finally:
+        executor.shutdown()
+
+def test_cancelled_caller_spares_other_tasks():
+    executor = CpuExecutor(workers=2, stuck_after=60)
+    executor.start()
+
+    async def run():
+        neighbour = asyncio.ensure_future(executor.run_async(slow, 1.5, "neighbour"))
+        gone = asyncio.ensure_future(executor.run_async(slow, 3, "gone"))
+        await asyncio.sleep(0.3)
+        gone.cancel()  # the client disconnected
+        return await neighbour
+
+    try:
+        assert asyncio.run(run()) == "neighbour"
+        assert executor.stats()["restarts"] == 0
+    finally:
+        executor.shutdown()
+
+def test_stuck_worker_recycles_the_pool():
+    executor = CpuExecutor(workers=1, stuck_after=0.2)
+    executor.start()
+    try:
+        assert _timed_out(executor, 30, "stuck")
+        time.sleep(0.3)
+        # The only worker is still busy: the next task replaces the pool instead of queueing forever
+        assert executor.run(slow, 0, "fresh", timeout=10) == "fresh"
+        assert executor.stats()["restarts"] == 1
+    finally:
+        executor.shutdown()
+
+if __name__ == "__main__":
+    test_timeout_spares_other_tasks()
+    test_cancelled_caller_spares_other_tasks()
+    test_stuck_worker_recycles_the_pool()
+    print("CPU executor checks passed.")
@@ -0,0 +1,98 @@
+import os
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+os.environ.setdefault("CERTIFICATE_STORE_DIR", tempfile.mkdtemp())
+
+from fastapi.testclient import TestClient
+from sqlalchemy import func
+from sqlalchemy.orm import sessionmaker
+
+from database import Base, build_engine, get_db
+import main
+import models
+
+# Fires many parallel enroll calls at the same (user, course) and checks that
+# exactly one enrollment exists afterwards and every caller got that row back.
+# Usage: python test_enrollment_concurrency.py
+ENROLL_CALLS = int(os.getenv("ENROLL_STRESS_CALLS", "300"))
+ENROLL_THREADS = int(os.getenv("ENROLL_STRESS_THREADS", "32"))
+ENROLL_P99_BUDGET_MS = float(os.getenv("ENROLL_P99_BUDGET_MS", "1000"))
+
+def _client_with_fresh_db():
+    engine = build_engine(f"sqlite:///{os.path.join(tempfile.mkdtemp(), 'enroll.db')}", "production")
+    Base.metadata.create_all(bind=engine)
+    Session = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+
+    db = Session()
+    db.add_all([models.User(email=f"u{i}@stress.local", password="x") for i in range(10)])
+    db.add(models.Course(title="Stress", description="stress"))
+    db.commit()
+    db.close()
+
+    def override_get_db():
+        db = Session()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    main.app.dependency_overrides[get_db] = override_get_db
+    return TestClient(main.app), Session
+
+def _fire(client, user_ids):
+    def enroll(user_id):
+        start = time.perf_counter()
+        response = client.post("/courses/1/enroll", json={"user_id": user_id})
+        return response, (time.perf_counter() - start) * 1000
+
+    with ThreadPoolExecutor(ENROLL_THREADS) as pool:
+        return list(pool.map(enroll, user_ids))
+
+def _p99(latencies):
+    latencies = sorted(latencies)
+    return latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+
+def test_parallel_enroll_creates_one_row():
+    client, Session = _client_with_fresh_db()
+    try:
+        results = _fire(client, [1] * ENROLL_CALLS)
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert all(response.status_code == 200 for response, _ in results), \
+        {response.status_code for response, _ in results}
+    ids = {response.json()["id"] for response, _ in results}
+    assert len(ids) == 1, f"callers saw different enrollments: {ids}"
+
+    db = Session()
+    rows = db.query(func.count(models.Enrollment.id)).filter(
+        models.Enrollment.user_id == 1, models.Enrollment.course_id == 1
+    ).scalar()
+    db.close()
+    assert rows == 1, f"{rows} enrollment rows for one (user, course)"
+
+    p99 = _p99([latency for _, latency in results])
+    assert p99 <= ENROLL_P99_BUDGET_MS, f"p99 {p99:.1f} ms (budget {ENROLL_P99_BUDGET_MS:.0f} ms)"
+
+def test_parallel_enroll_many_users():
+    client, Session = _client_with_fresh_db()
+    try:
+        results = _fire(client, [i % 10 + 1 for i in range(ENROLL_CALLS)])
+    finally:
+        main.app.dependency_overrides.clear()
+
+    assert all(response.status_code == 200 for response, _ in results)
+    db = Session()
+    rows = db.query(models.Enrollment.user_id, func.count()).group_by(models.Enrollment.user_id).all()
+    db.close()
+    assert sorted(rows) == [(user_id, 1) for user_id in range(1, 11)], rows
+
+    p99 = _p99([latency for _, latency in results])
+    assert p99 <= ENROLL_P99_BUDGET_MS, f"p99 {p99:.1f} ms (budget {ENROLL_P99_BUDGET_MS:.0f} ms)"
+
+if __name__ == "__main__":
+    test_parallel_enroll_creates_one_row()
+    test_parallel_enroll_many_users()
+    print(f"Enrollment stress checks passed ({ENROLL_CALLS} calls, {ENROLL_THREADS} threads).")
@@ -0,0 +1,30 @@
+import os
+import statistics
+import tempfile
+
+from bench_import_time import IMPORT_TIME_BUDGET_MS, LAZY_MODULES, loaded_modules, measure_import
+
+def _env_with_fresh_db():
+    db_path = os.path.join(tempfile.mkdtemp(), "import_check.db")
+    return dict(os.environ, DATABASE_URL=f"sqlite:///{db_path}"), db_path
+
+def test_import_time_budget():
+    env, _ = _env_with_fresh_db()
+    median = statistics.median(measure_import(env=env)["main"] for _ in range(3))
+    assert median <= IMPORT_TIME_BUDGET_MS, f"import main took {median:.1f} ms (budget {IMPORT_TIME_BUDGET_MS:.0f} ms)"
+
+def test_heavy_modules_are_lazy():
+    env, _ = _env_with_fresh_db()
+    lazy = sorted(m for m in loaded_modules(env=env) if m.startswith(LAZY_MODULES))
+    assert not lazy, f"imported at startup: {lazy}"
+
+def test_import_does_not_touch_database():
+    env, db_path = _env_with_fresh_db()
+    loaded_modules(env=env)
+    assert not os.path.exists(db_path), "importing main opened or created the database"
+
+if __name__ == "__main__":
+    test_import_time_budget()
+    test_heavy_modules_are_lazy()
+    test_import_does_not_touch_database()
+    print("Import checks passed.")
@@ -0,0 +1,137 @@
+from datetime import datetime, timedelta
+
+from conftest import scratch_database, seed
+from repositories.implementations.course_repository import CourseRepository
+from repositories.unit_of_work import UnitOfWork
+from services import job_queue as jobs
+from services.certificate_store import certificate_store
+from services.implementations.course_service import CourseService
+import models
+
+# Job queue behaviour without worker threads: each run_next() call is one worker iteration.
+# Usage: python test_job_queue.py
+
+def _session_factory():
+    _, Session = scratch_database("jobs")
+    seed(Session, models.Course(id=1, title="Course", description="d"), models.Enrollment(user_id=1, course_id=1))
+    return Session
+
+def _enqueue(Session, job):
+    db = Session()
+    db.add(job)
+    db.commit()
+    job_id = job.id
+    db.close()
+    return job_id
+
+def _job(Session, job_id):
+    db = Session()
+    job = db.get(models.Job, job_id)
+    db.close()
+    return job
+
+def _make_runnable(Session, job_id):
+    # Skip the backoff wait instead of sleeping through it
+    db = Session()
+    db.get(models.Job, job_id).run_after = datetime.utcnow()
+    db.commit()
+    db.close()
+
+calls = []
+
+@jobs.handler("test.flaky")
+def flaky(db, payload):
+    calls.append(payload)
+    if len(calls) < payload["fail_times"] + 1:
+        raise RuntimeError("transient")
+    return {"calls": len(calls)}
+
+def test_complete_course_enqueues_render():
+    Session = _session_factory()
+    queue = jobs.JobQueue(Session, workers=0)
+
+    db = Session()
+    response = CourseService(CourseRepository(db), UnitOfWork(db)).complete_course(1, 1)
+    db.close()
+    assert response.render_job_id is not None
+    assert _job(Session, response.render_job_id).status == jobs.QUEUED
+
+    assert queue.run_next()
+    assert not queue.run_next()
+    job = _job(Session, response.render_job_id)
+    assert job.status == jobs.SUCCEEDED, job.last_error
+    assert certificate_store.get(response.certificate_code) is not None
+
+def test_failed_job_is_retried_with_backoff():
+    Session = _session_factory()
+    queue = jobs.JobQueue(Session, workers=0)
+    calls.clear()
+    job_id = _enqueue(Session, jobs.new_job("test.flaky", {"fail_times": 2}))
+
+    assert queue.run_next()
+    job = _job(Session, job_id)
+    assert job.status == jobs.QUEUED and job.attempts == 1
+    assert job.run_after > datetime.utcnow()
+    assert not queue.run_next(), "backoff not respected"
+
+    for _ in range(2):
+        _make_runnable(Session, job_id)
+        assert queue.run_next()
+    job = _job(Session, job_id)
+    assert job.status == jobs.SUCCEEDED and job.attempts == 3
+    assert job.result == '{"calls": 3}'
+
+def test_job_fails_after_max_attempts():
+    Session = _session_factory()
+    queue = jobs.JobQueue(Session, workers=0)
+    calls.clear()
+    job_id = _enqueue(Session, jobs.new_job("test.flaky", {"fail_times": 10}, max_attempts=2))
+
+    queue.run_next()
+    _make_runnable(Session, job_id)
+    queue.run_next()
+    job = _job(Session, job_id)
+    assert job.status == jobs.FAILED and job.attempts == 2
+    assert "transient" in job.last_error
+
+def test_expired_lease_is_recovered():
+    # A job left running by a worker that died is claimed again once its lease expires
+    Session = _session_factory()
+    queue = jobs.JobQueue(Session, workers=0)
+    calls.clear()
+    job = jobs.new_job("test.flaky", {"fail_times": 0})
+    job.status, job.attempts = jobs.RUNNING, 1
+    job.locked_until = datetime.utcnow() + timedelta(seconds=60)
+    job_id = _enqueue(Session, job)
+
+    assert not queue.run_next(), "claimed a job with a live lease"
+    db = Session()
+    db.get(models.Job, job_id).locked_until = datetime.utcnow() - timedelta(seconds=1)
+    db.commit()
+    db.close()
+    assert queue.run_next()
+    job = _job(Session, job_id)
+    assert job.status == jobs.SUCCEEDED and job.attempts == 2
+
+def test_old_succeeded_jobs_are_purged():
+    Session = _session_factory()
+    queue = jobs.JobQueue(Session, workers=0, retention_seconds=3600)
+    now = datetime.utcnow()
+    old, recent, failed = jobs.new_job("test.flaky", {}), jobs.new_job("test.flaky", {}), jobs.new_job("test.flaky", {})
+    old.status, old.finished_at = jobs.SUCCEEDED, now - timedelta(hours=2)
+    recent.status, recent.finished_at = jobs.SUCCEEDED, now - timedelta(minutes=5)
+    failed.status, failed.finished_at = jobs.FAILED, now - timedelta(hours=2)
+    ids = [_enqueue(Session, job) for job in (old, recent, failed)]
+
+    assert queue.purge(now) == 1
+    assert _job(Session, ids[0]) is None
+    assert _job(Session, ids[1]) is not None and _job(Session, ids[2]) is not None
+    assert queue.stats()["purged"] == 1
+
+if __name__ == "__main__":
+    test_complete_course_enqueues_render()
+    test_failed_job_is_retried_with_backoff()
+    test_job_fails_after_max_attempts()
+    test_expired_lease_is_recovered()
+    test_old_succeeded_jobs_are_purged()
+    print("Job queue checks passed.")
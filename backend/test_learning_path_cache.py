@@ -0,0 +1,109 @@
+import asyncio
+import json
+import threading
+import time
+
+import conftest  # CPU pool runs inline; must come before the services imports
+from services import learning_path_cache as cache_module
+from services.learning_path_cache import LearningPathCache, _LRU, normalize, parse_warmup
+from services.path_generator import generate_schedule
+
+# Learning path memoization: hits, byte-bounded PDF eviction, shared concurrent misses, warm-up.
+# Usage: python test_learning_path_cache.py
+
+def test_normalize_and_warmup_spec():
+    assert normalize("  Machine   Learning ", 30, 2) == ("Machine Learning", 30, 2)
+    assert parse_warmup("python:30:2, c++:nope:1,,Data: Science:10:1") == [("python", 30, 2), ("Data: Science", 10, 1)]
+    assert parse_warmup("") == []
+
+def test_lru_bounds():
+    by_count = _LRU(max_entries=2)
+    for key in "abc":
+        by_count.put(key, key, 1)
+    assert by_count.get("a") is None and by_count.get("c") == "c"
+
+    by_bytes = _LRU(max_bytes=100)
+    by_bytes.put("a", "a", 40)
+    by_bytes.put("b", "b", 40)
+    by_bytes.get("a")  # b is now least recently used
+    by_bytes.put("c", "c", 40)
+    by_bytes.put("huge", "huge", 101)  # larger than the whole cache: not kept
+    assert by_bytes.get("b") is None and by_bytes.get("huge") is None
+    assert by_bytes.get("a") == "a" and by_bytes.get("c") == "c"
+    assert by_bytes.stats()["bytes"] == 80 and by_bytes.stats()["evictions"] == 1
+
+def test_repeated_requests_hit():
+    cache = LearningPathCache()
+
+    async def run():
+        first = await cache.schedule("python", 30, 2)
+        again = await cache.schedule(" python ", 30, 2)
+        pdf, etag = await cache.pdf("python", 30, 2)
+        return first, again, pdf, etag, await cache.pdf("python", 30, 2)
+
+    first, again, pdf, etag, cached = asyncio.run(run())
+    assert first is again
+    assert json.loads(first) == generate_schedule("python", 30, 2)
+    assert pdf.startswith(b"%PDF-") and cached == (pdf, etag)
+    stats = cache.stats()
+    assert (stats["schedules"]["hits"], stats["schedules"]["misses"]) == (1, 1)
+    assert (stats["pdfs"]["hits"], stats["pdfs"]["misses"]) == (1, 1)
+    assert stats["pdfs"]["bytes"] == len(pdf)
+
+def test_schedules_bounded_by_bytes():
+    cache = LearningPathCache(max_schedule_bytes=20_000)
+
+    async def run():
+        for days in (30, 40, 50, 60):
+            await cache.schedule("go", days, 1)
+
+    asyncio.run(run())
+    stats = cache.stats()["schedules"]
+    assert stats["bytes"] <= 20_000 and stats["evictions"] > 0
+
+def test_concurrent_misses_share_one_build():
+    calls = []
+    lock = threading.Lock()
+    original = cache_module.learning_path_pdf
+
+    def slow_pdf(*key):
+        with lock:
+            calls.append(key)
+        time.sleep(0.2)
+        return original(*key)
+
+    cache_module.learning_path_pdf = slow_pdf
+    try:
+        cache = LearningPathCache()
+
+        async def run():
+            return await asyncio.gather(*(cache.pdf("react", 10, 1) for _ in range(8)))
+
+        results = asyncio.run(run())
+    finally:
+        cache_module.learning_path_pdf = original
+
+    assert calls == [("react", 10, 1)], calls
+    assert all(result == results[0] for result in results)
+    assert cache.stats()["shared_misses"] == 7
+
+def test_warm_up():
+    cache = LearningPathCache()
+    asyncio.run(cache.warm_up(parse_warmup("python:7:1,java:14:2")))
+    stats = cache.stats()
+    assert stats["schedules"]["entries"] == 2 and stats["pdfs"]["entries"] == 2
+
+    async def hit():
+        await cache.pdf("java", 14, 2)
+
+    asyncio.run(hit())
+    assert cache.stats()["pdfs"]["hits"] == 1
+
+if __name__ == "__main__":
+    test_normalize_and_warmup_spec()
+    test_lru_bounds()
+    test_repeated_requests_hit()
+    test_schedules_bounded_by_bytes()
+    test_concurrent_misses_share_one_build()
+    test_warm_up()
+    print("Learning path cache checks passed.")
@@ -0,0 +1,128 @@
+from conftest import scratch_database, seed
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from pydantic import ValidationError
+from sqlalchemy import event
+
+import attendance_routes
+from database import get_db
+from dtos import schemas
+from repositories.implementations.learning_path_repository import LearningPathRepository
+from repositories.unit_of_work import UnitOfWork
+from services.implementations.learning_path_service import LearningPathService
+from services.path_generator import course_topic_keys, iter_schedule
+from utils.learning_path_limits import LEARNING_PATH_MAX_TOPIC_LENGTH
+import models
+
+# Stored learning paths: day rows from the schedule generator, attendance moving the pointer a
+# day, completion finishing the path, topic matching, and one query for "where am I".
+# Usage: python test_learning_path_progress.py
+
+def _session():
+    engine, Session = scratch_database("paths")
+    seed(
+        Session,
+        models.Course(id=1, title="Python for Data Science", description="d"),
+        models.Course(id=2, title="Cooking", description="d"),
+    )
+    return engine, Session()
+
+def _service(db):
+    return LearningPathService(LearningPathRepository(db), UnitOfWork(db))
+
+def _create(service, **fields):
+    return service.create_path(schemas.LearningPathCreate(**{"user_id": 1, "days": 10, "hours_per_day": 2, **fields}))
+
+def test_topic_keys():
+    assert course_topic_keys("Python for Data Science")[0] == "python for data science"
+    assert "python" in course_topic_keys("Python for Data Science")
+    assert course_topic_keys("Cooking") == ["cooking"]
+
+def test_create_stores_schedule():
+    _, db = _session()
+    path = _create(_service(db), course_name="  python ")
+    detail = _service(db).get_path(path.id)
+    assert (detail.topic, detail.total_days, detail.completed_days, detail.current_day) == ("python", 10, 0, 1)
+    assert [(d.day, d.phase, d.topic, d.hours, d.activity) for d in detail.days] == [
+        (d["day"], d["phase"], d["topic"], d["hours"], d["activity"]) for d in iter_schedule("python", 10, 2)
+    ]
+
+def test_topic_length_fits_columns():
+    longest = "x" * LEARNING_PATH_MAX_TOPIC_LENGTH
+    assert max(len(day["topic"]) for day in iter_schedule(longest, 100, 1)) <= 255
+    try:
+        schemas.LearningPathCreate(user_id=1, course_name=longest + "x", days=10, hours_per_day=1)
+        raise AssertionError("an over-long course_name was accepted")
+    except ValidationError:
+        pass
+
+def test_attendance_route_commits_progress():
+    _, db = _session()
+    path_id = _create(_service(db), course_name="python").id
+    app = FastAPI()
+    app.include_router(attendance_routes.router, prefix="/attendance")
+    app.dependency_overrides[get_db] = lambda: db
+    client = TestClient(app)
+
+    mark = lambda lesson_id, status: client.post(
+        "/attendance/", params={"user_id": 1}, json={"course_id": 1, "lesson_id": lesson_id, "status": status}
+    )
+    assert mark(1, " Absent ").status_code == 200
+    assert _service(db).get_path(path_id).completed_days == 0
+    assert mark(2, "Present").status_code == 200
+    db.rollback()  # nothing left uncommitted: the progress is in the same commit as the attendance
+    assert _service(db).get_path(path_id).completed_days == 1
+
+def test_attendance_and_completion_advance():
+    _, db = _session()
+    service = _service(db)
+    by_topic = _create(service, course_name="Python").id
+    by_course = _create(service, course_name="anything", course_id=2).id
+    unrelated = _create(service, course_name="java").id
+
+    with UnitOfWork(db):
+        assert service.record_progress(1, 1) == 1  # the python path only
+        assert service.record_progress(1, 1) == 1
+        assert service.record_progress(1, 2) == 1  # the path bound to course 2
+        assert service.record_progress(1, 99) == 0  # unknown course: nothing to do
+
+    path = service.get_path(by_topic)
+    assert (path.completed_days, path.current_day, path.status) == (2, 3, "active")
+    assert [d.completed_by for d in path.days[:3]] == ["attendance", "attendance", None]
+    assert service.get_path(by_course).current_day == 2
+    assert service.get_path(unrelated).completed_days == 0
+
+    with UnitOfWork(db):
+        service.record_progress(1, 1, completed=True)
+    path = service.get_path(by_topic)
+    assert (path.completed_days, path.current_day, path.status) == (10, None, "completed")
+    assert path.completed_at is not None
+    assert [d.completed_by for d in path.days[1:3]] == ["attendance", "completion"]
+
+    # Completed paths no longer move
+    with UnitOfWork(db):
+        assert service.record_progress(1, 1) == 0
+
+def test_positions_in_one_query():
+    engine, db = _session()
+    service = _service(db)
+    for topic in ("python", "java", "react"):
+        _create(service, course_name=topic)
+    with UnitOfWork(db):
+        service.record_progress(1, 1)
+    db.expire_all()
+
+    statements = []
+    event.listen(engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    positions = service.get_positions(1)
+    assert len(statements) == 1, statements
+    assert [(p.topic, p.current_day, p.current.day) for p in positions] == [("python", 2, 2), ("java", 1, 1), ("react", 1, 1)]
+
+if __name__ == "__main__":
+    test_topic_keys()
+    test_create_stores_schedule()
+    test_topic_length_fits_columns()
+    test_attendance_route_commits_progress()
+    test_attendance_and_completion_advance()
+    test_positions_in_one_query()
+    print("Learning path progress checks passed.")
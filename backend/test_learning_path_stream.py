@@ -0,0 +1,59 @@
+import json
+
+import conftest  # CPU pool runs inline; must come before the services imports
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from routers import learning_path
+from services.path_generator import generate_schedule, iter_schedule, iter_schedule_ndjson, learning_path_pdf
+from utils.learning_path_limits import LEARNING_PATH_MAX_DAYS, LEARNING_PATH_MAX_TOPIC_LENGTH
+from utils.pdf_generator import _schedule_sections
+
+# Generator based schedules: NDJSON streaming, one PDF table per phase and month, the days cap.
+# Usage: python test_learning_path_stream.py
+
+def test_generator_matches_schedule():
+    schedule = generate_schedule("python", 100, 2)
+    assert list(iter_schedule("python", 100, 2)) == schedule["schedule"]
+    assert [item["day"] for item in schedule["schedule"]] == list(range(1, 101))
+
+def test_ndjson_chunks():
+    chunks = list(iter_schedule_ndjson("react", 200, 1, lines_per_chunk=64))
+    lines = b"".join(chunks).decode().splitlines()
+    assert json.loads(lines[0]) == {"course_name": "react", "total_days": 200, "hours_per_day": 1, "total_hours": 200}
+    assert [json.loads(line) for line in lines[1:]] == generate_schedule("react", 200, 1)["schedule"]
+    # Summary chunk, then full chunks of 64 days and the remainder
+    assert [chunk.count(b"\n") for chunk in chunks] == [1, 64, 64, 64, 8]
+
+def test_pdf_sections_per_phase_and_month():
+    sections = list(_schedule_sections(iter_schedule("java", 100, 1), 30))
+    # 30 + 40 + 30 days: Fundamentals 30, Deep Dive 30 + 10, Advanced 30
+    assert [(phase, len(rows)) for phase, rows in sections] == [
+        ("Fundamentals", 30), ("Deep Dive", 30), ("Deep Dive", 10), ("Advanced & Projects", 30)
+    ]
+    pdf = learning_path_pdf("java", 100, 1)
+    assert pdf.startswith(b"%PDF-") and pdf == learning_path_pdf("java", 100, 1)
+
+def test_stream_endpoint_and_days_cap():
+    app = FastAPI()
+    app.include_router(learning_path.router)
+    client = TestClient(app)
+
+    response = client.post("/learning-path/generate/stream", json={"course_name": "go", "days": 365, "hours_per_day": 3})
+    assert response.status_code == 200 and response.headers["content-type"] == "application/x-ndjson"
+    assert len(response.text.splitlines()) == 366
+
+    long_name = "x" * (LEARNING_PATH_MAX_TOPIC_LENGTH + 1)
+    for body in ({"days": LEARNING_PATH_MAX_DAYS + 1, "hours_per_day": 1}, {"days": 0, "hours_per_day": 1},
+                 {"days": 10, "hours_per_day": 25}, {"course_name": long_name, "days": 10, "hours_per_day": 1},
+                 {"course_name": "", "days": 10, "hours_per_day": 1}):
+        for path in ("/learning-path/generate", "/learning-path/generate/stream", "/learning-path/download"):
+            assert client.post(path, json={"course_name": "go", **body}).status_code == 422, (path, body)
+    assert client.get("/learning-path/download", params={"course_name": long_name, "days": 1, "hours_per_day": 1}).status_code == 422
+
+if __name__ == "__main__":
+    test_generator_matches_schedule()
+    test_ndjson_chunks()
+    test_pdf_sections_per_phase_and_month()
+    test_stream_endpoint_and_days_cap()
+    print("Learning path stream checks passed.")
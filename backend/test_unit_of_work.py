@@ -0,0 +1,75 @@
+from conftest import scratch_database, seed
+from fastapi import HTTPException
+from sqlalchemy import event, func
+
+from repositories.implementations.course_repository import CourseRepository
+from repositories.unit_of_work import UnitOfWork
+from services.implementations.course_service import CourseService
+import models
+
+# complete_course must commit once, and a failure at any step must leave nothing behind.
+# Usage: python test_unit_of_work.py
+
+class FailingCertificateRepository(CourseRepository):
+    def create_certificate(self, certificate):
+        super().create_certificate(certificate)
+        raise RuntimeError("simulated crash after staging the certificate")
+
+def _session_factory():
+    engine, Session = scratch_database("uow")
+    seed(Session, models.Course(id=1, title="Course", description="d"), models.Enrollment(user_id=1, course_id=1))
+    return engine, Session
+
+def _raises(exc_type, fn, *args):
+    try:
+        fn(*args)
+    except exc_type:
+        return
+    raise AssertionError(f"{exc_type.__name__} not raised")
+
+def _service(db, repo_class=CourseRepository):
+    return CourseService(repo_class(db), UnitOfWork(db))
+
+def test_complete_course_commits_once():
+    engine, Session = _session_factory()
+    commits = []
+    event.listen(engine, "commit", lambda conn: commits.append(1))
+
+    db = Session()
+    cert = _service(db).complete_course(1, 1)
+    db.close()
+
+    assert cert.certificate_code.startswith("LMS-")
+    assert len(commits) == 1, f"{len(commits)} commits"
+
+def test_complete_course_is_atomic():
+    _, Session = _session_factory()
+
+    db = Session()
+    _raises(RuntimeError, _service(db, FailingCertificateRepository).complete_course, 1, 1)
+    db.close()
+
+    db = Session()
+    enrollment = db.query(models.Enrollment).filter_by(user_id=1, course_id=1).one()
+    attendance = db.query(func.count(models.Attendance.id)).scalar()
+    certificates = db.query(func.count(models.Certificate.id)).scalar()
+    jobs = db.query(func.count(models.Job.id)).scalar()
+    db.close()
+    assert not enrollment.is_completed
+    assert attendance == 0
+    assert certificates == 0
+    assert jobs == 0
+
+def test_rejected_request_rolls_back():
+    _, Session = _session_factory()
+
+    db = Session()
+    _raises(HTTPException, _service(db).complete_course, 1, 2)
+    assert not db.in_transaction()
+    db.close()
+
+if __name__ == "__main__":
+    test_complete_course_commits_once()
+    test_complete_course_is_atomic()
+    test_rejected_request_rolls_back()
+    print("Unit of work checks passed.")
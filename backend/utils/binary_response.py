@@ -0,0 +1,121 @@
+import hashlib
+import os
+import re
+from typing import Optional
+from urllib.parse import quote
+
+from fastapi import Request, Response
+from fastapi.responses import FileResponse
+
+# Binary downloads (certificate and learning path PDFs): exact Content-Length, the body sent
+# in fixed size chunks, ETag / If-None-Match revalidation and single byte ranges (206) so
+# interrupted downloads can resume. Files on disk go through FileResponse, which does the
+# range handling itself and can use zero-copy sends; bytes built in memory use BytesResponse.
+BINARY_CHUNK_SIZE = 64 * 1024
+
+_RANGE = re.compile(r"^bytes=(\d*)-(\d*)$")
+
+class RangeNotSatisfiable(Exception):
+    pass
+
+def content_etag(body: bytes) -> str:
+    return f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"'
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    if not if_none_match:
+        return False
+    for candidate in if_none_match.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/") == etag:
+            return True
+    return False
+
+def parse_range(header: str, size: int) -> Optional[tuple]:
+    # (start, end) inclusive for a single "bytes=a-b", "bytes=a-" or "bytes=-n" range.
+    # None means serve the whole body: malformed or multi-range headers may be ignored.
+    match = _RANGE.match(header.replace(" ", ""))
+    if not match or match.group(1) == match.group(2) == "":
+        return None
+    first, last = match.groups()
+    if first == "":
+        # Suffix range: the last n bytes
+        length = int(last)
+        if length == 0:
+            raise RangeNotSatisfiable()
+        return max(0, size - length), size - 1
+    start = int(first)
+    end = min(int(last), size - 1) if last else size - 1
+    if last and int(last) < start:
+        return None
+    if start >= size:
+        raise RangeNotSatisfiable()
+    return start, end
+
+def content_disposition(filename: str, disposition: str = "attachment") -> str:
+    quoted = quote(filename)
+    if quoted != filename:
+        return f"{disposition}; filename*=utf-8''{quoted}"
+    return f'{disposition}; filename="{filename}"'
+
+class BytesResponse(Response):
+    # Response for an in-memory body, written in BINARY_CHUNK_SIZE pieces instead of one message
+    def __init__(self, content: bytes, status_code: int = 200, headers: dict = None,
+                 media_type: str = None, chunk_size: int = BINARY_CHUNK_SIZE):
+        super().__init__(content, status_code=status_code, headers=headers, media_type=media_type)
+        self.chunk_size = chunk_size
+
+    async def __call__(self, scope, receive, send):
+        await send({"type": "http.response.start", "status": self.status_code, "headers": self.raw_headers})
+        body = memoryview(self.body)
+        if scope.get("method") == "HEAD" or not body:
+            await send({"type": "http.response.body", "body": b"", "more_body": False})
+        else:
+            for offset in range(0, len(body), self.chunk_size):
+                chunk = body[offset:offset + self.chunk_size]
+                await send({"type": "http.response.body", "body": bytes(chunk),
+                            "more_body": offset + self.chunk_size < len(body)})
+        if self.background is not None:
+            await self.background()
+
+def _not_modified(request: Request, etag: str, headers: dict) -> Optional[Response]:
+    # Conditional requests only apply to safe methods; a POST always gets the body
+    if request.method in ("GET", "HEAD") and etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return None
+
+def binary_response(request: Request, content: bytes, media_type: str, filename: str = None,
+                    etag: str = None, cache_control: str = "no-cache") -> Response:
+    etag = etag or content_etag(content)
+    headers = {"ETag": etag, "Cache-Control": cache_control, "Accept-Ranges": "bytes"}
+    not_modified = _not_modified(request, etag, headers)
+    if not_modified is not None:
+        return not_modified
+    if filename:
+        headers["Content-Disposition"] = content_disposition(filename)
+
+    http_range = request.headers.get("range")
+    if_range = request.headers.get("if-range")
+    # If-Range: resume only while the client's copy is still current, else send it all again
+    if http_range and request.method in ("GET", "HEAD") and (if_range is None or if_range == etag):
+        size = len(content)
+        try:
+            span = parse_range(http_range, size)
+        except RangeNotSatisfiable:
+            return Response(status_code=416, headers={**headers, "Content-Range": f"bytes */{size}"})
+        if span is not None:
+            start, end = span
+            headers["Content-Range"] = f"bytes {start}-{end}/{size}"
+            return BytesResponse(content[start:end + 1], status_code=206, headers=headers, media_type=media_type)
+    return BytesResponse(content, headers=headers, media_type=media_type)
+
+def file_response(request: Request, path: str, etag: str, media_type: str, filename: str = None,
+                  cache_control: str = "no-cache", stat_result: os.stat_result = None) -> Response:
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    not_modified = _not_modified(request, etag, headers)
+    if not_modified is not None:
+        return not_modified
+    # FileResponse takes Content-Length from the stat, answers Range / If-Range against the ETag
+    # above and streams in BINARY_CHUNK_SIZE reads (or a zero-copy send when the server has one)
+    response = FileResponse(path, media_type=media_type, filename=filename, headers=headers, stat_result=stat_result)
+    response.chunk_size = BINARY_CHUNK_SIZE
+    return response
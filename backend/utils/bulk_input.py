@@ -0,0 +1,75 @@
+import csv
+import json
+
+from fastapi import HTTPException, Request
+
+NDJSON_TYPES = ("application/x-ndjson", "application/ndjson", "application/jsonl", "application/x-jsonlines")
+CSV_TYPES = ("text/csv", "application/csv")
+
+def _content_type(request: Request) -> str:
+    return request.headers.get("content-type", "").split(";")[0].strip().lower()
+
+async def read_records(request: Request, csv_column: bool = False):
+    # Returns (records, errors): records is a list of (index, value); a line that is not
+    # valid JSON becomes an error for that index instead of failing the whole request.
+    # With csv_column=True a CSV body is accepted too, one value per row from the first column.
+    content_type = _content_type(request)
+    if content_type in NDJSON_TYPES:
+        return await _read_ndjson(request)
+    if csv_column and content_type in CSV_TYPES:
+        return await _read_csv_column(request)
+
+    try:
+        payload = json.loads(await request.body() or b"null")
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=f"Invalid JSON body: {e}")
+    if not isinstance(payload, list):
+        raise HTTPException(status_code=400, detail="Expected a JSON array or an NDJSON stream")
+    return list(enumerate(payload)), []
+
+async def _iter_lines(request: Request):
+    # Yields lines as chunks arrive instead of buffering the raw body
+    pending = b""
+    async for chunk in request.stream():
+        pending += chunk
+        *lines, pending = pending.split(b"\n")
+        for line in lines:
+            yield line
+    yield pending
+
+async def _read_ndjson(request: Request):
+    records, errors = [], []
+    index = 0
+    async for line in _iter_lines(request):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            records.append((index, json.loads(line)))
+        except ValueError as e:
+            errors.append({"index": index, "error": f"Invalid JSON: {e}"})
+        index += 1
+    return records, errors
+
+async def _read_csv_column(request: Request):
+    records, errors = [], []
+    index = 0
+    first = True
+    async for line in _iter_lines(request):
+        try:
+            text = line.decode("utf-8-sig" if first else "utf-8").strip()
+        except UnicodeDecodeError:
+            errors.append({"index": index, "error": "Row is not valid UTF-8"})
+            index += 1
+            continue
+        if not text:
+            continue
+        value = next(csv.reader([text]), [""])[0].strip()
+        # Skip a header row such as "email" or "user_id"
+        if first and not value.isdigit() and "@" not in value:
+            first = False
+            continue
+        first = False
+        records.append((index, value))
+        index += 1
+    return records, errors
@@ -0,0 +1,82 @@
+import json
+import os
+import typing
+from operator import attrgetter
+
+from fastapi import Response
+from pydantic import BaseModel
+
+try:
+    import orjson
+except ImportError:  # optional dependency, fall back to the stdlib encoder
+    orjson = None
+
+# Opt-in fast response mode for list endpoints (FAST_RESPONSES=1): ORM rows are turned
+# into dicts with a field plan precompiled from the response DTO and encoded with orjson,
+# instead of running response_model validation per row and the stdlib JSON encoder.
+FAST_RESPONSES = os.getenv("FAST_RESPONSES", "0") == "1"
+
+def _default(value):
+    if hasattr(value, "isoformat"):
+        return value.isoformat()
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def dumps(content) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(content)
+    return json.dumps(content, default=_default, separators=(",", ":")).encode("utf-8")
+
+class ORJSONResponse(Response):
+    media_type = "application/json"
+
+    def render(self, content) -> bytes:
+        if isinstance(content, bytes):
+            return content
+        return dumps(content)
+
+def _nested_model(annotation):
+    # Returns (model, is_list) for fields holding DTOs, e.g. Optional[CertificateCourse] or List[LessonResponse]
+    origin = typing.get_origin(annotation)
+    if origin is typing.Union:
+        args = [arg for arg in typing.get_args(annotation) if arg is not type(None)]
+        return _nested_model(args[0]) if len(args) == 1 else None
+    if origin in (list, typing.List):
+        inner = _nested_model(typing.get_args(annotation)[0])
+        return (inner[0], True) if inner else None
+    if isinstance(annotation, type) and issubclass(annotation, BaseModel):
+        return annotation, False
+    return None
+
+class RowEncoder:
+    # Field plan for one DTO: flat fields are read with a single attrgetter,
+    # nested DTO fields get their own encoder. Rows are trusted ORM objects,
+    # so nothing is re-validated.
+    def __init__(self, model: typing.Type[BaseModel]):
+        self.flat = []
+        self.nested = []
+        for name, field in model.model_fields.items():
+            nested = _nested_model(field.annotation)
+            if nested:
+                self.nested.append((name, RowEncoder(nested[0]), nested[1]))
+            else:
+                self.flat.append(name)
+        getter = attrgetter(*self.flat)
+        self._get = getter if len(self.flat) > 1 else (lambda obj: (getter(obj),))
+
+    def encode(self, obj) -> dict:
+        if obj is None:
+            return None
+        row = dict(zip(self.flat, self._get(obj)))
+        for name, encoder, is_list in self.nested:
+            value = getattr(obj, name)
+            row[name] = encoder.encode_many(value) if is_list else encoder.encode(value)
+        return row
+
+    def encode_many(self, rows) -> list:
+        if not self.nested:
+            flat, get = self.flat, self._get
+            return [dict(zip(flat, get(obj))) for obj in rows]
+        return [self.encode(obj) for obj in rows]
+
+def fast_list_response(encoder: RowEncoder, rows) -> ORJSONResponse:
+    return ORJSONResponse(content=dumps(encoder.encode_many(rows)))
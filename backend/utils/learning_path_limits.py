@@ -0,0 +1,9 @@
+import os
+
+# Request limits shared by the learning path routers, DTOs and the schedule generator.
+# Upper bound on days per learning path (ten years); requests above it are rejected
+LEARNING_PATH_MAX_DAYS = int(os.getenv("LEARNING_PATH_MAX_DAYS", "3650"))
+# Upper bound on the topic name, which is repeated in every day of an unknown topic's plan.
+# Generated day topics add at most 16 characters (" Fundamentals 12"), so stored paths and
+# days stay within their String(255) topic columns.
+LEARNING_PATH_MAX_TOPIC_LENGTH = 200
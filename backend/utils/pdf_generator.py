@@ -1,12 +1,46 @@
 from reportlab.lib import colors
-from reportlab.lib.pagesizes import letter
+from reportlab.lib.pagesizes import landscape, letter
+from reportlab.lib.units import inch
+from reportlab.pdfbase.pdfmetrics import stringWidth
+from reportlab.pdfgen import canvas
 from reportlab.platypus import SimpleDocTemplate, Table, TableStyle, Paragraph, Spacer
 from reportlab.lib.styles import getSampleStyleSheet, ParagraphStyle
 from io import BytesIO
+import os
+import zlib
+
+# Days per schedule table: a table per phase and month keeps each layout pass small, where
+# one table for a multi-year plan made reportlab re-split the remaining rows on every page
+LEARNING_PATH_DAYS_PER_TABLE = int(os.getenv("LEARNING_PATH_DAYS_PER_TABLE", "30"))
 
-def create_learning_path_pdf(data):
+SCHEDULE_TABLE_STYLE = TableStyle([
+    ('BACKGROUND', (0, 0), (-1, 0), colors.indigo),
+    ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
+    ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
+    ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
+    ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
+    ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
+    ('GRID', (0, 0), (-1, -1), 1, colors.black),
+])
+
+def _schedule_sections(schedule, days_per_table):
+    # (phase, rows) per phase and per days_per_table days, read from any iterable of days
+    phase, rows = None, []
+    for item in schedule:
+        if rows and (item['phase'] != phase or len(rows) == days_per_table):
+            yield phase, rows
+            rows = []
+        phase = item['phase']
+        rows.append(item)
+    if rows:
+        yield phase, rows
+
+def create_learning_path_pdf(data, days_per_table: int = LEARNING_PATH_DAYS_PER_TABLE):
+    # data['schedule'] may be a generator (see path_generator.iter_schedule)
     buffer = BytesIO()
-    doc = SimpleDocTemplate(buffer, pagesize=letter)
+    # invariant: no timestamp or random document ID, so the same schedule gives the same
+    # bytes (and ETag) every time it is generated
+    doc = SimpleDocTemplate(buffer, pagesize=letter, invariant=True)
     elements = []
     
     styles = getSampleStyleSheet()
@@ -27,40 +61,144 @@ def create_learning_path_pdf(data):
     elements.append(Paragraph(summary_text, normal_style))
     elements.append(Spacer(1, 24))
     
-    # Schedule Table
-    table_data = [['Day', 'Phase', 'Topic', 'Activity']]
-    
-    for item in data['schedule']:
-        table_data.append([
-            f"Day {item['day']}",
-            item['phase'],
-            item['topic'],
-            item['activity']
-        ])
-        
-    # Table Styling
-    table = Table(table_data, colWidths=[50, 100, 150, 180])
-    table.setStyle(TableStyle([
-        ('BACKGROUND', (0, 0), (-1, 0), colors.indigo),
-        ('TEXTCOLOR', (0, 0), (-1, 0), colors.whitesmoke),
-        ('ALIGN', (0, 0), (-1, -1), 'LEFT'),
-        ('FONTNAME', (0, 0), (-1, 0), 'Helvetica-Bold'),
-        ('BOTTOMPADDING', (0, 0), (-1, 0), 12),
-        ('BACKGROUND', (0, 1), (-1, -1), colors.beige),
-        ('GRID', (0, 0), (-1, -1), 1, colors.black),
-    ]))
-    
-    elements.append(table)
+    # Schedule: one titled table per phase and month, header row repeated when a table breaks
+    for phase, rows in _schedule_sections(data['schedule'], days_per_table):
+        elements.append(Paragraph(f"{phase}: Days {rows[0]['day']}-{rows[-1]['day']}", heading_style))
+        table_data = [['Day', 'Phase', 'Topic', 'Activity']]
+        for item in rows:
+            table_data.append([
+                f"Day {item['day']}",
+                item['phase'],
+                item['topic'],
+                item['activity']
+            ])
+        table = Table(table_data, colWidths=[50, 100, 150, 180], repeatRows=1)
+        table.setStyle(SCHEDULE_TABLE_STYLE)
+        elements.append(table)
+        elements.append(Spacer(1, 12))
     
     doc.build(elements)
     buffer.seek(0)
     return buffer
 
-from reportlab.lib.pagesizes import landscape
-from reportlab.lib.units import inch
-from reportlab.pdfgen import canvas
+# Certificates are stamped onto a precompiled template: the borders and fixed wording are
+# built once per process as a compressed form XObject, and each certificate only adds a
+# small content stream with the name, course, date and code. The PDF objects around them
+# are static bytes too, so a certificate is a few string joins instead of a canvas run.
+# Text uses the standard Helvetica fonts (WinAnsi), which viewers supply, so no font data
+# is embedded; anything outside that encoding falls back to the reportlab canvas.
+CERTIFICATE_PDF_COMPRESS = os.getenv("CERTIFICATE_PDF_COMPRESS", "1") == "1"
+
+def _pdf_number(value):
+    return f"{value:.4f}".rstrip("0").rstrip(".")
+
+def _pdf_string(text):
+    # Literal string in the fonts' WinAnsi encoding; raises UnicodeEncodeError otherwise
+    raw = text.encode("cp1252")
+    return b"(" + raw.replace(b"\\", b"\\\\").replace(b"(", b"\\(").replace(b")", b"\\)").replace(b"\r", b"\\r") + b")"
+
+class CertificateTemplate:
+    FONTS = {"Helvetica": b"/F1", "Helvetica-Bold": b"/F2"}
+
+    def __init__(self, compress=CERTIFICATE_PDF_COMPRESS):
+        self.compress = compress
+        self.width, self.height = landscape(letter)
+        static = self._stream(self._static_ops())
+        fonts = b"<< /F1 1 0 R /F2 2 0 R >>"
+        # Objects 1-6 never change; 7 is the per-certificate content stream, 8 the info dict
+        self._objects = [
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica-Bold /Encoding /WinAnsiEncoding >>",
+            b"<< /Type /XObject /Subtype /Form /BBox [0 0 %s %s] /Resources << /Font %s >> %s"
+            % (_pdf_number(self.width).encode(), _pdf_number(self.height).encode(), fonts, static),
+            b"<< /Type /Page /Parent 5 0 R /MediaBox [0 0 %s %s] /Resources << /Font %s /XObject << /Static 3 0 R >> >> /Contents 7 0 R >>"
+            % (_pdf_number(self.width).encode(), _pdf_number(self.height).encode(), fonts),
+            b"<< /Type /Pages /Kids [4 0 R] /Count 1 >>",
+            b"<< /Type /Catalog /Pages 5 0 R >>",
+        ]
+        self._prefix = bytearray(b"%PDF-1.4\n%\xe2\xe3\xcf\xd3\n")
+        self._offsets = []
+        for number, body in enumerate(self._objects, start=1):
+            self._offsets.append(len(self._prefix))
+            self._prefix += b"%d 0 obj\n%s\nendobj\n" % (number, body)
+        self._prefix = bytes(self._prefix)
+
+    def _stream(self, ops):
+        data = b"\n".join(ops)
+        if self.compress:
+            data = zlib.compress(data)
+            return b"/Filter /FlateDecode /Length %d >>\nstream\n%s\nendstream" % (len(data), data)
+        return b"/Length %d >>\nstream\n%s\nendstream" % (len(data), data)
+
+    def _color(self, color, op):
+        return (" ".join(_pdf_number(c) for c in color.rgb()) + " " + op).encode()
+
+    def _text(self, font, size, x, y, text, centred=False):
+        if centred:
+            x -= stringWidth(text, font, size) / 2
+        return b"BT %s %s Tf 1 0 0 1 %s %s Tm %s Tj ET" % (
+            self.FONTS[font], _pdf_number(size).encode(), _pdf_number(x).encode(), _pdf_number(y).encode(), _pdf_string(text)
+        )
+
+    def _static_ops(self):
+        # Same artwork and positions as the canvas version below
+        w, h = self.width, self.height
+        rect = lambda x, y, rw, rh: ("%s %s %s %s re S" % tuple(_pdf_number(v) for v in (x, y, rw, rh))).encode()
+        return [
+            self._color(colors.indigo, "RG"), b"5 w", rect(0.5*inch, 0.5*inch, w-1*inch, h-1*inch),
+            self._color(colors.gold, "RG"), b"2 w", rect(0.6*inch, 0.6*inch, w-1.2*inch, h-1.2*inch),
+            self._color(colors.black, "rg"),
+            self._text("Helvetica-Bold", 36, w/2, h - 2*inch, "Certificate of Completion", centred=True),
+            self._text("Helvetica", 14, w/2, h - 2.5*inch, "This is to certify that", centred=True),
+            self._text("Helvetica", 14, w/2, h - 4.2*inch, "has successfully completed the course", centred=True),
+            self._text("Helvetica", 12, w - 4*inch, 2*inch, "LMS Instuctor"),
+            ("%s %s m %s %s l S" % tuple(_pdf_number(v) for v in (w - 4*inch, 2.2*inch, w - 2*inch, 2.2*inch))).encode(),
+            self._color(colors.gray, "rg"),
+            self._text("Helvetica", 10, w/2, 0.8*inch, "LMS Platform", centred=True),
+        ]
+
+    def render(self, student_name, course_name, date_str, cert_code) -> bytes:
+        w, h = self.width, self.height
+        content = self._stream([
+            b"q /Static Do Q",
+            self._color(colors.indigo, "rg"),
+            self._text("Helvetica-Bold", 30, w/2, h - 3.5*inch, student_name, centred=True),
+            self._color(colors.black, "rg"),
+            self._text("Helvetica-Bold", 24, w/2, h - 5*inch, course_name, centred=True),
+            self._text("Helvetica", 12, 2*inch, 2*inch, f"Date: {date_str}"),
+            self._color(colors.gray, "rg"),
+            self._text("Helvetica", 10, w/2, 1*inch, f"Verification Code: {cert_code}", centred=True),
+        ])
+        info = b"<< /Title %s /Producer (LMS Platform) >>" % _pdf_string(f"Certificate {cert_code}")
+        out = [self._prefix]
+        offsets = list(self._offsets)
+        position = len(self._prefix)
+        for number, body in ((7, b"<< " + content), (8, info)):
+            chunk = b"%d 0 obj\n%s\nendobj\n" % (number, body)
+            offsets.append(position)
+            out.append(chunk)
+            position += len(chunk)
+        xref = [b"xref\n0 9\n0000000000 65535 f \n"]
+        xref += [b"%010d 00000 n \n" % offset for offset in offsets]
+        xref.append(b"trailer\n<< /Size 9 /Root 6 0 R /Info 8 0 R >>\nstartxref\n%d\n%%%%EOF\n" % position)
+        return b"".join(out) + b"".join(xref)
+
+_template = None
+
+def get_certificate_template() -> CertificateTemplate:
+    # Built on first use in each process (request workers and CPU pool workers alike)
+    global _template
+    if _template is None:
+        _template = CertificateTemplate()
+    return _template
 
 def generate_certificate_pdf(student_name, course_name, date_str, cert_code):
+    try:
+        return BytesIO(get_certificate_template().render(student_name, course_name, date_str, cert_code))
+    except UnicodeEncodeError:
+        return generate_certificate_pdf_canvas(student_name, course_name, date_str, cert_code)
+
+def generate_certificate_pdf_canvas(student_name, course_name, date_str, cert_code):
     buffer = BytesIO()
     # Use canvas for more control over absolute positioning which is better for certificates
     c = canvas.Canvas(buffer, pagesize=landscape(letter))
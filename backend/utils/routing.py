@@ -0,0 +1,10 @@
+from fastapi import APIRouter
+
+def overlay_routes(sync_router: APIRouter, async_router: APIRouter) -> APIRouter:
+    # Keep the sync router's route order (it matters for paths like "/{course_id}"),
+    # swapping in the async handler wherever one is defined for the same path and method.
+    overrides = {(route.path, frozenset(route.methods)): route for route in async_router.routes}
+    combined = APIRouter()
+    for route in sync_router.routes:
+        combined.routes.append(overrides.get((route.path, frozenset(route.methods)), route))
+    return combined